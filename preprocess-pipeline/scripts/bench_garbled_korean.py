@@ -0,0 +1,167 @@
+# scripts/bench_garbled_korean.py
+"""
+깨진 한국어 판별(is_garbled_korean) 검증 + 마이크로 벤치마크
+
+변경 전 구현(키워드 순회 + 패턴별 search + 문자 종류별 개별 순회)과
+현재 구현(사전 컴파일 키워드/패턴 + 1회 순회 문자 집계)의
+- 판별 결과가 코퍼스 전 라인에서 동일한지 확인하고
+- 처리량(lines/sec)을 비교한다.
+
+사용법:
+    python scripts/bench_garbled_korean.py [corpus_file ...] [--iterations N] [--rounds N]
+
+corpus_file: OCR 라인을 한 줄에 하나씩 저장한 파일 (예: OCR 결과 rawText 덤프)
+             생략 시 샘플 JD 텍스트의 각 줄 + OCR 라인 길이 단위 조각 사용
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from ocr.garbled_korean import GARBLED_PATTERNS, JD_HEADER_KEYWORDS, KOREAN_PARTICLE_PATTERN, is_garbled_korean
+
+SAMPLE_TEXT_PATH = os.path.join(os.path.dirname(__file__), "..", "tmp", "verify_text_sample_utf8.txt")
+
+# 샘플 텍스트를 짧은/중간 길이 OCR 라인처럼 자르는 폭 (is_garbled_korean 길이 구간별 분기 포함)
+_FRAGMENT_WIDTHS = (4, 8, 12, 20, 30)
+
+# 문자 종류 경계 케이스: 대문자이면서 특수문자(isupper + not alnum, 예: Ⓐ),
+# 대문자이면서 alnum(전각/로마 숫자), 허용 구두점
+_EDGE_CASE_LINES = (
+    "가나다라마바사아ⒶⒷⒸⒹⒺⒻⒼ",
+    "가나다라Ⓐ",
+    "담당업무Ⓐ",
+    "가나다라마바사아자차카타ⓐⓑⓒⓓⓔ",
+    "근무지ⒶⒷ 서울 강남구",
+    "가나다라마Ａ",
+    "우대사항Ⅳ",
+    "가나다라마바사Ⅳ",
+    "가나다라마바사아자차카▶:-,.()/",
+    "가나다라마바사아자차카타파하ⓍⓎⓏ",
+)
+
+
+def legacy_is_garbled_korean(text: str) -> bool:
+    """변경 전 ocr.garbled_korean.is_garbled_korean"""
+    if not text:
+        return True
+
+    text = text.strip()
+    if len(text) < 2:
+        return True
+
+    compact = text.replace(" ", "").lower()
+
+    for kw in JD_HEADER_KEYWORDS:
+        if kw.replace(" ", "").lower() in compact:
+            return False
+
+    for pattern in GARBLED_PATTERNS:
+        if pattern.search(text):
+            return True
+
+    korean_chars = sum(1 for c in text if '가' <= c <= '힣')
+    total_chars = len(text)
+
+    if korean_chars == 0:
+        return False
+
+    korean_ratio = korean_chars / total_chars
+
+    if len(text) <= 12:
+        if korean_ratio > 0.9 and not KOREAN_PARTICLE_PATTERN.search(text):
+            return True
+
+        upper_count = sum(1 for c in text if c.isupper())
+        if korean_ratio >= 0.7 and upper_count == 1:
+            return True
+
+    elif 13 <= len(text) <= 30:
+        if korean_ratio > 0.8 and not KOREAN_PARTICLE_PATTERN.search(text):
+            return True
+
+        special_chars = sum(
+            1 for c in text
+            if not (c.isalnum() or c.isspace() or c in ":-,.()/▶")
+        )
+        if special_chars / total_chars > 0.3:
+            return True
+
+    else:
+        if korean_chars >= 50:
+            return False
+
+        has_particles = KOREAN_PARTICLE_PATTERN.search(text)
+
+        if korean_ratio > 0.9 and not has_particles:
+            return True
+
+    return False
+
+
+def build_corpus() -> list[str]:
+    with open(SAMPLE_TEXT_PATH, encoding="utf-8") as f:
+        lines = [line.strip() for line in f if line.strip()]
+
+    corpus = list(lines) + list(_EDGE_CASE_LINES)
+    for line in lines:
+        for width in _FRAGMENT_WIDTHS:
+            corpus.extend(line[start:start + width] for start in range(0, len(line), width))
+    return corpus
+
+
+def load_corpus(paths: list[str]) -> list[str]:
+    corpus = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            corpus.extend(line.rstrip("\r\n") for line in f if line.strip())
+    return corpus
+
+
+def bench(fn, corpus: list[str], iterations: int, rounds: int) -> float:
+    """rounds회 측정 중 최고 처리량 (lines/sec)"""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            for text in corpus:
+                fn(text)
+        best = min(best, time.perf_counter() - started)
+    return iterations * len(corpus) / best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("corpus_file", nargs="*")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus_file) if args.corpus_file else build_corpus()
+    if not corpus:
+        print("empty corpus")
+        return
+
+    print("==========================================")
+    print(" BENCH: garbled Korean detection")
+    print("==========================================")
+    korean_lines = sum(1 for text in corpus if re.search(r"[가-힣]", text))
+    print(f"lines={len(corpus)} korean_lines={korean_lines}\n")
+
+    # 결과 동등성 확인
+    mismatches = [text for text in corpus if is_garbled_korean(text) != legacy_is_garbled_korean(text)]
+    assert not mismatches, f"result mismatch: {mismatches[:5]}"
+    garbled = sum(1 for text in corpus if is_garbled_korean(text))
+    print(f"  identical results  garbled={garbled} kept={len(corpus) - garbled}\n")
+
+    baseline = bench(legacy_is_garbled_korean, corpus, args.iterations, args.rounds)
+    print(f"  {'legacy':<10} {baseline:>12,.0f} lines/sec")
+    rate = bench(is_garbled_korean, corpus, args.iterations, args.rounds)
+    print(f"  {'current':<10} {rate:>12,.0f} lines/sec  (x{rate / baseline:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# scripts/bench_kafka_decode.py
+"""
+Kafka 메시지 디코딩 마이크로 벤치마크
+
+기존 경로(bytes.decode → json.loads → dict → parse_kafka_jd_preprocess_message)와
+KafkaMessageDecoder 백엔드별(msgspec / orjson / json) 처리량(msgs/sec)을 비교한다.
+
+사용법:
+    python scripts/bench_kafka_decode.py [payload_file] [--iterations N] [--rounds N]
+
+payload_file: 녹화된 Kafka value를 한 줄에 하나씩 저장한 파일 (생략 시 샘플 JD로 생성)
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from inputs.kafka_message_decoder import KafkaMessageDecoder, _available_backends
+from inputs.parse_kafka_jd_preprocess import parse_kafka_jd_preprocess_message
+
+SAMPLE_TEXT_PATH = os.path.join(os.path.dirname(__file__), "..", "tmp", "verify_text_sample_utf8.txt")
+
+
+def legacy_decode(raw: bytes):
+    """변경 전 BaseKafkaWorker._parse_kafka_message + process() 파싱 경로"""
+    message = json.loads(raw.decode("utf-8"))
+    if isinstance(message, str):
+        message = json.loads(message)
+    return parse_kafka_jd_preprocess_message(message)
+
+
+def build_payloads():
+    with open(SAMPLE_TEXT_PATH, encoding="utf-8") as f:
+        text = f.read()
+
+    message = {
+        "eventId": "bench-event",
+        "requestId": "bench-request",
+        "brandName": "테스트회사",
+        "positionName": "백엔드 개발자",
+        "source": "TEXT",
+        "text": text,
+        "occurredAt": 1700000000000,
+        "version": "1.0",
+    }
+    plain = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    double = json.dumps(json.dumps(message, ensure_ascii=False), ensure_ascii=False).encode("utf-8")
+    return {"plain": [plain], "double-encoded": [double]}
+
+
+def load_payloads(path: str):
+    with open(path, "rb") as f:
+        return {os.path.basename(path): [line.rstrip(b"\r\n") for line in f if line.strip()]}
+
+
+def bench(fn, payloads, iterations: int, rounds: int) -> float:
+    """rounds회 측정 중 최고 처리량 (다른 프로세스 간섭 최소화)"""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            for raw in payloads:
+                fn(raw)
+        best = min(best, time.perf_counter() - started)
+    return iterations * len(payloads) / best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("payload_file", nargs="?")
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    payload_sets = load_payloads(args.payload_file) if args.payload_file else build_payloads()
+
+    print("==========================================")
+    print(" BENCH: Kafka message decode")
+    print("==========================================")
+
+    for name, payloads in payload_sets.items():
+        size = sum(len(p) for p in payloads) // len(payloads)
+        print(f"\n[{name}] payloads={len(payloads)} avg_bytes={size}")
+
+        # 결과 동등성 확인
+        expected = [legacy_decode(raw) for raw in payloads]
+        decoders = {backend: KafkaMessageDecoder(backend) for backend in _available_backends()}
+        for backend, decoder in decoders.items():
+            actual = [decoder.decode(raw).jd_input for raw in payloads]
+            assert actual == expected, f"{backend} result mismatch"
+
+        baseline = bench(legacy_decode, payloads, args.iterations, args.rounds)
+        print(f"  {'legacy':<10} {baseline:>12,.0f} msgs/sec")
+        for backend, decoder in decoders.items():
+            rate = bench(decoder.decode, payloads, args.iterations, args.rounds)
+            print(f"  {backend:<10} {rate:>12,.0f} msgs/sec  (x{rate / baseline:.2f})")
+
+
+if __name__ == "__main__":
+    main()
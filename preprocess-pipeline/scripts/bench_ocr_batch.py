@@ -0,0 +1,95 @@
+# scripts/bench_ocr_batch.py
+"""
+OCR recognition 배치 벤치마크
+
+고정 이미지 코퍼스에 대해 처리량(lines/sec)을 비교한다.
+- legacy : PaddleOCR.ocr() 이미지별 호출 (det → cls → rec 이미지 단위)
+- batch-N: run_ocr_batch()에 이미지 N장씩 전달 (det 이미지별, cls/rec는 N장의 text 영역을 모아 배치)
+
+이미지는 OCR 파이프라인과 동일하게 preprocess_image()를 거친 뒤 측정한다.
+rec_batch_num은 엔진 생성 시 고정되므로 값별 비교는 OCR_REC_BATCH_NUM을 바꿔 반복 실행한다.
+
+사용법:
+    OCR_REC_BATCH_NUM=16 python scripts/bench_ocr_batch.py <image_dir> [--images-per-batch 1 4 8] [--rounds N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from ocr.engine import _ENGINE, _REC_BATCH_NUM, _to_ocr_result, run_ocr_batch, warmup_engine
+from ocr.preprocess import preprocess_image
+
+_IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".bmp", ".webp")
+
+
+def load_corpus(image_dir: str):
+    names = sorted(name for name in os.listdir(image_dir) if name.lower().endswith(_IMAGE_SUFFIXES))
+    return [preprocess_image(os.path.join(image_dir, name)).image for name in names]
+
+
+def legacy_ocr(images):
+    """변경 전 run_ocr 경로 (이미지별 PaddleOCR.ocr)"""
+    results = []
+    for image in images:
+        with _ENGINE.acquire() as engine:
+            result = engine.ocr(image)
+        detections = result[0] if result and result[0] else []
+        results.append(_to_ocr_result([box for box, _ in detections], [rec for _, rec in detections]))
+    return results
+
+
+def batched_ocr(images_per_batch: int):
+    def run(images):
+        results = []
+        for start in range(0, len(images), images_per_batch):
+            results.extend(run_ocr_batch(images[start:start + images_per_batch]))
+        return results
+    return run
+
+
+def bench(fn, images, rounds: int) -> tuple[float, int]:
+    """rounds회 측정 중 최고 처리량 (lines/sec, 라인 수)"""
+    best = float("inf")
+    line_count = 0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        results = fn(images)
+        best = min(best, time.perf_counter() - started)
+        line_count = sum(len(result["texts"]) for result in results)
+    return line_count / best, line_count
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("image_dir")
+    parser.add_argument("--images-per-batch", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    images = load_corpus(args.image_dir)
+    if not images:
+        print(f"no images in {args.image_dir}")
+        return
+
+    warmup_engine()
+
+    print("==========================================")
+    print(" BENCH: OCR recognition batching")
+    print("==========================================")
+    print(f"images={len(images)} rec_batch_num={_REC_BATCH_NUM}\n")
+
+    baseline, baseline_lines = bench(legacy_ocr, images, args.rounds)
+    print(f"  {'legacy':<10} {baseline:>10,.1f} lines/sec  lines={baseline_lines}")
+    for images_per_batch in args.images_per_batch:
+        rate, line_count = bench(batched_ocr(images_per_batch), images, args.rounds)
+        print(
+            f"  {f'batch-{images_per_batch}':<10} {rate:>10,.1f} lines/sec  lines={line_count}"
+            f"  (x{rate / baseline:.2f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# scripts/test_kafka_output_serializer.py
+"""
+KafkaJdPreprocessOutput 직렬화 호환성 검사
+
+기존 경로(asdict → camelCase dict → json.dumps(ensure_ascii=False))와
+현재 경로(to_dict → serialize_kafka_message)의 출력 bytes를 비교한다.
+
+- json 백엔드  : 기존 포맷과 byte 단위 동일
+- orjson 백엔드: 기존 포맷의 compact 표현(separators=(",", ":"))과 byte 단위 동일
+"""
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from domain.job_source import JobSource
+from infra.kafka.kafka_serializer import serialize_kafka_message, _ORJSON_AVAILABLE
+from outputs.kafka_jd_preprocess_output import KafkaJdPreprocessOutput
+
+
+def legacy_to_dict(output: KafkaJdPreprocessOutput):
+    """변경 전 to_dict 구현"""
+    data = asdict(output)
+    if isinstance(output.source, JobSource):
+        data["source"] = output.source.value
+    return {
+        "eventId": data["event_id"],
+        "requestId": data["request_id"],
+        "eventType": data["event_type"],
+        "version": data["version"],
+        "occurredAt": data["occurred_at"],
+        "brandName": data["brand_name"],
+        "positionName": data["position_name"],
+        "source": data["source"],
+        "sourceUrl": data["source_url"],
+        "canonicalMap": data["canonical_map"] or {},
+        "recruitmentPeriodType": data["recruitment_period_type"],
+        "openedDate": data["opened_date"],
+        "closedDate": data["closed_date"],
+        "skills": data["skills"] or [],
+    }
+
+
+def legacy_bytes(output: KafkaJdPreprocessOutput) -> bytes:
+    return json.dumps(legacy_to_dict(output), ensure_ascii=False).encode("utf-8")
+
+
+def build_samples():
+    canonical_map = {
+        "responsibilities": ["대규모 트래픽 API 설계 및 운영", "MSA 전환 \"리드\"", "탭\t개행\n제어\u0001문자"],
+        "requirements": ["Java/Kotlin 3년 이상", "Spring Boot 경험", "이모지 🚀 / 한자 漢字"],
+        "preferred": [],
+        "benefits": ["\\백슬래시\\", "U+2028 \u2028 / DEL \x7f", "</script>"],
+    }
+    return [
+        KafkaJdPreprocessOutput.from_domain(
+            request_id="req-1",
+            brand_name="테스트회사",
+            position_name="백엔드 개발자",
+            source=JobSource.TEXT,
+            canonical_map=canonical_map,
+            recruitment_period_type="DATE_RANGE",
+            opened_date="2025-01-01",
+            closed_date="2025-02-01",
+            skills=["Java", "Kotlin", "Spring"],
+        ),
+        KafkaJdPreprocessOutput.from_domain(
+            request_id="req-2",
+            brand_name="Brand",
+            position_name="ML Engineer",
+            source=JobSource.URL,
+            canonical_map={},
+            source_url="https://example.com/jobs/1?a=b&c=d",
+        ),
+        KafkaJdPreprocessOutput(
+            event_id="evt-3",
+            request_id="req-3",
+            event_type="JD_PREPROCESS_COMPLETED",
+            version="v1",
+            occurred_at=0,
+            brand_name="",
+            position_name="",
+            source=JobSource.IMAGE,
+        ),
+    ]
+
+
+def test_serializer():
+    print("==========================================")
+    print(" TEST: KafkaJdPreprocessOutput serializer")
+    print("==========================================")
+
+    samples = build_samples()
+
+    for output in samples:
+        expected = legacy_bytes(output)
+
+        assert output.to_dict() == legacy_to_dict(output), "to_dict mismatch"
+
+        actual_json = serialize_kafka_message(output.to_dict(), backend="json")
+        assert actual_json == expected, f"json backend mismatch: {output.request_id}"
+
+        if _ORJSON_AVAILABLE:
+            compact = json.dumps(legacy_to_dict(output), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            actual_orjson = serialize_kafka_message(output.to_dict(), backend="orjson")
+            assert actual_orjson == compact, f"orjson backend mismatch: {output.request_id}"
+            assert json.loads(actual_orjson) == json.loads(expected)
+
+        print(f"  OK {output.request_id} ({len(expected)} bytes)")
+
+    iterations = 20000
+    output = samples[0]
+    started = time.perf_counter()
+    for _ in range(iterations):
+        legacy_bytes(output)
+    legacy_sec = time.perf_counter() - started
+
+    print(f"\n  legacy      {iterations / legacy_sec:>12,.0f} msgs/sec")
+    for backend in (["orjson"] if _ORJSON_AVAILABLE else []) + ["json"]:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            serialize_kafka_message(output.to_dict(), backend=backend)
+        elapsed = time.perf_counter() - started
+        print(f"  {backend:<10}  {iterations / elapsed:>12,.0f} msgs/sec  (x{legacy_sec / elapsed:.2f})")
+
+    print("\nAll serializer checks passed")
+
+
+if __name__ == "__main__":
+    test_serializer()
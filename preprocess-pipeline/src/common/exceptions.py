@@ -96,6 +96,10 @@ class ProcessingError(Exception):
         self.category = get_error_category(error_code)
         super().__init__(f"[{error_code.value}] {message}")
 
+    def __reduce__(self):
+        # ProcessPoolExecutor 경계 전달용 (cause는 pickle 불가할 수 있어 제외)
+        return (self.__class__, (self.error_code, self.message))
+
     def __repr__(self) -> str:
         return (
             f"ProcessingError("
@@ -61,16 +61,57 @@ class KafkaConfig:
     poll_timeout_sec: float
     consumer_concurrency: int
 
+    # 토픽별 consumer 프로세스 수 (None이면 main_kafka에서 consumer_concurrency 기준으로 결정)
+    text_processes: Optional[int] = None
+    url_processes: Optional[int] = None
+    ocr_processes: int = 1
+
     @property
     def bootstrap_servers(self) -> str:
         return self.connection.bootstrap_servers
 
 
+@dataclass(frozen=True)
+class ProducerProfile:
+    """
+    Producer 처리량 프로파일 (result/fail 토픽 공용)
+
+    - canonicalMap(한글 JSON)은 압축률이 높으므로 zstd/lz4 권장
+    - batch_size None이면 librdkafka 기본값 사용
+    - max_pending_deliveries: delivery 확인 대기 메시지 상한 (초과 시 publish가 대기)
+    """
+    linger_ms: int = 20
+    batch_size: Optional[int] = None
+    compression_type: str = "zstd"
+    enable_idempotence: bool = True
+    max_pending_deliveries: int = 1000
+
+
 @dataclass(frozen=True)
 class WorkerConfig:
     shutdown_timeout_sec: int
     max_retries: int = 3
 
+    # batch consume 모드 (batch_size <= 1 이면 기존 단건 poll 모드)
+    batch_size: int = 1
+    batch_linger_ms: int = 500
+
+    # offset commit coalescing (interval 또는 건수 도달 시 비동기 flush)
+    commit_interval_ms: int = 1000
+    commit_threshold: int = 100
+
+    # TEXT Worker ProcessPool 병렬 모드 (pool 크기는 KafkaConfig.consumer_concurrency)
+    text_pool_enabled: bool = False
+
+    producer_profile: ProducerProfile = ProducerProfile()
+
+    # result/fail delivery 실패를 비동기로 fail 토픽/로컬 백업에 라우팅
+    confirm_delivery: bool = False
+
+    # 내부 work queue 모드 (0이면 비활성)
+    # 처리 스레드가 메시지를 처리하는 동안 poll은 계속하고, queue가 가득 차면 파티션 pause
+    work_queue_size: int = 0
+
 
 def load_kafka_config() -> KafkaConfig:
     connection = KafkaConnectionConfig(
@@ -92,11 +133,41 @@ def load_kafka_config() -> KafkaConfig:
         consumer_group=os.getenv("KAFKA_CONSUMER_GROUP", "preprocess-group"),
         poll_timeout_sec=float(os.getenv("KAFKA_POLL_TIMEOUT_SEC", "1.0")),
         consumer_concurrency=int(os.getenv("KAFKA_CONSUMER_CONCURRENCY", "3")),
+        text_processes=_optional_int_env("KAFKA_TEXT_PROCESSES"),
+        url_processes=_optional_int_env("KAFKA_URL_PROCESSES"),
+        ocr_processes=int(os.getenv("KAFKA_OCR_PROCESSES", "1")),
     )
 
 
+def _optional_int_env(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
 def load_kafka_worker_config() -> WorkerConfig:
     return WorkerConfig(
         shutdown_timeout_sec=int(os.getenv("SHUTDOWN_TIMEOUT_SEC", "30")),
         max_retries=int(os.getenv("MAX_RETRIES", "3")),
+        batch_size=int(os.getenv("KAFKA_BATCH_SIZE", "1")),
+        batch_linger_ms=int(os.getenv("KAFKA_BATCH_LINGER_MS", "500")),
+        commit_interval_ms=int(os.getenv("KAFKA_COMMIT_INTERVAL_MS", "1000")),
+        commit_threshold=int(os.getenv("KAFKA_COMMIT_THRESHOLD", "100")),
+        text_pool_enabled=os.getenv("TEXT_WORKER_POOL_ENABLED", "false").lower() == "true",
+        producer_profile=load_producer_profile(),
+        confirm_delivery=os.getenv("KAFKA_CONFIRM_DELIVERY", "false").lower() == "true",
+        work_queue_size=int(os.getenv("KAFKA_WORK_QUEUE_SIZE", "0")),
+    )
+
+
+def load_producer_profile() -> ProducerProfile:
+    compression_type = os.getenv("KAFKA_PRODUCER_COMPRESSION", "zstd").lower()
+    if compression_type not in ("none", "gzip", "snappy", "lz4", "zstd"):
+        raise ValueError(f"Unsupported KAFKA_PRODUCER_COMPRESSION: {compression_type}")
+
+    return ProducerProfile(
+        linger_ms=int(os.getenv("KAFKA_PRODUCER_LINGER_MS", "20")),
+        batch_size=_optional_int_env("KAFKA_PRODUCER_BATCH_SIZE"),
+        compression_type=compression_type,
+        enable_idempotence=os.getenv("KAFKA_PRODUCER_IDEMPOTENCE", "true").lower() == "true",
+        max_pending_deliveries=int(os.getenv("KAFKA_PRODUCER_MAX_PENDING", "1000")),
     )
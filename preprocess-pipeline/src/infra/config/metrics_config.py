@@ -0,0 +1,29 @@
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+@dataclass(frozen=True)
+class MetricsConfig:
+    """
+    Prometheus 메트릭 노출 설정
+
+    - 워커 프로세스마다 /metrics 서버를 띄운다 (port_base + 프로세스 순번)
+    """
+    enabled: bool = False
+    port_base: int = 9400
+
+    def port_for(self, index: int) -> Optional[int]:
+        """프로세스 순번별 포트 (비활성 시 None)"""
+        return self.port_base + index if self.enabled else None
+
+
+def load_metrics_config() -> MetricsConfig:
+    return MetricsConfig(
+        enabled=os.getenv("METRICS_ENABLED", "false").lower() == "true",
+        port_base=int(os.getenv("METRICS_PORT_BASE", "9400")),
+    )
@@ -0,0 +1,71 @@
+import os
+from dataclasses import dataclass
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+@dataclass(frozen=True)
+class OcrConfig:
+    """
+    OCR 파이프라인 설정
+
+    - prefetch_workers: 이미지 다운로드/디코딩/리사이즈를 OCR 추론과 병행하는 스레드 수
+      (1 이하면 순차 처리, 동시에 메모리에 올라가는 전처리 이미지 수의 상한이기도 함)
+    - cache_*: 이미지 content hash 기반 OCR 결과 캐시
+      (memory_entries 0이면 memory tier 비활성, cache_dir 미지정이면 disk tier 비활성)
+    - tile_*: 전처리 후 높이가 tile_height를 넘는 이미지는 overlap을 둔 가로 띠로 나눠 OCR
+      (tile_height 0이면 비활성, overlap은 본문 한 줄 높이보다 충분히 커야 함)
+    - engine_pool_size: PaddleOCR 엔진 프로세스 수
+      (0이면 OCR 프로세스 내 단일 엔진, gRPC 서버와 Kafka Worker가 작업 큐를 공유)
+    - rec_batch_num: text recognition 1회 추론 배치 크기
+      (여러 이미지/타일의 text 영역을 모아 이 크기 단위로 recognition)
+    - model_dir: det/rec/cls inference 모델 디렉터리 루트 ({model_dir}/det, /rec, /cls)
+      (미지정이면 PaddleOCR 기본 경로 ~/.paddleocr, 지정 경로에 모델이 없으면 첫 기동 시 그 경로로 다운로드)
+    - enable_mkldnn / cpu_threads: Paddle Inference CPU MKLDNN 가속, 그때의 연산 스레드 수
+    - angle_cls: 방향(0/180도) 분류기 사용 정책
+      - auto  : 이미지별 샘플 crop만 먼저 분류, 뒤집힌 text가 감지된 이미지만 전체 crop 분류
+      - always: 모든 crop 분류 (기존 동작)
+      - off   : 분류하지 않음
+    - triage_enabled: OCR 전 축소 이미지 edge 분석으로 JD 텍스트가 없을 법한 이미지 선별
+      (빈/아주 작은 이미지는 skip, 텍스트 줄 밀도가 낮은 이미지는 나머지 이미지 뒤로 보류)
+    - triage_budget_sec: 요청 시작부터 이 시간 안에서만 보류 이미지 OCR (초과분은 skip, 0이면 제한 없음)
+    - debug_dropped_lines: 품질 필터에서 제거된 라인을 사유와 함께 DEBUG 로그로 기록
+      (기본 비활성, 제거 라인 dict를 만들지 않음)
+    """
+    prefetch_workers: int = 4
+    cache_memory_entries: int = 256
+    cache_dir: str = ""
+    cache_max_bytes: int = 512 * 1024 * 1024
+    tile_height: int = 2000
+    tile_overlap: int = 200
+    engine_pool_size: int = 0
+    rec_batch_num: int = 6
+    model_dir: str = ""
+    enable_mkldnn: bool = False
+    cpu_threads: int = 1
+    angle_cls: str = "auto"
+    triage_enabled: bool = True
+    triage_budget_sec: float = 10.0
+    debug_dropped_lines: bool = False
+
+
+def load_ocr_config() -> OcrConfig:
+    return OcrConfig(
+        prefetch_workers=int(os.getenv("OCR_PREFETCH_WORKERS", "4")),
+        cache_memory_entries=int(os.getenv("OCR_CACHE_MEMORY_ENTRIES", "256")),
+        cache_dir=os.getenv("OCR_CACHE_DIR", ""),
+        cache_max_bytes=int(os.getenv("OCR_CACHE_MAX_MB", "512")) * 1024 * 1024,
+        tile_height=int(os.getenv("OCR_TILE_HEIGHT", "2000")),
+        tile_overlap=int(os.getenv("OCR_TILE_OVERLAP", "200")),
+        engine_pool_size=int(os.getenv("OCR_ENGINE_POOL_SIZE", "0")),
+        rec_batch_num=int(os.getenv("OCR_REC_BATCH_NUM", "6")),
+        model_dir=os.getenv("OCR_MODEL_DIR", ""),
+        enable_mkldnn=os.getenv("OCR_ENABLE_MKLDNN", "false").lower() == "true",
+        cpu_threads=int(os.getenv("OCR_CPU_THREADS", "1")),
+        angle_cls=os.getenv("OCR_ANGLE_CLS", "auto").lower(),
+        triage_enabled=os.getenv("OCR_TRIAGE_ENABLED", "true").lower() == "true",
+        triage_budget_sec=float(os.getenv("OCR_TRIAGE_BUDGET_SEC", "10")),
+        debug_dropped_lines=os.getenv("OCR_DEBUG_DROPPED_LINES", "false").lower() == "true",
+    )
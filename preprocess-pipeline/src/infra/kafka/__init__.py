@@ -3,9 +3,11 @@
 from infra.kafka.kafka_consumer import KafkaStreamConsumer
 from infra.kafka.kafka_producer import KafkaStreamProducer
 from infra.kafka.kafka_client_factory import KafkaClientFactory
+from infra.kafka.kafka_commit_tracker import KafkaCommitTracker
 
 __all__ = [
     "KafkaStreamConsumer",
     "KafkaStreamProducer",
     "KafkaClientFactory",
+    "KafkaCommitTracker",
 ]
@@ -3,7 +3,9 @@
 from confluent_kafka import Producer, Consumer
 import logging
 
-from infra.config.kafka_config import KafkaConnectionConfig
+from typing import Optional
+
+from infra.config.kafka_config import KafkaConnectionConfig, ProducerProfile
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +27,10 @@ class KafkaClientFactory:
     def create_producer(
         self,
         client_id: str,
-        compression_type: str = "snappy",
+        profile: Optional[ProducerProfile] = None,
     ) -> Producer:
+        profile = profile or ProducerProfile()
+
         def _error_cb(err):
             logger.error(
                 "Kafka producer internal error",
@@ -37,19 +41,26 @@ class KafkaClientFactory:
             **self._connection_config.to_confluent_config(),
             "client.id": client_id,
             "acks": "all",
-            "enable.idempotence": True,
-            "linger.ms": 10,
-            "compression.type": compression_type,
+            "enable.idempotence": profile.enable_idempotence,
+            "linger.ms": profile.linger_ms,
+            "compression.type": profile.compression_type,
             "delivery.timeout.ms": 120000,
             "request.timeout.ms": 30000,
             "error_cb": _error_cb,
         }
+        if profile.batch_size is not None:
+            config["batch.size"] = profile.batch_size
+
         logger.info(
             "Producer created",
             extra={
                 "bootstrap_servers": self._connection_config.bootstrap_servers,
                 "client_id": client_id,
                 "protocol": config["security.protocol"],
+                "compression_type": profile.compression_type,
+                "linger_ms": profile.linger_ms,
+                "batch_size": profile.batch_size,
+                "idempotence": profile.enable_idempotence,
             },
         )
         return Producer(config)
@@ -66,6 +77,19 @@ class KafkaClientFactory:
                 extra={"group_id": group_id, "client_id": client_id, "error": str(err)},
             )
 
+        def _commit_cb(err, partitions):
+            # 비동기 commit 결과는 poll 시점에 전달됨 -> 실패만 로깅
+            if err:
+                logger.error(
+                    "Kafka offset commit failed",
+                    extra={
+                        "group_id": group_id,
+                        "client_id": client_id,
+                        "error": str(err),
+                        "partitions": [f"{p.topic}[{p.partition}]@{p.offset}" for p in partitions],
+                    },
+                )
+
         config = {
             **self._connection_config.to_confluent_config(),
             "group.id": group_id,
@@ -75,6 +99,7 @@ class KafkaClientFactory:
             "session.timeout.ms": 45000,
             "max.poll.interval.ms": 300000,
             "error_cb": _error_cb,
+            "on_commit": _commit_cb,
         }
         logger.info(
             "Consumer created",
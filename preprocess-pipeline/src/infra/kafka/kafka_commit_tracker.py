@@ -0,0 +1,154 @@
+# src/infra/kafka/kafka_commit_tracker.py
+
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from confluent_kafka import Consumer, TopicPartition
+
+logger = logging.getLogger(__name__)
+
+_TopicPartitionKey = Tuple[str, int]
+
+
+class KafkaCommitTracker:
+    """
+    파티션별 완료 offset 추적 + coalesced commit
+
+    책임:
+    - poll로 전달된 offset(in-flight) / 처리 완료 offset 기록
+    - 연속(contiguous)으로 완료된 구간까지만 commit 대상으로 계산
+    - 건수(threshold) 또는 시간(interval) 기준으로 비동기 commit
+    - 종료/rebalance 시 동기 flush
+
+    연속성 규칙:
+    - 파티션의 commit offset = 가장 작은 in-flight offset
+    - in-flight가 없으면 = 최대 완료 offset + 1
+    - 순서와 다르게 완료되어도 앞선 메시지를 건너뛰어 commit하지 않음
+    """
+
+    def __init__(
+            self,
+            consumer: Consumer,
+            flush_interval_sec: float = 1.0,
+            flush_threshold: int = 100,
+    ):
+        self._consumer = consumer
+        self._flush_interval_sec = flush_interval_sec
+        self._flush_threshold = max(1, flush_threshold)
+
+        self._lock = threading.Lock()
+        self._in_flight: Dict[_TopicPartitionKey, Set[int]] = {}
+        self._max_done: Dict[_TopicPartitionKey, int] = {}
+        self._committed: Dict[_TopicPartitionKey, int] = {}
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+
+    def track(self, msg) -> None:
+        """poll로 전달된 메시지를 in-flight로 등록"""
+        tp = (msg.topic(), msg.partition())
+        with self._lock:
+            self._in_flight.setdefault(tp, set()).add(msg.offset())
+
+    def mark_done(self, msg) -> None:
+        """
+        처리 완료 기록
+
+        revoke로 이미 정리된 파티션의 완료는 무시한다.
+        (다른 consumer가 소유한 파티션의 offset을 되돌리지 않기 위함)
+        """
+        tp = (msg.topic(), msg.partition())
+        offset = msg.offset()
+        with self._lock:
+            in_flight = self._in_flight.get(tp)
+            if in_flight is None:
+                return
+            in_flight.discard(offset)
+            if offset > self._max_done.get(tp, -1):
+                self._max_done[tp] = offset
+            self._pending_count += 1
+
+    def maybe_flush(self) -> None:
+        """threshold 또는 interval 도달 시 비동기 flush"""
+        with self._lock:
+            due = (
+                self._pending_count >= self._flush_threshold
+                or (
+                    self._pending_count > 0
+                    and time.monotonic() - self._last_flush >= self._flush_interval_sec
+                )
+            )
+        if due:
+            self.flush(asynchronous=True)
+
+    def flush(
+            self,
+            asynchronous: bool = True,
+            partitions: Optional[Iterable[_TopicPartitionKey]] = None,
+    ) -> None:
+        """
+        연속 완료 구간 commit
+
+        Args:
+            asynchronous: False면 broker 응답까지 대기 (종료/revoke 경로)
+            partitions: 지정 시 해당 파티션만 commit
+        """
+        with self._lock:
+            offsets = self._committable_offsets(
+                partitions=partitions,
+                force=not asynchronous,
+            )
+            self._pending_count = 0
+            self._last_flush = time.monotonic()
+            if not offsets:
+                return
+            self._committed.update(offsets)
+
+        self._consumer.commit(
+            offsets=[TopicPartition(topic, partition, offset) for (topic, partition), offset in offsets.items()],
+            asynchronous=asynchronous,
+        )
+        logger.debug(
+            "Offsets committed",
+            extra={
+                "asynchronous": asynchronous,
+                "offsets": {f"{t}[{p}]": o for (t, p), o in offsets.items()},
+            },
+        )
+
+    def forget(self, partitions: Iterable[_TopicPartitionKey]) -> None:
+        """revoke된 파티션 상태 제거"""
+        with self._lock:
+            for tp in partitions:
+                self._in_flight.pop(tp, None)
+                self._max_done.pop(tp, None)
+                self._committed.pop(tp, None)
+
+    def in_flight_count(self) -> int:
+        with self._lock:
+            return sum(len(offsets) for offsets in self._in_flight.values())
+
+    def _committable_offsets(
+            self,
+            partitions: Optional[Iterable[_TopicPartitionKey]],
+            force: bool,
+    ) -> Dict[_TopicPartitionKey, int]:
+        """
+        파티션별 commit할 다음 offset 계산 (lock 보유 상태에서 호출)
+
+        force=True면 이미 commit 요청한 offset도 다시 포함한다.
+        (비동기 commit 실패분을 종료 시점 동기 commit으로 보정)
+        """
+        targets: List[_TopicPartitionKey] = (
+            list(partitions) if partitions is not None else list(self._in_flight.keys())
+        )
+        offsets: Dict[_TopicPartitionKey, int] = {}
+        for tp in targets:
+            if tp not in self._max_done:
+                continue
+            in_flight = self._in_flight.get(tp)
+            next_offset = min(in_flight) if in_flight else self._max_done[tp] + 1
+            if force or next_offset > self._committed.get(tp, -1):
+                offsets[tp] = next_offset
+        return offsets
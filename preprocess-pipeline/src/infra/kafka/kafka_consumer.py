@@ -1,5 +1,9 @@
-from confluent_kafka import Consumer, KafkaError
+from confluent_kafka import Consumer, KafkaError, TopicPartition
 import logging
+from typing import Callable, List, Optional, Set, Tuple
+
+from infra.kafka.kafka_commit_tracker import KafkaCommitTracker
+from infra.metrics import KAFKA_PAUSED_PARTITIONS, KAFKA_REBALANCE_TOTAL
 
 logger = logging.getLogger(__name__)
 
@@ -9,8 +13,11 @@ class KafkaStreamConsumer:
     confluent-kafka 기반 Consumer 래퍼
 
     책임:
-    - 메시지 polling 및 에러 핸들링
-    - 수동 offset commit
+    - 메시지 polling(단건/배치) 및 에러 핸들링
+    - 수동 offset commit (KafkaCommitTracker로 coalescing, 비동기 flush)
+    - 종료/revoke 시 동기 flush
+    - backpressure pause/resume (pause 중에도 poll은 계속 → heartbeat/max.poll.interval 유지)
+    - rebalance 이벤트 메트릭
     - 연결/인증 설정은 KafkaClientFactory가 담당
     """
 
@@ -19,10 +26,23 @@ class KafkaStreamConsumer:
             consumer: Consumer,
             topic: str,
             poll_timeout_sec: float = 1.0,
+            commit_interval_sec: float = 1.0,
+            commit_threshold: int = 100,
     ):
         self._consumer = consumer
         self._topic = topic
         self.poll_timeout_sec = poll_timeout_sec
+        self._commit_tracker = KafkaCommitTracker(
+            consumer=consumer,
+            flush_interval_sec=commit_interval_sec,
+            flush_threshold=commit_threshold,
+        )
+
+        # backpressure 상태 (True면 새로 할당된 파티션도 poll 시점에 pause)
+        self._backpressure = False
+        self._paused: Set[Tuple[str, int]] = set()
+        self._revoke_listener: Optional[Callable[[List[Tuple[str, int]]], None]] = None
+
         self._consumer.subscribe(
             [topic],
             on_assign=self._on_assign,
@@ -31,6 +51,13 @@ class KafkaStreamConsumer:
         logger.info("Consumer subscribed", extra={"topic": topic})
 
     def _on_assign(self, consumer, partitions):
+        KAFKA_REBALANCE_TOTAL.labels(topic=self._topic, event="assign").inc()
+
+        # 새 할당은 pause 상태가 초기화됨 → backpressure 중이면 다음 poll에서 다시 pause
+        for p in partitions:
+            self._paused.discard((p.topic, p.partition))
+        self._update_paused_metric()
+
         logger.info(
             "Partition assigned",
             extra={
@@ -40,6 +67,8 @@ class KafkaStreamConsumer:
         )
 
     def _on_revoke(self, consumer, partitions):
+        KAFKA_REBALANCE_TOTAL.labels(topic=self._topic, event="revoke").inc()
+
         logger.warning(
             "Partition revoked",
             extra={
@@ -48,35 +77,157 @@ class KafkaStreamConsumer:
             },
         )
 
-    def poll(self):
-        """메시지 polling"""
-        msg = self._consumer.poll(self.poll_timeout_sec)
+        revoked = [(p.topic, p.partition) for p in partitions]
+        for tp in revoked:
+            self._paused.discard(tp)
+        self._update_paused_metric()
+
+        # 아직 처리 시작 전인 메시지 폐기 (새 소유자가 처리)
+        if self._revoke_listener is not None:
+            try:
+                self._revoke_listener(revoked)
+            except Exception as e:
+                logger.error(
+                    "Revoke listener failed",
+                    extra={"topic": self._topic, "error": str(e)},
+                )
+
+        # 소유권을 잃기 전에 완료된 offset을 동기 commit
+        try:
+            self._commit_tracker.flush(asynchronous=False, partitions=revoked)
+        except Exception as e:
+            logger.error(
+                "Commit on revoke failed",
+                extra={"topic": self._topic, "error": str(e)},
+            )
+        finally:
+            self._commit_tracker.forget(revoked)
+
+    def poll(self, timeout_sec: Optional[float] = None):
+        """메시지 polling (timeout_sec 미지정 시 poll_timeout_sec)"""
+        self._commit_tracker.maybe_flush()
+
+        msg = self._consumer.poll(self.poll_timeout_sec if timeout_sec is None else timeout_sec)
+
+        # poll 중 rebalance로 새로 할당된 파티션에 pause 재적용
+        if self._backpressure:
+            self._pause_assigned()
+
         if msg is None:
             return None
 
-        if msg.error():
-            code = msg.error().code()
-            if code == KafkaError._PARTITION_EOF:
-                logger.debug("Reached end of partition", extra={"topic": self._topic})
-                return None
-            if code == KafkaError.UNKNOWN_TOPIC_OR_PART:
-                logger.warning(
-                    "Topic not yet available",
-                    extra={"topic": self._topic, "error": str(msg.error())},
-                )
-                return None
-            logger.error("Consumer poll error", extra={"topic": self._topic, "error": str(msg.error())})
-            raise RuntimeError(msg.error())
+        if not self._is_consumable(msg):
+            return None
 
+        self._commit_tracker.track(msg)
         return msg
 
+    def consume(self, num_messages: int, timeout_sec: float) -> List:
+        """
+        배치 polling (Consumer.consume)
+
+        최대 num_messages 건을 timeout_sec 동안 수집한다.
+        에러 메시지는 poll()과 동일한 정책으로 걸러낸다.
+        """
+        self._commit_tracker.maybe_flush()
+
+        msgs = self._consumer.consume(num_messages=num_messages, timeout=timeout_sec)
+        consumable = [msg for msg in msgs if self._is_consumable(msg)]
+        for msg in consumable:
+            self._commit_tracker.track(msg)
+        return consumable
+
+    def _is_consumable(self, msg) -> bool:
+        """에러 메시지 판별 (무시 가능한 에러는 False, 치명적 에러는 예외)"""
+        if not msg.error():
+            return True
+
+        code = msg.error().code()
+        if code == KafkaError._PARTITION_EOF:
+            logger.debug("Reached end of partition", extra={"topic": self._topic})
+            return False
+        if code == KafkaError.UNKNOWN_TOPIC_OR_PART:
+            logger.warning(
+                "Topic not yet available",
+                extra={"topic": self._topic, "error": str(msg.error())},
+            )
+            return False
+        logger.error("Consumer poll error", extra={"topic": self._topic, "error": str(msg.error())})
+        raise RuntimeError(msg.error())
+
     def commit(self, msg):
-        """동기 커밋"""
-        try:
-            self._consumer.commit(message=msg, asynchronous=False)
-            logger.debug("Committed", extra={"topic": self._topic, "offset": msg.offset()})
-        except Exception as e:
-            raise
+        """
+        처리 완료 기록 (coalesced commit)
+
+        실제 commit은 threshold/interval 도달 시 비동기로 수행된다.
+        """
+        self._commit_tracker.mark_done(msg)
+        self._commit_tracker.maybe_flush()
+
+    def commit_batch(self, messages: List) -> None:
+        """
+        배치 처리 완료 기록 + 즉시 비동기 flush
+
+        파티션별 연속 완료 offset만 모아 배치당 1회 commit한다.
+        """
+        for msg in messages:
+            self._commit_tracker.mark_done(msg)
+        self._commit_tracker.flush(asynchronous=True)
+
+    def set_revoke_listener(self, listener: Callable[[List[Tuple[str, int]]], None]) -> None:
+        """revoke 시(동기 commit 직전) 호출할 listener 등록 (poll 스레드에서 실행)"""
+        self._revoke_listener = listener
+
+    def pause_all(self) -> None:
+        """
+        backpressure 시작: 할당된 전체 파티션 pause
+
+        poll()은 계속 호출해야 한다. (rebalance/heartbeat 처리, max.poll.interval.ms 유지)
+        pause 이전에 fetch된 메시지는 poll에서 반환될 수 있다.
+        """
+        self._backpressure = True
+        self._pause_assigned()
+
+    def resume_all(self) -> None:
+        """backpressure 해제: pause한 파티션 resume"""
+        self._backpressure = False
+        if not self._paused:
+            return
+
+        self._consumer.resume([TopicPartition(topic, partition) for topic, partition in self._paused])
+        logger.info(
+            "Partitions resumed",
+            extra={"topic": self._topic, "partitions": [f"{t}[{p}]" for t, p in sorted(self._paused)]},
+        )
+        self._paused.clear()
+        self._update_paused_metric()
+
+    @property
+    def paused(self) -> bool:
+        return self._backpressure
+
+    def _pause_assigned(self) -> None:
+        targets = [
+            tp for tp in self._consumer.assignment()
+            if (tp.topic, tp.partition) not in self._paused
+        ]
+        if not targets:
+            return
+
+        self._consumer.pause(targets)
+        self._paused.update((tp.topic, tp.partition) for tp in targets)
+        self._update_paused_metric()
+        logger.info(
+            "Partitions paused",
+            extra={"topic": self._topic, "partitions": [f"{tp.topic}[{tp.partition}]" for tp in targets]},
+        )
+
+    def _update_paused_metric(self) -> None:
+        KAFKA_PAUSED_PARTITIONS.labels(topic=self._topic).set(len(self._paused))
+
+    def flush_commits(self) -> None:
+        """완료된 offset 동기 flush (종료 경로)"""
+        self._commit_tracker.flush(asynchronous=False)
 
     def close(self):
         """Consumer 종료"""
@@ -1,12 +1,29 @@
 # src/infra/kafka/kafka_producer.py
 
 from confluent_kafka import Producer
+import itertools
 import logging
-import json
-from typing import Optional, Dict, Any
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Dict, Any, List, Tuple
+
+from infra.kafka.kafka_serializer import serialize_kafka_message
 
 logger = logging.getLogger(__name__)
 
+# pending 상한 도달 시 delivery callback을 기다리는 poll 주기
+_BACKPRESSURE_POLL_SEC = 0.1
+
+
+@dataclass
+class _PendingDelivery:
+    """delivery 확인 대기 중인 메시지"""
+
+    topic: str
+    request_id: str
+    on_failure: Optional[Callable[[str], None]] = None
+
 
 class KafkaStreamProducer:
     """
@@ -14,18 +31,34 @@ class KafkaStreamProducer:
 
     책임:
     - Kafka 메시지 발행
-    - 직렬화(JSON)
-    - delivery callback 로깅
+    - 직렬화(JSON, kafka_serializer 백엔드)
+    - delivery 추적 (pending 상한 + 보고 전 실패 request_id 기록)
 
     계약:
     - produce enqueue 실패 시 예외 발생
-    - delivery 실패는 callback 로깅만 수행
+    - delivery 실패는 callback 로깅 + 실패 목록 기록
+    - on_failure 지정 시 delivery 실패를 호출자에게 비동기 통지
+      (poll/flush를 호출한 스레드에서 실행)
+    - pending delivery가 max_pending_deliveries에 도달하면 publish가 대기 (bounded)
+    - 상한(max_pending_deliveries)은 delivery 대기 메시지에만 적용
+      실패 기록은 drain_failed()/close()가 수거할 때까지 빠짐없이 보관
+      (장기 실행 호출자는 실패를 처리한 뒤 drain_failed()로 주기적으로 수거)
+    - close()는 수거되지 않은 delivery 실패/미전송 request_id 목록을 반환
     - 중복/멱등성 판단은 downstream consumer 책임
     - 연결/인증 설정은 KafkaClientFactory가 담당
     """
 
-    def __init__(self, producer: Producer) -> None:
+    def __init__(self, producer: Producer, max_pending_deliveries: int = 1000) -> None:
         self._producer = producer
+        self._max_pending = max(1, max_pending_deliveries)
+
+        # delivery 대기: token -> _PendingDelivery
+        # 여러 스레드가 Producer를 공유할 수 있으므로 lock으로 보호
+        self._lock = threading.Lock()
+        self._tokens = itertools.count()
+        self._pending: Dict[int, _PendingDelivery] = {}
+        # 보고 전 delivery 실패 (topic, request_id, error), drain_failed()/close()가 수거
+        self._failed: List[Tuple[str, str, str]] = []
 
     def publish(
             self,
@@ -33,14 +66,20 @@ class KafkaStreamProducer:
             message: Any,
             key: Optional[str] = None,
             headers: Optional[Dict[str, str]] = None,
+            on_failure: Optional[Callable[[str], None]] = None,
     ) -> None:
         """
         메시지 발행 (비동기)
 
         실패 시 예외 발생 → 상위 Consumer에서 재처리 판단
+
+        Args:
+            on_failure: delivery 실패 시 에러 문자열과 함께 호출 (enqueue 실패는 예외로 전달)
         """
+        request_id = key if isinstance(key, str) else "unknown"
+
         if isinstance(message, dict):
-            message = json.dumps(message, ensure_ascii=False).encode("utf-8")
+            message = serialize_kafka_message(message)
         elif isinstance(message, str):
             message = message.encode("utf-8")
 
@@ -51,17 +90,79 @@ class KafkaStreamProducer:
         if headers:
             kafka_headers = [(k, v.encode("utf-8")) for k, v in headers.items()]
 
-        self._producer.produce(
-            topic=topic,
-            value=message,
-            key=key,
-            headers=kafka_headers,
-            on_delivery=self._delivery_callback,
-        )
+        self._wait_for_capacity()
+
+        token = next(self._tokens)
+        with self._lock:
+            self._pending[token] = _PendingDelivery(topic, request_id, on_failure)
+
+        try:
+            self._producer.produce(
+                topic=topic,
+                value=message,
+                key=key,
+                headers=kafka_headers,
+                on_delivery=lambda err, msg: self._on_delivery(token, err, msg),
+            )
+        except BufferError:
+            # 로컬 큐 가득 참: delivery를 한 번 처리한 뒤 1회 재시도
+            self._producer.poll(1.0)
+            try:
+                self._producer.produce(
+                    topic=topic,
+                    value=message,
+                    key=key,
+                    headers=kafka_headers,
+                    on_delivery=lambda err, msg: self._on_delivery(token, err, msg),
+                )
+            except Exception:
+                self._discard(token)
+                raise
+        except Exception:
+            self._discard(token)
+            raise
 
         # 이벤트 루프 태우기 (non-blocking)
         self._producer.poll(0)
 
+    def _wait_for_capacity(self) -> None:
+        """pending delivery 상한 도달 시 delivery callback 처리하며 대기"""
+        if self.pending_count() < self._max_pending:
+            return
+
+        started = time.monotonic()
+        while self.pending_count() >= self._max_pending:
+            self._producer.poll(_BACKPRESSURE_POLL_SEC)
+
+        logger.warning(
+            "[KAFKA_PRODUCER_BACKPRESSURE] waited=%.3fs max_pending=%d",
+            time.monotonic() - started,
+            self._max_pending,
+        )
+
+    def _discard(self, token: int) -> None:
+        with self._lock:
+            self._pending.pop(token, None)
+
+    def poll(self, timeout: float = 0) -> None:
+        """delivery callback 처리 (publish가 없는 idle 구간에서도 호출)"""
+        self._producer.poll(timeout)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def failed_request_ids(self) -> List[str]:
+        """delivery 실패한 request_id 목록 (발생 순)"""
+        with self._lock:
+            return [request_id for _, request_id, _ in self._failed]
+
+    def drain_failed(self) -> List[Tuple[str, str, str]]:
+        """보고 전 delivery 실패 (topic, request_id, error) 수거 (수거분은 close() 보고에서 제외)"""
+        with self._lock:
+            failed, self._failed = self._failed, []
+        return failed
+
     def flush(self, timeout: float = 10.0):
         remaining = self._producer.flush(timeout)
         if remaining > 0:
@@ -70,10 +171,48 @@ class KafkaStreamProducer:
                 remaining,
             )
 
-    def close(self):
+    def close(self) -> List[str]:
+        """
+        flush 후 delivery 실패/미전송 request_id 목록 반환
+
+        Returns:
+            수거되지 않은 delivery 실패 + flush timeout으로 미전송된 request_id 목록
+        """
         logger.info("[KAFKA_PRODUCER_CLOSE]")
         self.flush()
 
+        # 보고한 실패는 비움 (close 재호출 시 중복 보고 방지)
+        failed = self.drain_failed()
+        with self._lock:
+            undelivered = [(pending.topic, pending.request_id) for pending in self._pending.values()]
+
+        if failed or undelivered:
+            logger.error(
+                "[KAFKA_PRODUCER_CLOSE] delivery failures failed=%s undelivered=%s",
+                [f"{topic}:{request_id}({error})" for topic, request_id, error in failed],
+                [f"{topic}:{request_id}" for topic, request_id in undelivered],
+            )
+
+        return [request_id for _, request_id, _ in failed] + [request_id for _, request_id in undelivered]
+
+    def _on_delivery(self, token: int, err, msg) -> None:
+        with self._lock:
+            pending = self._pending.pop(token, None) or _PendingDelivery(msg.topic(), "unknown")
+            if err:
+                self._failed.append((pending.topic, pending.request_id, str(err)))
+
+        self._delivery_callback(err, msg)
+
+        if err and pending.on_failure is not None:
+            try:
+                pending.on_failure(str(err))
+            except Exception:
+                logger.exception(
+                    "[KAFKA_DELIVERY_FAILURE_HANDLER_ERROR] topic=%s request_id=%s",
+                    pending.topic,
+                    pending.request_id,
+                )
+
     @staticmethod
     def _delivery_callback(err, msg):
         if err:
@@ -0,0 +1,54 @@
+# src/infra/kafka/kafka_serializer.py
+
+"""
+Kafka 메시지 JSON 직렬화
+
+백엔드 (KAFKA_JSON_ENCODER로 강제 가능):
+- orjson : 설치 시 기본값. dict → bytes 한 번에 직렬화
+           compact 포맷(구분자 공백 없음), 그 외 토큰은 json 백엔드와 동일
+- json   : json.dumps(ensure_ascii=False) 기존 포맷과 byte 단위 동일
+
+Spring(Jackson)은 토큰 사이 공백을 무시하므로 두 포맷 모두 동일하게 역직렬화된다.
+"""
+
+import json
+import logging
+import os
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_ORJSON_AVAILABLE = False
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+
+def _resolve_backend() -> str:
+    requested = os.getenv("KAFKA_JSON_ENCODER", "").lower()
+    if requested == "json" or not _ORJSON_AVAILABLE:
+        if requested == "orjson":
+            logger.warning("orjson not installed, falling back to json encoder")
+        return "json"
+    return "orjson"
+
+
+_BACKEND = _resolve_backend()
+
+
+def serialize_kafka_message(message: Any, backend: str = _BACKEND) -> bytes:
+    """
+    dict 메시지를 UTF-8 JSON bytes로 직렬화
+
+    orjson이 지원하지 않는 값(64bit 초과 정수 등)은 json 백엔드로 fallback한다.
+    """
+    if backend == "orjson":
+        try:
+            return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+
+    return json.dumps(message, ensure_ascii=False).encode("utf-8")
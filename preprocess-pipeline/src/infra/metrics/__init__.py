@@ -0,0 +1,35 @@
+# src/infra/metrics/__init__.py
+
+from infra.metrics.prometheus_metrics import (
+    KAFKA_REBALANCE_TOTAL,
+    KAFKA_PAUSED_PARTITIONS,
+    WORKER_QUEUE_DEPTH,
+    OCR_CACHE_REQUESTS_TOTAL,
+    OCR_TRIAGE_TOTAL,
+    STAGE_LATENCY_SECONDS,
+    start_metrics_server,
+)
+from infra.metrics.stage_timer import (
+    metric_labels,
+    set_metric_source,
+    observe_stage,
+    observe_stages,
+    collect_stages,
+    stage_timer,
+)
+
+__all__ = [
+    "KAFKA_REBALANCE_TOTAL",
+    "KAFKA_PAUSED_PARTITIONS",
+    "WORKER_QUEUE_DEPTH",
+    "OCR_CACHE_REQUESTS_TOTAL",
+    "OCR_TRIAGE_TOTAL",
+    "STAGE_LATENCY_SECONDS",
+    "start_metrics_server",
+    "metric_labels",
+    "set_metric_source",
+    "observe_stage",
+    "observe_stages",
+    "collect_stages",
+    "stage_timer",
+]
@@ -0,0 +1,142 @@
+# src/infra/metrics/prometheus_metrics.py
+
+"""
+Prometheus 메트릭 정의 + 프로세스별 /metrics HTTP 서버
+
+- prometheus_client 미설치 시 모든 메트릭은 no-op (호출부 분기 불필요)
+- 자식 프로세스마다 독립 registry를 가지므로 프로세스별 포트로 노출
+  (main_kafka가 METRICS_PORT_BASE + 프로세스 순번으로 포트 할당)
+- 서버 없는 ProcessPool 자식(TEXT pool / OCR 엔진 pool)의 단계 측정값은
+  결과와 함께 부모로 반환되어 부모 registry에 기록 (stage_timer.collect_stages)
+"""
+
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_PROMETHEUS_AVAILABLE = False
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram, start_http_server
+    _PROMETHEUS_AVAILABLE = True
+except ImportError:
+    pass
+
+
+class _NoopMetric:
+    """prometheus_client 미설치 시 대체 메트릭"""
+
+    def labels(self, *args, **kwargs) -> "_NoopMetric":
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def dec(self, amount: float = 1) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+    def observe(self, value: float) -> None:
+        pass
+
+
+def _counter(name: str, documentation: str, labelnames=()):
+    if not _PROMETHEUS_AVAILABLE:
+        return _NoopMetric()
+    return Counter(name, documentation, labelnames)
+
+
+def _gauge(name: str, documentation: str, labelnames=()):
+    if not _PROMETHEUS_AVAILABLE:
+        return _NoopMetric()
+    return Gauge(name, documentation, labelnames)
+
+
+def _histogram(name: str, documentation: str, labelnames, buckets):
+    if not _PROMETHEUS_AVAILABLE:
+        return _NoopMetric()
+    return Histogram(name, documentation, labelnames, buckets=buckets)
+
+
+# ==================================================
+# Kafka Consumer
+# ==================================================
+KAFKA_REBALANCE_TOTAL = _counter(
+    "preprocess_kafka_rebalance_total",
+    "Consumer rebalance 이벤트 수 (event=assign|revoke)",
+    ["topic", "event"],
+)
+
+KAFKA_PAUSED_PARTITIONS = _gauge(
+    "preprocess_kafka_paused_partitions",
+    "backpressure로 pause된 파티션 수",
+    ["topic"],
+)
+
+# ==================================================
+# Worker
+# ==================================================
+WORKER_QUEUE_DEPTH = _gauge(
+    "preprocess_worker_queue_depth",
+    "내부 work queue 적재 메시지 수 (처리 중 포함)",
+    ["worker"],
+)
+
+# ==================================================
+# OCR
+# ==================================================
+OCR_CACHE_REQUESTS_TOTAL = _counter(
+    "preprocess_ocr_cache_requests_total",
+    "OCR 결과 캐시 조회 수 (result=memory_hit|disk_hit|miss)",
+    ["result"],
+)
+
+OCR_TRIAGE_TOTAL = _counter(
+    "preprocess_ocr_triage_total",
+    "OCR 전 이미지 triage 결과 (decision=ocr|defer|skip|budget_skip, reason=ok|too_small|blank|low_text)",
+    ["decision", "reason"],
+)
+
+
+# ==================================================
+# Stage Latency
+# ==================================================
+# TEXT(ms 단위) ~ OCR/Playwright(수십 초)까지 포괄
+_STAGE_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+STAGE_LATENCY_SECONDS = _histogram(
+    "preprocess_stage_latency_seconds",
+    "처리 단계별 소요 시간 (stage: parse/preprocess/publish/commit/total 및 파이프라인 하위 단계)",
+    ["worker", "source", "stage"],
+    buckets=_STAGE_BUCKETS,
+)
+
+
+def start_metrics_server(port: Optional[int]) -> bool:
+    """
+    현재 프로세스의 /metrics HTTP 서버 기동
+
+    Returns:
+        기동 여부 (port 미지정 / prometheus_client 미설치 / 포트 충돌 시 False)
+    """
+    if port is None:
+        return False
+
+    if not _PROMETHEUS_AVAILABLE:
+        logger.warning("prometheus_client not installed, metrics disabled", extra={"port": port})
+        return False
+
+    try:
+        start_http_server(port)
+    except OSError as e:
+        logger.error("Metrics server start failed", extra={"port": port, "error": str(e)})
+        return False
+
+    logger.info("Metrics server started", extra={"port": port})
+    return True
@@ -0,0 +1,86 @@
+# src/infra/metrics/stage_timer.py
+
+"""
+처리 단계별 소요 시간 측정
+
+- worker / source 라벨은 contextvar로 전달 (파이프라인 하위 단계가 라벨을 몰라도 됨)
+- BaseKafkaWorker가 메시지 단위로 라벨을 설정하고,
+  각 파이프라인은 stage_timer("text.core") 처럼 단계명만 지정한다
+- 라벨 미설정 컨텍스트(gRPC 서버 스레드, 스크립트 등)는 "unknown"으로 기록
+- ProcessPool 자식 프로세스는 /metrics를 노출하지 않으므로 collect_stages로 측정값을 모아
+  결과와 함께 반환하고, 부모가 observe_stages로 자신의 라벨에 기록한다
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from infra.metrics.prometheus_metrics import STAGE_LATENCY_SECONDS
+
+_UNKNOWN = "unknown"
+
+# (worker, source)
+_stage_labels: ContextVar[Tuple[str, str]] = ContextVar(
+    "stage_labels",
+    default=(_UNKNOWN, _UNKNOWN),
+)
+
+# collect_stages 블록 내부 측정값 (stage, seconds), None이면 바로 기록
+_collected_stages: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar(
+    "collected_stages",
+    default=None,
+)
+
+
+@contextmanager
+def metric_labels(worker: str, source: Optional[str] = None) -> Iterator[None]:
+    """블록 내부 stage_timer의 worker/source 라벨 지정"""
+    token = _stage_labels.set((worker, source or _UNKNOWN))
+    try:
+        yield
+    finally:
+        _stage_labels.reset(token)
+
+
+def set_metric_source(source: str) -> None:
+    """현재 라벨의 source 갱신 (메시지 디코딩 후 source가 확정될 때)"""
+    worker, _ = _stage_labels.get()
+    _stage_labels.set((worker, source or _UNKNOWN))
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    """측정된 소요 시간 기록 (블록으로 감쌀 수 없는 비동기 완료 경로용)"""
+    collected = _collected_stages.get()
+    if collected is not None:
+        collected.append((stage, seconds))
+        return
+    worker, source = _stage_labels.get()
+    STAGE_LATENCY_SECONDS.labels(worker=worker, source=source, stage=stage).observe(seconds)
+
+
+def observe_stages(stages: Iterable[Tuple[str, float]]) -> None:
+    """다른 프로세스에서 수집된 측정값을 현재 라벨로 기록"""
+    for stage, seconds in stages:
+        observe_stage(stage, seconds)
+
+
+@contextmanager
+def collect_stages() -> Iterator[List[Tuple[str, float]]]:
+    """블록 내부 측정값을 기록하지 않고 목록으로 수집 (pool 자식 프로세스 → 부모 전달용)"""
+    stages: List[Tuple[str, float]] = []
+    token = _collected_stages.set(stages)
+    try:
+        yield stages
+    finally:
+        _collected_stages.reset(token)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """블록 소요 시간을 stage 히스토그램에 기록 (예외 발생 시에도 기록)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - started)
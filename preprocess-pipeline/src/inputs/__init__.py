@@ -5,9 +5,17 @@ from inputs.parse_kafka_jd_preprocess import (
     parse_kafka_jd_preprocess_message,
     MessageParseError,
 )
+from inputs.kafka_message_decoder import (
+    KafkaMessageDecoder,
+    DecodedKafkaMessage,
+    MessageDecodeError,
+)
 
 __all__ = [
     "KafkaJdPreprocessInput",
     "parse_kafka_jd_preprocess_message",
     "MessageParseError",
+    "KafkaMessageDecoder",
+    "DecodedKafkaMessage",
+    "MessageDecodeError",
 ]
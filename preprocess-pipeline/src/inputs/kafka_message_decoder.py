@@ -0,0 +1,239 @@
+# src/inputs/kafka_message_decoder.py
+
+"""
+Kafka outbox 메시지 디코더
+
+bytes → KafkaJdPreprocessInput 변환을 한 곳에서 수행한다.
+
+백엔드 (설치된 것 중 우선순위 순, KAFKA_JSON_DECODER로 강제 가능):
+- msgspec : bytes → typed struct 직접 디코딩 (dict 생성 없음)
+- orjson  : bytes → dict 디코딩 후 parse_kafka_jd_preprocess_message
+- json    : 표준 라이브러리 fallback
+
+Debezium outbox 이중 인코딩:
+- JsonConverter 사용 시 payload가 JSON string으로 한 번 더 래핑될 수 있음
+- 첫 번째 non-whitespace byte가 '"'이면 이중 인코딩으로 판단
+  (str 디코딩 후 재파싱하는 대신 바깥 문자열만 풀고 안쪽을 바로 디코딩)
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+from inputs.kafka_jd_preprocess_input import KafkaJdPreprocessInput
+from inputs.parse_kafka_jd_preprocess import (
+    build_kafka_jd_preprocess_input,
+    parse_kafka_jd_preprocess_message,
+    MessageParseError,
+)
+
+logger = logging.getLogger(__name__)
+
+_MSGSPEC_AVAILABLE = False
+_ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    _MSGSPEC_AVAILABLE = True
+except ImportError:
+    pass
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+_WHITESPACE = b" \t\r\n"
+_QUOTE = ord('"')
+
+
+class MessageDecodeError(ValueError):
+    """JSON 디코딩 실패 (재시도 의미 없음)"""
+    pass
+
+
+@dataclass
+class DecodedKafkaMessage:
+    """
+    디코딩된 Kafka 메시지
+
+    - jd_input: 스키마 검증 성공 시 입력 DTO
+    - parse_error: JSON은 정상이나 스키마 검증 실패 (fail 토픽 대상)
+    - request_id / source: 컨텍스트(로그, fail 토픽)용 원본 값
+    """
+
+    request_id: str
+    source: str
+    jd_input: Optional[KafkaJdPreprocessInput] = None
+    parse_error: Optional[MessageParseError] = None
+    kafka_meta: Dict[str, Any] = field(default_factory=dict)
+
+
+if _MSGSPEC_AVAILABLE:
+
+    class OutboxJdPreprocessMessage(msgspec.Struct, rename="camel"):
+        """
+        Spring JdPreprocessRequestMessage 스키마 (msgspec typed struct)
+
+        UNSET = 필드 누락 / None = null (dict 경로의 'key in message' 검사와 동일한 의미)
+        """
+
+        request_id: Union[str, None, msgspec.UnsetType] = msgspec.UNSET
+        brand_name: Union[str, None, msgspec.UnsetType] = msgspec.UNSET
+        position_name: Union[str, None, msgspec.UnsetType] = msgspec.UNSET
+        source: Union[str, None, msgspec.UnsetType] = msgspec.UNSET
+        text: Optional[str] = None
+        images: Union[List[str], str, None] = None
+        url: Optional[str] = None
+        source_url: Optional[str] = None
+        event_id: Optional[str] = None
+        occurred_at: Union[int, str, None] = None
+        version: Union[str, None, msgspec.UnsetType] = msgspec.UNSET
+
+    _OUTBOX_DECODER = msgspec.json.Decoder(OutboxJdPreprocessMessage)
+    _STR_DECODER = msgspec.json.Decoder(str)
+
+
+def _available_backends() -> List[str]:
+    backends = []
+    if _MSGSPEC_AVAILABLE:
+        backends.append("msgspec")
+    if _ORJSON_AVAILABLE:
+        backends.append("orjson")
+    backends.append("json")
+    return backends
+
+
+def _is_double_encoded(raw: bytes) -> bool:
+    """첫 번째 non-whitespace byte가 '"'인지 확인"""
+    for b in raw[:16]:
+        if b in _WHITESPACE:
+            continue
+        return b == _QUOTE
+    return raw.lstrip(_WHITESPACE)[:1] == b'"'
+
+
+class KafkaMessageDecoder:
+    """
+    Kafka outbox 메시지 디코더
+
+    책임:
+    - bytes 직접 디코딩 (utf-8 str 중간 생성 없음)
+    - 이중 인코딩 처리
+    - 스키마 검증 → KafkaJdPreprocessInput
+
+    비책임:
+    - 로깅/실패 발행 정책 (BaseKafkaWorker)
+    """
+
+    def __init__(self, backend: Optional[str] = None):
+        backend = (backend or os.getenv("KAFKA_JSON_DECODER") or _available_backends()[0]).lower()
+        if backend not in _available_backends():
+            logger.warning(
+                "Requested JSON decoder not available, falling back",
+                extra={"requested": backend, "available": _available_backends()},
+            )
+            backend = _available_backends()[0]
+        self.backend = backend
+
+    def decode(self, raw: Optional[bytes]) -> DecodedKafkaMessage:
+        """
+        Raises:
+            MessageDecodeError: JSON 자체가 잘못되었거나 최상위가 object가 아님
+        """
+        if not raw:
+            raise MessageDecodeError("Empty message value")
+
+        if self.backend == "msgspec":
+            return self._decode_msgspec(raw)
+
+        return self._decode_dict(self._loads(raw))
+
+    # ==================================================
+    # msgspec (typed struct)
+    # ==================================================
+
+    def _decode_msgspec(self, raw: bytes) -> DecodedKafkaMessage:
+        try:
+            if _is_double_encoded(raw):
+                raw = _STR_DECODER.decode(raw).encode("utf-8")
+            struct = _OUTBOX_DECODER.decode(raw)
+
+        except msgspec.ValidationError:
+            # JSON은 정상이나 타입 불일치 → dict 경로로 재디코딩해 requestId 확보 후 검증
+            return self._decode_dict(self._loads(raw))
+        except msgspec.DecodeError as e:
+            raise MessageDecodeError(str(e)) from e
+
+        request_id = struct.request_id if isinstance(struct.request_id, str) else "unknown"
+        source = struct.source.upper() if isinstance(struct.source, str) else "UNKNOWN"
+
+        try:
+            missing = [
+                name
+                for name, value in (
+                    ("requestId", struct.request_id),
+                    ("brandName", struct.brand_name),
+                    ("positionName", struct.position_name),
+                    ("source", struct.source),
+                )
+                if value is msgspec.UNSET
+            ]
+            if missing:
+                raise MessageParseError(f"Missing required fields: {', '.join(missing)}")
+
+            jd_input = build_kafka_jd_preprocess_input(
+                request_id=struct.request_id,
+                brand_name=struct.brand_name,
+                position_name=struct.position_name,
+                source_raw=struct.source,
+                text=struct.text,
+                raw_images=struct.images,
+                url=struct.url or struct.source_url,
+                event_id=struct.event_id,
+                occurred_at=struct.occurred_at,
+                version="1.0" if struct.version is msgspec.UNSET else struct.version,
+            )
+        except MessageParseError as e:
+            return DecodedKafkaMessage(request_id=request_id, source=source, parse_error=e)
+
+        return DecodedKafkaMessage(request_id=request_id, source=source, jd_input=jd_input)
+
+    # ==================================================
+    # orjson / json (dict)
+    # ==================================================
+
+    def _loads(self, raw: bytes) -> Any:
+        use_orjson = self.backend in ("orjson", "msgspec") and _ORJSON_AVAILABLE
+
+        try:
+            if use_orjson:
+                message = orjson.loads(raw)
+            else:
+                # json.loads(bytes)는 인코딩 감지 비용이 있어 utf-8로 직접 디코딩
+                message = json.loads(raw.decode("utf-8"))
+            if isinstance(message, str):
+                message = orjson.loads(message) if use_orjson else json.loads(message)
+        except (ValueError, TypeError) as e:
+            # orjson.JSONDecodeError / json.JSONDecodeError / UnicodeDecodeError 모두 ValueError 계열
+            raise MessageDecodeError(str(e)) from e
+
+        return message
+
+    def _decode_dict(self, message: Any) -> DecodedKafkaMessage:
+        if not isinstance(message, dict):
+            raise MessageDecodeError(f"Unexpected message type: {type(message).__name__}")
+
+        source_raw = message.get("source", "")
+        source = source_raw.upper() if isinstance(source_raw, str) else "UNKNOWN"
+        request_id = message.get("requestId", "unknown")
+
+        try:
+            jd_input = parse_kafka_jd_preprocess_message(message)
+        except MessageParseError as e:
+            return DecodedKafkaMessage(request_id=request_id, source=source, parse_error=e)
+
+        return DecodedKafkaMessage(request_id=request_id, source=source, jd_input=jd_input)
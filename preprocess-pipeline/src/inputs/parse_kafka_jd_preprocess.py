@@ -54,55 +54,14 @@ def parse_kafka_jd_preprocess_message(message: Dict[str, Any]) -> KafkaJdPreproc
         if missing:
             raise MessageParseError(f"Missing required fields: {', '.join(missing)}")
 
-        # source enum 변환
-        source_raw = message.get("source")
-        if not isinstance(source_raw, str) or not source_raw.strip():
-            raise MessageParseError("'source' must be a non-empty string")
-        source_str = source_raw.strip().upper()
-        try:
-            source = JobSource[source_str]
-        except KeyError:
-            raise MessageParseError(
-                f"Invalid source type: {source_str}. "
-                f"Expected one of: {[s.name for s in JobSource]}"
-            )
-
-        # 소스별 필수 필드 검증
-        text: Optional[str] = None
-        images: List[str] = []
-        url: Optional[str] = None
-
-        if source == JobSource.TEXT:
-            text = message.get("text")
-            if not text:
-                raise MessageParseError("'text' is required when source=TEXT")
-
-        elif source == JobSource.IMAGE:
-            raw_images = message.get("images")
-            if not raw_images:
-                raise MessageParseError("'images' is required when source=IMAGE")
-            if isinstance(raw_images, str):
-                images = [raw_images]
-            elif isinstance(raw_images, list):
-                images = raw_images
-            else:
-                raise MessageParseError(
-                    f"'images' must be string or list, got {type(raw_images).__name__}"
-                )
-
-        elif source == JobSource.URL:
-            url = message.get("url") or message.get("sourceUrl")
-            if not url:
-                raise MessageParseError("'url' or 'sourceUrl' is required when source=URL")
-
-        return KafkaJdPreprocessInput(
+        return build_kafka_jd_preprocess_input(
             request_id=message["requestId"],
             brand_name=message["brandName"],
             position_name=message["positionName"],
-            source=source,
-            text=text,
-            images=images,
-            url=url,
+            source_raw=message.get("source"),
+            text=message.get("text"),
+            raw_images=message.get("images"),
+            url=message.get("url") or message.get("sourceUrl"),
             event_id=message.get("eventId"),
             occurred_at=message.get("occurredAt"),
             version=message.get("version", "1.0"),
@@ -118,3 +77,77 @@ def parse_kafka_jd_preprocess_message(message: Dict[str, Any]) -> KafkaJdPreproc
             exc_info=True,
         )
         raise MessageParseError(f"Failed to parse message: {str(e)}") from e
+
+
+def build_kafka_jd_preprocess_input(
+    request_id: Any,
+    brand_name: Any,
+    position_name: Any,
+    source_raw: Any,
+    text: Any = None,
+    raw_images: Any = None,
+    url: Any = None,
+    event_id: Optional[str] = None,
+    occurred_at: Optional[int] = None,
+    version: Optional[str] = "1.0",
+) -> KafkaJdPreprocessInput:
+    """
+    필드 값으로부터 KafkaJdPreprocessInput 생성 (source / 소스별 필수 필드 검증)
+
+    dict 경로(parse_kafka_jd_preprocess_message)와
+    typed struct 경로(KafkaMessageDecoder)가 동일한 검증 규칙을 공유한다.
+
+    Raises:
+        MessageParseError: source 또는 소스별 필수 필드 오류
+    """
+    # source enum 변환
+    if not isinstance(source_raw, str) or not source_raw.strip():
+        raise MessageParseError("'source' must be a non-empty string")
+    source_str = source_raw.strip().upper()
+    try:
+        source = JobSource[source_str]
+    except KeyError:
+        raise MessageParseError(
+            f"Invalid source type: {source_str}. "
+            f"Expected one of: {[s.name for s in JobSource]}"
+        )
+
+    # 소스별 필수 필드 검증
+    images: List[str] = []
+
+    if source == JobSource.TEXT:
+        url = None
+        if not text:
+            raise MessageParseError("'text' is required when source=TEXT")
+
+    elif source == JobSource.IMAGE:
+        text = None
+        url = None
+        if not raw_images:
+            raise MessageParseError("'images' is required when source=IMAGE")
+        if isinstance(raw_images, str):
+            images = [raw_images]
+        elif isinstance(raw_images, list):
+            images = raw_images
+        else:
+            raise MessageParseError(
+                f"'images' must be string or list, got {type(raw_images).__name__}"
+            )
+
+    elif source == JobSource.URL:
+        text = None
+        if not url:
+            raise MessageParseError("'url' or 'sourceUrl' is required when source=URL")
+
+    return KafkaJdPreprocessInput(
+        request_id=request_id,
+        brand_name=brand_name,
+        position_name=position_name,
+        source=source,
+        text=text,
+        images=images,
+        url=url,
+        event_id=event_id,
+        occurred_at=occurred_at,
+        version=version,
+    )
@@ -3,27 +3,41 @@
 """
 Kafka 기반 Preprocess Pipeline Entry Point
 
-프로세스 배치 전략 (2-core 최적화):
-- OCR Process : CPU-bound (PaddleOCR) → 독립 프로세스, 1 core 점유
-- TEXT Process : CPU-bound (정규식/문자열) → 독립 프로세스, 1 core 점유
-  └─ URL Thread : I/O-bound (HTTP fetch) → TEXT 프로세스 내 스레드 (GIL 해제)
+프로세스 배치 전략:
+- OCR Process  : CPU-bound (PaddleOCR) → KAFKA_OCR_PROCESSES개 (기본 1)
+                 └─ 0번 프로세스만 OCR gRPC 서버 기동 (URL Worker → OCR IPC)
+                 └─ OCR_ENGINE_POOL_SIZE > 0이면 PaddleOCR 엔진 프로세스 pool (gRPC/Kafka Worker 공유)
+                 └─ gRPC 서버는 모델 로드 전에 기동, 로드 완료 시 health SERVING (readiness probe)
+- TEXT Process : CPU-bound (정규식/문자열) → KAFKA_TEXT_PROCESSES개
+- URL Process  : I/O-bound (HTTP fetch) → KAFKA_URL_PROCESSES개
+- 미지정 시 TEXT/URL 프로세스 수는 KAFKA_CONSUMER_CONCURRENCY
+  (TEXT ProcessPool 모드에서는 pool이 concurrency를 사용하므로 TEXT 프로세스 1개)
+- 같은 토픽의 프로세스들은 동일 consumer group에 참여하고 client_id만 다르다
+
+프로세스 감시 (ProcessSupervisor):
+- shutdown 전에 종료된 자식 프로세스는 지수 backoff로 재기동
+- 일정 시간 안정적으로 동작하면 backoff 초기화
 
 실패 처리:
 - 처리 실패 → fail 토픽 발행
 - fail 토픽 발행 실패 → 로컬 파일 백업
 - 무조건 commit (파이프라인 멈추지 않음)
 
+메트릭 (METRICS_ENABLED=true):
+- Worker 프로세스마다 /metrics 서버 기동 (METRICS_PORT_BASE + 프로세스 순번, 재기동 시 동일 포트)
+
 Graceful Shutdown:
 - SIGTERM/SIGINT → multiprocessing.Event 설정
-- 각 Worker 프로세스/스레드는 Event를 감지하고 현재 메시지 완료 후 종료
+- 각 Worker 프로세스는 Event를 감지하고 현재 메시지 완료 후 종료
 """
 
 import logging
 import multiprocessing
 import signal
-import threading
 import time
 import uuid
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
 
 from infra.config.kafka_config import (
     load_kafka_config,
@@ -31,6 +45,7 @@ from infra.config.kafka_config import (
     KafkaConnectionConfig,
     WorkerConfig,
 )
+from infra.config.metrics_config import load_metrics_config
 
 # ==================================================
 # Logging 설정 (메인 프로세스 전용, spawn re-import 방지)
@@ -49,6 +64,7 @@ def _init_process_logging():
     NOTE: 반드시 PaddleOCR 등 외부 라이브러리 import 이후에 호출해야 한다.
     ppocr은 import 시 자체 handler를 root logger에 등록하는데,
     setup_logging이 먼저 실행되면 ppocr import가 JSON handler를 덮어쓴다.
+    (OCR 프로세스는 paddleocr import가 엔진 로드 시점으로 미뤄져 있고, 로드 직후 ocr.engine이 재적용한다)
     """
     import sys
     try:
@@ -59,8 +75,15 @@ def _init_process_logging():
     setup_logging("DEBUG")
 
 
+def _start_process_metrics(metrics_port: Optional[int]) -> None:
+    """자식 프로세스 /metrics 서버 기동 (port None이면 비활성)"""
+    from infra.metrics import start_metrics_server
+    start_metrics_server(metrics_port)
+
+
 def _create_worker(factory, worker_cls, topic, consumer_group, poll_timeout_sec,
-                   result_topic, fail_topic, worker_config, client_id, shutdown_event):
+                   result_topic, fail_topic, worker_config, client_id, shutdown_event,
+                   **worker_kwargs):
     """Consumer/Producer/Worker 인스턴스 생성 (프로세스 내부 호출 전용)"""
     from infra.kafka.kafka_consumer import KafkaStreamConsumer
     from infra.kafka.kafka_producer import KafkaStreamProducer
@@ -73,12 +96,18 @@ def _create_worker(factory, worker_cls, topic, consumer_group, poll_timeout_sec,
         consumer=raw_consumer,
         topic=topic,
         poll_timeout_sec=poll_timeout_sec,
+        commit_interval_sec=worker_config.commit_interval_ms / 1000,
+        commit_threshold=worker_config.commit_threshold,
     )
 
     raw_producer = factory.create_producer(
         client_id=f"{client_id}-producer",
+        profile=worker_config.producer_profile,
+    )
+    producer = KafkaStreamProducer(
+        raw_producer,
+        max_pending_deliveries=worker_config.producer_profile.max_pending_deliveries,
     )
-    producer = KafkaStreamProducer(raw_producer)
 
     worker = worker_cls(
         consumer=consumer,
@@ -87,6 +116,7 @@ def _create_worker(factory, worker_cls, topic, consumer_group, poll_timeout_sec,
         fail_topic=fail_topic,
         config=worker_config,
         shutdown_event=shutdown_event,
+        **worker_kwargs,
     )
     return worker, producer
 
@@ -101,12 +131,16 @@ def _run_ocr_process(
     fail_topic: str,
     worker_config: WorkerConfig,
     client_id: str,
-    grpc_port: int = 50051,
+    grpc_port: Optional[int] = 50051,
+    metrics_port: Optional[int] = None,
+    grpc_health_port: Optional[int] = None,
 ) -> None:
     """
     OCR 전용 프로세스 (CPU-bound)
 
     PaddleOCR 모델이 CPU를 집중 사용하므로 독립 프로세스로 격리
+    grpc_port가 None이면 gRPC 서버 없이 Kafka Worker만 실행 (추가 OCR 프로세스)
+    grpc_health_port 지정 시 gRPC health 전용 포트 추가 기동 (readiness probe용)
     """
     # 수치 연산 라이브러리 스레드 제한 (PaddleOCR import 전에 설정 필수)
     # 미설정 시 코어 수만큼 스레드를 생성하여 다른 프로세스의 core를 침범
@@ -115,40 +149,31 @@ def _run_ocr_process(
     os.environ["OPENBLAS_NUM_THREADS"] = "1"
     os.environ["MKL_NUM_THREADS"] = "1"
 
-    # 1차: startup 로그를 보이게 하기 위해 import 전에 logging 먼저 설정
     _init_process_logging()
     proc_logger = logging.getLogger(f"process.ocr.{client_id}")
-    proc_logger.info("Loading OCR engine (PaddleOCR model init)", extra={"proc":"ocr"})
 
     from infra.kafka.kafka_client_factory import KafkaClientFactory
     from worker.ocr_kafka_worker import OcrKafkaWorker
+    from ocr.engine_pool import get_ocr_engine, shutdown_ocr_engine
+    from ocr.grpc.ocr_server import OcrGrpcServer
 
-    # 2차: ppocr이 import/init 시 root logger를 건드릴 수 있으므로 재적용
-    setup_logging("DEBUG")
-    logging.disable(logging.NOTSET)
-
-    # PaddleOCR은 첫 .ocr() 호출 시 모델 weight를 lazy load하면서
-    # logging.disable() 등을 내부에서 호출한다.
-    # worker.run() 전에 빈 이미지로 워밍업을 강제하여 모델 로드를 완료시키고,
-    # 그 이후 logging을 재적용하면 worker 실행 중 로그가 보존된다.
-    proc_logger.info("Warming up PaddleOCR model", extra={"proc":"ocr"})
-    try:
-        import numpy as np
-        from ocr.engine import _ocr as _paddle_ocr
-        _dummy = np.zeros((64, 64, 3), dtype=np.uint8)
-        _paddle_ocr.ocr(_dummy)
-    except Exception:
-        pass
-
-    # 3차: 모델 로드 완료 후 logging 최종 재적용
-    setup_logging("DEBUG")
-    logging.disable(logging.NOTSET)
-    proc_logger.info("OCR engine ready", extra={"proc":"ocr"})
+    _start_process_metrics(metrics_port)
 
-    from ocr.grpc.ocr_server import OcrGrpcServer
+    # 모델 로드 전에 gRPC 서버 기동 (로드 완료 전까지 health NOT_SERVING → readiness probe 실패)
+    grpc_server = None
+    if grpc_port is not None:
+        grpc_server = OcrGrpcServer(port=grpc_port, health_port=grpc_health_port)
+        grpc_server.start()
 
-    grpc_server = OcrGrpcServer(port=grpc_port)
-    grpc_server.start()
+    # PaddleOCR 모델 로드 + 빈 이미지 1회 추론 (로드 직후 logging 재적용은 엔진이 수행)
+    # (엔진 pool 모드는 엔진 프로세스 전체 기동 + 각자 모델 로드까지 대기)
+    # 실패해도 Worker는 기동하고, 첫 OCR 요청에서 로드를 재시도한다
+    proc_logger.info("Loading OCR engine (PaddleOCR model init)", extra={"proc":"ocr"})
+    try:
+        get_ocr_engine().warmup()
+        proc_logger.info("OCR engine ready", extra={"proc":"ocr"})
+    except Exception as e:
+        proc_logger.warning("OCR engine warmup failed", extra={"proc":"ocr", "error": str(e)})
 
     try:
         factory = KafkaClientFactory(connection_config)
@@ -164,7 +189,9 @@ def _run_ocr_process(
     except Exception as e:
         proc_logger.error("Process crashed", exc_info=True, extra={"proc":"ocr", "error": str(e)})
     finally:
-        grpc_server.stop()
+        if grpc_server is not None:
+            grpc_server.stop()
+        shutdown_ocr_engine()
         try:
             producer.close()
         except Exception:
@@ -172,78 +199,106 @@ def _run_ocr_process(
         proc_logger.info("Process exiting", extra={"proc":"ocr"})
 
 
-def _run_text_url_process(
+def _run_text_process(
     shutdown_event: multiprocessing.Event,
     connection_config: KafkaConnectionConfig,
-    text_topic: str,
-    url_topic: str,
+    topic: str,
     consumer_group: str,
     poll_timeout_sec: float,
     result_topic: str,
     fail_topic: str,
     worker_config: WorkerConfig,
-    text_client_id: str,
-    url_client_id: str,
+    client_id: str,
+    text_pool_size: int = 1,
+    metrics_port: Optional[int] = None,
 ) -> None:
     """
-    TEXT + URL 혼합 프로세스
-
-    - TEXT Worker: 메인 스레드 (CPU-bound)
-    - URL Worker:  별도 스레드 (I/O-bound, HTTP 대기 중 GIL 해제)
+    TEXT 전용 프로세스 (CPU-bound)
 
-    동일 프로세스 내에서 Producer를 공유하여 리소스 절약
-    (confluent-kafka Producer는 thread-safe)
+    - text_pool_enabled 시 ProcessPool(text_pool_size)로 전처리 병렬 실행
     """
     _init_process_logging()
-    proc_logger = logging.getLogger(f"process.text_url")
+    _start_process_metrics(metrics_port)
+    proc_logger = logging.getLogger(f"process.text.{client_id}")
 
     from infra.kafka.kafka_client_factory import KafkaClientFactory
     from worker.text_kafka_worker import TextKafkaWorker
-    from worker.url_kafka_worker import UrlKafkaWorker
+    from worker.text_kafka_pool_worker import TextKafkaPoolWorker
 
+    producer = None
     try:
         factory = KafkaClientFactory(connection_config)
 
-        # URL Worker (스레드로 실행, I/O-bound)
-        url_worker, url_producer = _create_worker(
-            factory, UrlKafkaWorker, url_topic, consumer_group, poll_timeout_sec,
-            result_topic, fail_topic, worker_config, url_client_id, shutdown_event,
-        )
+        if worker_config.text_pool_enabled:
+            worker, producer = _create_worker(
+                factory, TextKafkaPoolWorker, topic, consumer_group, poll_timeout_sec,
+                result_topic, fail_topic, worker_config, client_id, shutdown_event,
+                pool_size=text_pool_size,
+            )
+        else:
+            worker, producer = _create_worker(
+                factory, TextKafkaWorker, topic, consumer_group, poll_timeout_sec,
+                result_topic, fail_topic, worker_config, client_id, shutdown_event,
+            )
 
-        url_thread = threading.Thread(
-            target=url_worker.run,
-            name="url-worker-thread",
-            daemon=True,
-        )
-        url_thread.start()
-        proc_logger.info("URL worker thread started")
+        worker.run()
 
-        # TEXT Worker (메인 스레드, CPU-bound)
-        text_worker, text_producer = _create_worker(
-            factory, TextKafkaWorker, text_topic, consumer_group, poll_timeout_sec,
-            result_topic, fail_topic, worker_config, text_client_id, shutdown_event,
-        )
+    except KeyboardInterrupt:
+        proc_logger.info("Process interrupted", extra={"proc":"text"})
+    except Exception as e:
+        proc_logger.error("Process crashed", exc_info=True, extra={"proc":"text", "error": str(e)})
+    finally:
+        if producer is not None:
+            try:
+                producer.close()
+            except Exception:
+                pass
+        proc_logger.info("Process exiting", extra={"proc":"text"})
+
+
+def _run_url_process(
+    shutdown_event: multiprocessing.Event,
+    connection_config: KafkaConnectionConfig,
+    topic: str,
+    consumer_group: str,
+    poll_timeout_sec: float,
+    result_topic: str,
+    fail_topic: str,
+    worker_config: WorkerConfig,
+    client_id: str,
+    metrics_port: Optional[int] = None,
+) -> None:
+    """
+    URL 전용 프로세스 (I/O-bound, HTTP fetch / Playwright)
+    """
+    _init_process_logging()
+    _start_process_metrics(metrics_port)
+    proc_logger = logging.getLogger(f"process.url.{client_id}")
+
+    from infra.kafka.kafka_client_factory import KafkaClientFactory
+    from worker.url_kafka_worker import UrlKafkaWorker
 
-        text_worker.run()
+    producer = None
+    try:
+        factory = KafkaClientFactory(connection_config)
+        worker, producer = _create_worker(
+            factory, UrlKafkaWorker, topic, consumer_group, poll_timeout_sec,
+            result_topic, fail_topic, worker_config, client_id, shutdown_event,
+        )
 
-        # TEXT 종료 후 URL 스레드 대기
-        url_thread.join(timeout=worker_config.shutdown_timeout_sec)
+        worker.run()
 
     except KeyboardInterrupt:
-        proc_logger.info("Process interrupted", extra={"proc":"text_url"})
+        proc_logger.info("Process interrupted", extra={"proc":"url"})
     except Exception as e:
-        proc_logger.error(
-            "Process crashed",
-            exc_info=True,
-            extra={"proc":"text_url", "error": str(e)},
-        )
+        proc_logger.error("Process crashed", exc_info=True, extra={"proc":"url", "error": str(e)})
     finally:
-        for p in [text_producer, url_producer]:
+        if producer is not None:
             try:
-                p.close()
+                producer.close()
             except Exception:
                 pass
-        proc_logger.info("Process exiting", extra={"proc":"text_url"})
+        proc_logger.info("Process exiting", extra={"proc":"url"})
 
 
 def _run_embedding_server() -> None:
@@ -274,6 +329,128 @@ def _run_embedding_server() -> None:
     )
 
 
+# ==================================================
+# Process Supervisor
+# ==================================================
+_RESTART_BACKOFF_BASE_SEC = 1.0
+_RESTART_BACKOFF_MAX_SEC = 60.0
+_RESTART_STABLE_SEC = 60.0
+
+
+@dataclass
+class WorkerProcessSpec:
+    """감시 대상 자식 프로세스 정의 (재기동 시 동일 인자로 재생성)"""
+
+    name: str
+    target: Callable
+    args: tuple = ()
+
+
+class ProcessSupervisor:
+    """
+    자식 프로세스 감시자 (메인 프로세스 전용)
+
+    - shutdown 요청 전에 종료된 프로세스는 exit code와 무관하게 재기동
+      (Worker 프로세스는 crash 시에도 예외를 삼키고 정상 종료할 수 있음)
+    - 연속 crash 시 backoff: base * 2^n (최대 max)
+    - stable_sec 이상 동작 후 종료되면 backoff 초기화
+    """
+
+    def __init__(
+        self,
+        specs: List[WorkerProcessSpec],
+        shutdown_event: multiprocessing.Event,
+        backoff_base_sec: float = _RESTART_BACKOFF_BASE_SEC,
+        backoff_max_sec: float = _RESTART_BACKOFF_MAX_SEC,
+        stable_sec: float = _RESTART_STABLE_SEC,
+    ):
+        self._specs = {spec.name: spec for spec in specs}
+        self._shutdown_event = shutdown_event
+        self._backoff_base_sec = backoff_base_sec
+        self._backoff_max_sec = backoff_max_sec
+        self._stable_sec = stable_sec
+
+        self._processes: Dict[str, multiprocessing.Process] = {}
+        self._started_at: Dict[str, float] = {}
+        self._restart_count: Dict[str, int] = {name: 0 for name in self._specs}
+        self._restart_at: Dict[str, float] = {}
+
+    def start_all(self) -> None:
+        for name in self._specs:
+            self._start(name)
+        logger.info("All worker processes running", extra={"process_count": len(self._specs)})
+
+    def _start(self, name: str) -> None:
+        spec = self._specs[name]
+        p = multiprocessing.Process(
+            target=spec.target,
+            args=spec.args,
+            name=spec.name,
+            daemon=False,
+        )
+        p.start()
+        self._processes[name] = p
+        self._started_at[name] = time.monotonic()
+        logger.info("Worker process started", extra={"process_name": name, "child_pid": p.pid})
+
+    def run(self, check_interval_sec: float = 1.0) -> None:
+        """shutdown 요청 시까지 자식 프로세스 감시 + 재기동"""
+        while not self._shutdown_event.is_set():
+            now = time.monotonic()
+
+            for name, p in self._processes.items():
+                if p.is_alive():
+                    continue
+
+                if name not in self._restart_at:
+                    self._schedule_restart(name, p, now)
+                elif now >= self._restart_at[name]:
+                    del self._restart_at[name]
+                    self._start(name)
+
+            time.sleep(check_interval_sec)
+
+    def _schedule_restart(self, name: str, p: multiprocessing.Process, now: float) -> None:
+        uptime = now - self._started_at[name]
+        if uptime >= self._stable_sec:
+            self._restart_count[name] = 0
+
+        delay = min(
+            self._backoff_base_sec * (2 ** self._restart_count[name]),
+            self._backoff_max_sec,
+        )
+        self._restart_count[name] += 1
+        self._restart_at[name] = now + delay
+
+        logger.warning(
+            "Worker process stopped unexpectedly, scheduling restart",
+            extra={
+                "process_name": name,
+                "exit_code": p.exitcode,
+                "uptime_sec": round(uptime, 1),
+                "restart_count": self._restart_count[name],
+                "restart_delay_sec": delay,
+            },
+        )
+
+    def join_all(self, timeout_sec: float) -> None:
+        """자식 프로세스 종료 대기 (timeout 초과 시 terminate)"""
+        for p in self._processes.values():
+            p.join(timeout=timeout_sec)
+            if p.is_alive():
+                logger.warning(
+                    "Process did not finish in time, terminating",
+                    extra={"process_name": p.name, "child_pid": p.pid},
+                )
+                p.terminate()
+                p.join(timeout=5)
+            else:
+                logger.info(
+                    "Process finished",
+                    extra={"process_name": p.name, "exit_code": p.exitcode},
+                )
+
+
 def main():
     """메인 진입점"""
     logger.info("Preprocess Pipeline starting")
@@ -283,6 +460,7 @@ def main():
     # ==================================================
     kafka_config = load_kafka_config()
     worker_config = load_kafka_worker_config()
+    metrics_config = load_metrics_config()
 
     logger.info(
         "Config loaded",
@@ -294,6 +472,10 @@ def main():
             "result_topic": kafka_config.result_topic,
             "fail_topic": kafka_config.fail_topic,
             "consumer_group": kafka_config.consumer_group,
+            "consumer_concurrency": kafka_config.consumer_concurrency,
+            "text_pool_enabled": worker_config.text_pool_enabled,
+            "work_queue_size": worker_config.work_queue_size,
+            "metrics_enabled": metrics_config.enabled,
         },
     )
 
@@ -308,6 +490,8 @@ def main():
     # ==================================================
     import os
     ocr_grpc_port = int(os.environ.get("OCR_GRPC_PORT", "50051"))
+    # gRPC health 전용 포트 (OCR 요청 부하와 무관하게 readiness probe 응답, 0이면 메인 포트 health만)
+    ocr_grpc_health_port = int(os.environ.get("OCR_GRPC_HEALTH_PORT", "50052")) or None
 
     # ==================================================
     # Shutdown Event (프로세스 간 공유)
@@ -315,55 +499,95 @@ def main():
     shutdown_event = multiprocessing.Event()
 
     # ==================================================
-    # 프로세스 배치 (2-core 최적화)
+    # 프로세스 배치
     #
-    # Process 1: OCR (CPU-bound, 1 core)
-    # Process 2: TEXT (CPU-bound, 메인 스레드)
-    #            └─ URL (I/O-bound, 스레드)
-    # Process 3: Embedding Server (I/O-bound, FastAPI)
+    # OCR  x ocr_processes  (CPU-bound, 0번만 gRPC 서버)
+    # TEXT x text_processes (CPU-bound)
+    # URL  x url_processes  (I/O-bound)
+    # Embedding Server x 1  (I/O-bound, FastAPI)
     # ==================================================
-    embedding_process = multiprocessing.Process(
-        target=_run_embedding_server,
-        name="embedding-process",
-        daemon=False,
-    )
+    text_processes = kafka_config.text_processes
+    if text_processes is None:
+        # ProcessPool 모드는 pool 크기로 concurrency를 사용
+        text_processes = 1 if worker_config.text_pool_enabled else kafka_config.consumer_concurrency
+    url_processes = kafka_config.url_processes
+    if url_processes is None:
+        url_processes = kafka_config.consumer_concurrency
 
-    ocr_process = multiprocessing.Process(
-        target=_run_ocr_process,
-        args=(
-            shutdown_event,
-            kafka_config.connection,
-            kafka_config.ocr_topic,
-            kafka_config.consumer_group,
-            kafka_config.poll_timeout_sec,
-            kafka_config.result_topic,
-            kafka_config.fail_topic,
-            worker_config,
-            f"ocr-consumer-{instance_id}",
-            ocr_grpc_port,
-        ),
-        name="ocr-process",
-        daemon=False,
+    logger.info(
+        "Process layout resolved",
+        extra={
+            "ocr_processes": kafka_config.ocr_processes,
+            "text_processes": text_processes,
+            "url_processes": url_processes,
+        },
     )
 
-    text_url_process = multiprocessing.Process(
-        target=_run_text_url_process,
-        args=(
-            shutdown_event,
-            kafka_config.connection,
-            kafka_config.text_topic,
-            kafka_config.url_topic,
-            kafka_config.consumer_group,
-            kafka_config.poll_timeout_sec,
-            kafka_config.result_topic,
-            kafka_config.fail_topic,
-            worker_config,
-            f"text-consumer-{instance_id}",
-            f"url-consumer-{instance_id}",
-        ),
-        name="text-url-process",
-        daemon=False,
-    )
+    specs: List[WorkerProcessSpec] = []
+
+    for i in range(kafka_config.ocr_processes):
+        specs.append(WorkerProcessSpec(
+            name=f"ocr-process-{i}",
+            target=_run_ocr_process,
+            args=(
+                shutdown_event,
+                kafka_config.connection,
+                kafka_config.ocr_topic,
+                kafka_config.consumer_group,
+                kafka_config.poll_timeout_sec,
+                kafka_config.result_topic,
+                kafka_config.fail_topic,
+                worker_config,
+                f"ocr-consumer-{instance_id}-{i}",
+                ocr_grpc_port if i == 0 else None,
+                metrics_config.port_for(len(specs)),
+                ocr_grpc_health_port if i == 0 else None,
+            ),
+        ))
+
+    for i in range(text_processes):
+        specs.append(WorkerProcessSpec(
+            name=f"text-process-{i}",
+            target=_run_text_process,
+            args=(
+                shutdown_event,
+                kafka_config.connection,
+                kafka_config.text_topic,
+                kafka_config.consumer_group,
+                kafka_config.poll_timeout_sec,
+                kafka_config.result_topic,
+                kafka_config.fail_topic,
+                worker_config,
+                f"text-consumer-{instance_id}-{i}",
+                kafka_config.consumer_concurrency,
+                metrics_config.port_for(len(specs)),
+            ),
+        ))
+
+    for i in range(url_processes):
+        specs.append(WorkerProcessSpec(
+            name=f"url-process-{i}",
+            target=_run_url_process,
+            args=(
+                shutdown_event,
+                kafka_config.connection,
+                kafka_config.url_topic,
+                kafka_config.consumer_group,
+                kafka_config.poll_timeout_sec,
+                kafka_config.result_topic,
+                kafka_config.fail_topic,
+                worker_config,
+                f"url-consumer-{instance_id}-{i}",
+                metrics_config.port_for(len(specs)),
+            ),
+        ))
+
+    specs.append(WorkerProcessSpec(
+        name="embedding-process",
+        target=_run_embedding_server,
+    ))
+
+    supervisor = ProcessSupervisor(specs, shutdown_event)
 
     # ==================================================
     # Shutdown 핸들러 (메인 프로세스)
@@ -377,26 +601,12 @@ def main():
     signal.signal(signal.SIGINT, shutdown_handler)
 
     # ==================================================
-    # 프로세스 시작
+    # 프로세스 시작 + 감시 (crash 시 backoff 재기동)
     # ==================================================
-    processes = [ocr_process, text_url_process, embedding_process]
-
-    for p in processes:
-        p.start()
-        logger.info("Worker process started", extra={"process_name": p.name, "child_pid": p.pid})
-
-    logger.info("All worker processes running")
+    supervisor.start_all()
 
-    # ==================================================
-    # 메인 프로세스 대기
-    # ==================================================
     try:
-        while not shutdown_event.is_set():
-            alive_count = sum(1 for p in processes if p.is_alive())
-            if alive_count == 0:
-                logger.warning("All worker processes have stopped unexpectedly")
-                break
-            time.sleep(1)
+        supervisor.run()
 
     except KeyboardInterrupt:
         logger.info("KeyboardInterrupt received")
@@ -406,21 +616,7 @@ def main():
     # 프로세스 종료 대기
     # ==================================================
     logger.info("Waiting for worker processes to finish")
-
-    for p in processes:
-        p.join(timeout=worker_config.shutdown_timeout_sec)
-        if p.is_alive():
-            logger.warning(
-                "Process did not finish in time, terminating",
-                extra={"process_name": p.name, "child_pid": p.pid},
-            )
-            p.terminate()
-            p.join(timeout=5)
-        else:
-            logger.info(
-                "Process finished",
-                extra={"process_name": p.name, "exit_code": p.exitcode},
-            )
+    supervisor.join_all(timeout_sec=worker_config.shutdown_timeout_sec)
 
     logger.info("Preprocess Pipeline stopped")
 
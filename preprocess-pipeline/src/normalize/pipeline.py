@@ -1,11 +1,12 @@
 from normalize.text import normalize_text
 from normalize.char import normalize_chars
 from normalize.line import normalize_line
+from ocr.line_batch import OcrLineBatch
 
 
-def normalize_lines(lines: list[dict]) -> list[dict]:
+def normalize_lines(lines: OcrLineBatch) -> OcrLineBatch:
     """
-    OCR 결과 line 리스트에 대해 텍스트 정규화 파이프라인을 적용한다.
+    OCR 결과 라인 묶음에 대해 텍스트 정규화 파이프라인을 적용한다. (제자리 수정)
 
     이 함수의 역할:
     - OCR 엔진 종류와 무관하게 동작한다.
@@ -24,10 +25,8 @@ def normalize_lines(lines: list[dict]) -> list[dict]:
     - JD 도메인 해석
     """
 
-    result = []
-
-    for line in lines:
-        original_text = line.get("text", "")
+    for index in lines.indices():
+        original_text = lines.texts[index]
 
         # 문서 공통 정규화
         # - Unicode NFKC
@@ -43,13 +42,11 @@ def normalize_lines(lines: list[dict]) -> list[dict]:
         # - 의미 없는 라인 제거
         # - 단일 특수문자, 잡음 라인 필터링
         if normalize_line({"text": text}) is None:
+            lines.drop(index)
             continue
 
         # 텍스트만 교체하고
         # 나머지 메타데이터(confidence, bbox, height 등)는 그대로 유지
-        result.append({
-            **line,
-            "text": text
-        })
+        lines.texts[index] = text
 
-    return result
+    return lines
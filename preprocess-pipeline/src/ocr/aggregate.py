@@ -0,0 +1,78 @@
+"""
+이미지 단위 OCR 결과 → 요청 단위 결과 집계 (+ 요청 이미지 경로 정규화)
+
+ocr.pipeline(OCR 프로세스)과 OcrGrpcClient(TEXT/URL 프로세스)가 공유한다.
+PaddleOCR 등 OCR 엔진 의존성을 import하지 않는다.
+"""
+
+from typing import Iterable
+
+from ocr.confidence import OcrConfidenceStatus, classify_confidence
+
+
+def normalize_image_paths(image_input) -> list[str]:
+    """요청 이미지 입력(쉼표 구분 문자열 / 목록) → 공백·빈 값을 제거한 경로 목록 (서버/클라이언트 공통 기준)"""
+    paths: list[str] = []
+    if isinstance(image_input, str):
+        paths = image_input.split(",")
+    elif isinstance(image_input, list):
+        for item in image_input:
+            if not item:
+                continue
+            if isinstance(item, str) and "," in item:
+                paths.extend(item.split(","))
+            else:
+                paths.append(str(item))
+    return [p.strip() for p in paths if p and p.strip()]
+
+
+def aggregate_image_results(image_results: Iterable[tuple[str, dict]]) -> dict:
+    """
+    (path, 이미지 결과) 목록을 입력 순서대로 합친다.
+
+    Returns:
+        {rawText, lines, confidence, status, scales, angleCls, errors}
+        - confidence: 신뢰도 > 0 인 이미지들의 평균
+        - scales / angleCls: 성공 이미지별 업스케일 배율 / 방향 분류 경로
+        - errors: 실패 이미지별 {"path", "error"}
+        - status: deadline 만료/취소로 처리하지 못한 이미지("deadlineExceeded")가 있으면
+                  PARTIAL (처리된 이미지의 신뢰도 기준 FAIL이면 그대로 FAIL)
+    """
+    aggregated_raw_texts = []
+    aggregated_lines = []
+    confidences = []
+    scales = []
+    angle_cls_paths = []
+    errors = []
+    deadline_exceeded = False
+
+    for path, result in image_results:
+        if result.get("error"):
+            errors.append({"path": path, "error": result["error"]})
+            deadline_exceeded = deadline_exceeded or bool(result.get("deadlineExceeded"))
+            continue
+
+        if result["rawText"]:
+            aggregated_raw_texts.append(result["rawText"])
+        if result["lines"]:
+            aggregated_lines.extend(result["lines"])
+        if result["confidence"] > 0:
+            confidences.append(result["confidence"])
+        scales.append(result.get("scale"))
+        angle_cls_paths.append(result.get("angleCls"))
+
+    final_raw_text = "\n\n".join(aggregated_raw_texts)
+    final_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+    final_status = classify_confidence(final_confidence)
+    if deadline_exceeded and final_status is not OcrConfidenceStatus.FAIL:
+        final_status = OcrConfidenceStatus.PARTIAL
+
+    return {
+        "rawText": final_raw_text,
+        "lines": aggregated_lines,
+        "confidence": final_confidence,
+        "status": final_status.value,
+        "scales": scales,
+        "angleCls": angle_cls_paths,
+        "errors": errors,
+    }
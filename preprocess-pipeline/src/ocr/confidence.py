@@ -9,6 +9,8 @@ class OcrConfidenceStatus(Enum):
     GOOD = "GOOD"
     RETRY = "RETRY"
     FAIL = "FAIL"
+    # 요청 deadline 만료/취소로 일부 이미지만 처리됨 (classify_confidence 결과 아님, ocr.aggregate가 지정)
+    PARTIAL = "PARTIAL"
 
 
 def classify_confidence(confidence: float) -> OcrConfidenceStatus:
@@ -0,0 +1,82 @@
+"""
+OCR 요청 마감 시각 (deadline) / 취소
+
+책임:
+- gRPC 요청의 남은 시간(context.time_remaining)과 취소 여부(context.is_active)를
+  OCR 파이프라인 → 엔진(pool 자식 프로세스 포함)까지 전달
+- 이미지/타일/recognition 단계 사이에서 확인해 만료 시 남은 작업 포기 (OcrDeadlineExceeded)
+
+설계 원칙:
+- 만료 시각은 wall clock(time.time) 기준 (pool 자식 프로세스에서도 같은 값으로 비교)
+- 취소 확인 함수는 pickle 불가 → 자식 프로세스에는 시간 조건만 전달 (detached)
+- deadline 없는 호출(OcrKafkaWorker 등)은 None을 넘기며 동작 변화 없음
+"""
+
+import time
+from typing import Callable, Optional
+
+# 응답 전송/수신 여유분 (클라이언트 timeout 직전에 부분 결과를 돌려줄 시간)
+_GRPC_MARGIN_SEC = 0.5
+
+
+class OcrDeadlineExceeded(Exception):
+    """OCR 요청 마감 시각 초과 또는 요청 취소"""
+
+
+class OcrDeadline:
+    """
+    - expires_at  : 만료 시각 (time.time 기준, None이면 시간 제한 없음)
+    - is_cancelled: 요청 취소 여부 확인 함수 (None이면 취소 없음)
+    """
+
+    __slots__ = ("expires_at", "_is_cancelled")
+
+    def __init__(
+            self,
+            timeout_sec: Optional[float] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None,
+    ):
+        self.expires_at = time.time() + timeout_sec if timeout_sec is not None else None
+        self._is_cancelled = is_cancelled
+
+    @classmethod
+    def from_grpc_context(cls, context, margin_sec: float = _GRPC_MARGIN_SEC) -> "OcrDeadline":
+        """gRPC 서버 context → deadline (클라이언트가 timeout을 지정하지 않았으면 취소만 확인)"""
+        remaining = context.time_remaining()
+        timeout_sec = max(0.0, remaining - margin_sec) if remaining is not None else None
+        return cls(timeout_sec, is_cancelled=lambda: not context.is_active())
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간(초), 시간 제한이 없으면 None"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.time())
+
+    def reason(self) -> Optional[str]:
+        """만료 사유 (cancelled | deadline exceeded), 유효하면 None"""
+        if self._is_cancelled is not None and self._is_cancelled():
+            return "cancelled"
+        if self.expires_at is not None and time.time() >= self.expires_at:
+            return "deadline exceeded"
+        return None
+
+    def expired(self) -> bool:
+        return self.reason() is not None
+
+    def check(self) -> None:
+        """만료/취소 시 OcrDeadlineExceeded"""
+        reason = self.reason()
+        if reason is not None:
+            raise OcrDeadlineExceeded(reason)
+
+    def detached(self) -> "OcrDeadline":
+        """시간 조건만 남긴 사본 (pool 자식 프로세스 전달용, pickle 가능)"""
+        copy = OcrDeadline()
+        copy.expires_at = self.expires_at
+        return copy
+
+
+def check_deadline(deadline: Optional[OcrDeadline]) -> None:
+    """deadline이 있으면 만료 확인 (None 허용 편의 함수)"""
+    if deadline is not None:
+        deadline.check()
@@ -1,50 +1,345 @@
-from paddleocr import PaddleOCR
+"""
+PaddleOCR 엔진 (프로세스 내 1개)
+
+책임:
+- PaddleOCR 인스턴스 라이프사이클 (PaddleOcrLifecycle)
+  - 첫 사용 시 로드 (이 모듈 import 시점에는 paddleocr도 import하지 않음)
+  - 로드 = paddleocr import + 모델 생성 + 빈 이미지 1회 추론 + logging 재적용
+  - 상태(NOT_LOADED / LOADING / READY / FAILED)는 lock 없이 조회 가능 (gRPC readiness probe)
+- OCR 실행 (run_ocr / run_ocr_batch)
+
+모델 디렉터리 (OcrConfig.model_dir):
+- 지정 시 {model_dir}/det, /rec, /cls inference 모델 사용
+- 경로에 모델이 없으면 PaddleOCR이 첫 기동 시 그 경로로 다운로드 → 이후 기동은 디스크 재사용
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from enum import Enum
+from importlib import metadata
+from typing import Any, Iterator, Optional, TypedDict
+
 import numpy as np
-from typing import TypedDict
 
+from infra.config.ocr_config import OcrConfig, load_ocr_config
+from infra.metrics import stage_timer
+from ocr.deadline import OcrDeadline, check_deadline
 
-_ocr = PaddleOCR(
-    lang="korean",
-    use_angle_cls=True,
-)
+logger = logging.getLogger(__name__)
 
-class OCRLine(TypedDict):
-    text: str
-    confidence: float
-    box: np.ndarray | list | None
-    height: float | None
+_OCR_LANG = "korean"
+_OCR_CONFIG = load_ocr_config()
+_REC_BATCH_NUM = _OCR_CONFIG.rec_batch_num
+
+# 방향 분류기 정책 (OcrConfig.angle_cls)
+_ANGLE_CLS_MODES = ("auto", "always", "off")
+_ANGLE_CLS_MODE = _OCR_CONFIG.angle_cls
+if _ANGLE_CLS_MODE not in _ANGLE_CLS_MODES:
+    raise ValueError(f"invalid OCR_ANGLE_CLS: {_ANGLE_CLS_MODE} (expected one of {_ANGLE_CLS_MODES})")
+_USE_ANGLE_CLS = _ANGLE_CLS_MODE != "off"
+# auto 모드에서 이미지별로 먼저 분류해 보는 crop 수 (가로로 긴 crop 우선, 짧은 crop은 분류 신뢰도가 낮음)
+_ORIENTATION_SAMPLES = 4
+
+
+def _paddleocr_version() -> str:
+    try:
+        return metadata.version("paddleocr")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+# OCR 결과 캐시 키에 포함 (엔진 버전/모델 설정이 바뀌면 기존 캐시 무효)
+ENGINE_VERSION = f"paddleocr-{_paddleocr_version()}:{_OCR_LANG}:cls={_ANGLE_CLS_MODE}"
 
 class OCRResult(TypedDict):
-    raw: list[OCRLine]
+    """
+    이미지 1장 OCR 결과 (라인 단위 컬럼 배열, 인덱스 i가 같은 라인)
+
+    - texts : strip 완료, 빈 문자열 없음
+    - scores: (N,) float64, 0~100
+    - boxes : (N,4,2) float32 polygon (이미지 px 좌표)
+    """
+    texts: list[str]
+    scores: np.ndarray
+    boxes: np.ndarray
     confidence: float
+    # 방향 분류 경로: "full"(전체 crop 분류) | "sampled"(샘플만 분류, 뒤집힘 없음) | "off"(미분류)
+    angle_cls: str
+
+
+class EngineState(Enum):
+    NOT_LOADED = "NOT_LOADED"
+    LOADING = "LOADING"
+    READY = "READY"
+    FAILED = "FAILED"
+
+
+class PaddleOcrLifecycle:
+    """
+    프로세스 내 PaddleOCR 인스턴스 1개의 생성/조회
+
+    - PaddleOCR 인스턴스는 thread-safe 보장이 없으므로 acquire()로 lock을 잡고 사용
+      (gRPC 스레드 / Kafka Worker 호출 직렬화, 로드도 같은 lock 안에서 1회만)
+    - 엔진 pool 모드의 부모 프로세스는 acquire하지 않으므로 모델을 로드하지 않는다
+    - 로드 실패 시 FAILED, 다음 acquire에서 재시도
+    """
+
+    def __init__(self, options: dict):
+        self._options = options
+        self._lock = threading.Lock()
+        self._ocr: Any = None
+        self._state = EngineState.NOT_LOADED
+
+    @property
+    def state(self) -> EngineState:
+        return self._state
+
+    @property
+    def ready(self) -> bool:
+        return self._state is EngineState.READY
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        """로드된 PaddleOCR 인스턴스 (with 블록 동안 독점)"""
+        with self._lock:
+            yield self._load_locked()
+
+    def warmup(self) -> None:
+        """실제 요청 전에 로드를 끝내 둔다 (이미 로드되어 있으면 no-op)"""
+        with self.acquire():
+            pass
+
+    def _load_locked(self) -> Any:
+        if self._ocr is not None:
+            return self._ocr
+
+        self._state = EngineState.LOADING
+        started = time.perf_counter()
+        try:
+            from paddleocr import PaddleOCR
+
+            ocr = PaddleOCR(**self._options)
+            # PaddleOCR은 첫 .ocr() 호출 시 모델 weight를 lazy load하므로 빈 이미지로 1회 추론
+            ocr.ocr(np.zeros((64, 64, 3), dtype=np.uint8))
+        except Exception:
+            self._state = EngineState.FAILED
+            raise
+        finally:
+            _restore_logging()
+
+        self._ocr = ocr
+        self._state = EngineState.READY
+        logger.info(
+            "PaddleOCR engine loaded",
+            extra={
+                "elapsed_sec": round(time.perf_counter() - started, 2),
+                "model_dir": _OCR_CONFIG.model_dir or "default",
+                "enable_mkldnn": _OCR_CONFIG.enable_mkldnn,
+            },
+        )
+        return ocr
+
+
+def _build_engine_options(config: OcrConfig) -> dict:
+    options = {
+        "lang": _OCR_LANG,
+        "use_angle_cls": _USE_ANGLE_CLS,
+        "rec_batch_num": config.rec_batch_num,
+        "enable_mkldnn": config.enable_mkldnn,
+        "cpu_threads": config.cpu_threads,
+    }
+    if config.model_dir:
+        options["det_model_dir"] = f"{config.model_dir}/det"
+        options["rec_model_dir"] = f"{config.model_dir}/rec"
+        options["cls_model_dir"] = f"{config.model_dir}/cls"
+    return options
+
+
+def _restore_logging() -> None:
+    # ppocr은 import / 모델 로드 중 root logger 교체 및 logging.disable을 호출하므로 로드 직후 재적용
+    from utils.logger import setup_logging
+
+    setup_logging("DEBUG")
+    logging.disable(logging.NOTSET)
+
+
+_ENGINE = PaddleOcrLifecycle(_build_engine_options(_OCR_CONFIG))
+
+
+def warmup_engine() -> None:
+    _ENGINE.warmup()
+
+
+def engine_state() -> EngineState:
+    return _ENGINE.state
+
 
 def run_ocr(image: np.ndarray) -> OCRResult:
-    result = _ocr.ocr(image)
+    return run_ocr_batch([image])[0]
 
-    # 2.x 반환 구조:
-    # result = [ [[[x1,y1],[x2,y2],[x3,y3],[x4,y4]], ("text", score)], ... ] ]
-    if not result or not result[0]:
-        return {
-            "raw": [],
-            "confidence": 0.0,
-        }
 
-    lines: list[OCRLine] = []
-    confidences: list[float] = []
+def run_ocr_batch(images: list[np.ndarray], deadline: Optional[OcrDeadline] = None) -> list[OCRResult]:
+    """
+    여러 이미지(타일) OCR, 입력 순서대로 결과 반환
 
-    for line in result[0]:
-        if not line or len(line) < 2:
-            continue
+    PaddleOCR.ocr(det+rec)과 같은 단계를 수행하되
+    - detection: 이미지별
+    - angle cls / recognition: 전체 이미지의 text 영역 crop을 모아 한 번에
+      (rec_batch_num 단위 배치가 이미지 경계에서 끊기지 않음)
+    - angle cls는 OcrConfig.angle_cls 정책에 따라 필요한 crop만 (_classify_orientation)
 
-        box = line[0]
-        text_info = line[1]
+    deadline: 이미지(타일) detection / angle cls / recognition 시작 전마다 확인
+              만료 시 OcrDeadlineExceeded (엔진 lock을 바로 반환, 다음 요청이 대기하지 않음)
+
+    단계 소요 시간: ocr.detect(이미지별) / ocr.angle_cls / ocr.recognize
+                  (엔진 pool 자식 프로세스에서는 수집되어 부모가 기록)
+    """
+    if not images:
+        return []
+
+    with _ENGINE.acquire() as engine:
+        # paddleocr 패키지가 import 시 등록하는 내부 모듈 (PaddleOCR.ocr 내부 단계와 동일한 함수 사용)
+        from tools.infer.predict_system import sorted_boxes
+        from tools.infer.utility import get_minarea_rect_crop, get_rotate_crop_image
+
+        crop = get_rotate_crop_image if engine.args.det_box_type == "quad" else get_minarea_rect_crop
+        boxes_per_image = []
+        crops_per_image = []
+        for image in images:
+            # lock 대기 중 만료된 경우 포함
+            check_deadline(deadline)
+            with stage_timer("ocr.detect"):
+                dt_boxes, _ = engine.text_detector(image)
+            if dt_boxes is None or len(dt_boxes) == 0:
+                boxes_per_image.append([])
+                crops_per_image.append([])
+                continue
+
+            dt_boxes = sorted_boxes(dt_boxes)
+            boxes_per_image.append(dt_boxes)
+            crops_per_image.append([crop(image, box.copy()) for box in dt_boxes])
+
+        check_deadline(deadline)
+        with stage_timer("ocr.angle_cls"):
+            angle_cls_paths = _classify_orientation(engine, crops_per_image)
+
+        crops = [crop_image for image_crops in crops_per_image for crop_image in image_crops]
+        rec_res = []
+        if crops:
+            check_deadline(deadline)
+            with stage_timer("ocr.recognize"):
+                rec_res, _ = engine.text_recognizer(crops)
+
+    results = []
+    offset = 0
+    for dt_boxes, angle_cls in zip(boxes_per_image, angle_cls_paths):
+        image_rec_res = rec_res[offset:offset + len(dt_boxes)]
+        offset += len(dt_boxes)
+        results.append(_to_ocr_result(dt_boxes, image_rec_res, engine.drop_score, angle_cls))
+    return results
+
+
+def _classify_orientation(engine: Any, crops_per_image: list[list[np.ndarray]]) -> list[str]:
+    """
+    방향 분류기로 뒤집힌(180도) crop을 바로 세운다 (crops_per_image를 제자리 수정)
+
+    auto 모드:
+    1) 이미지별 샘플 crop(_ORIENTATION_SAMPLES개)만 분류
+    2) 샘플 중 뒤집힌 crop이 있는 이미지만 나머지 crop 분류
+    → JD 스크린샷/배너처럼 대부분 정방향인 이미지는 crop 대부분의 분류를 생략
+
+    Returns:
+        이미지별 분류 경로 ("full" | "sampled" | "off")
+    """
+    if not _USE_ANGLE_CLS or not engine.use_angle_cls:
+        return ["off"] * len(crops_per_image)
+
+    if _ANGLE_CLS_MODE == "always":
+        _run_angle_classifier(engine, crops_per_image, [list(range(len(crops))) for crops in crops_per_image])
+        return ["full" if crops else "off" for crops in crops_per_image]
+
+    samples = [_sample_crop_indices(crops) for crops in crops_per_image]
+    rotated = _run_angle_classifier(engine, crops_per_image, samples)
+
+    rest = []
+    for crops, sample, suspected in zip(crops_per_image, samples, rotated):
+        sampled = set(sample)
+        rest.append([i for i in range(len(crops)) if i not in sampled] if suspected else [])
+    _run_angle_classifier(engine, crops_per_image, rest)
+
+    paths = []
+    for crops, sample, suspected in zip(crops_per_image, samples, rotated):
+        if not crops:
+            paths.append("off")
+        elif suspected or len(sample) == len(crops):
+            paths.append("full")
+        else:
+            paths.append("sampled")
+    return paths
 
-        if not text_info or len(text_info) < 2:
-            continue
 
-        text = text_info[0]
-        score = text_info[1]
+def _sample_crop_indices(crops: list[np.ndarray]) -> list[int]:
+    if len(crops) <= _ORIENTATION_SAMPLES:
+        return list(range(len(crops)))
+    widths = [crop_image.shape[1] / max(crop_image.shape[0], 1) for crop_image in crops]
+    return sorted(np.argsort(widths)[-_ORIENTATION_SAMPLES:].tolist())
 
+
+def _run_angle_classifier(
+        engine: Any,
+        crops_per_image: list[list[np.ndarray]],
+        selections: list[list[int]],
+) -> list[bool]:
+    """
+    선택된 crop만 한 번에 분류하고, 분류기가 회전시킨 crop으로 교체
+
+    Returns:
+        이미지별 뒤집힌 crop 감지 여부 (분류기 회전 기준과 동일: "180" & score > cls_thresh)
+    """
+    flat = [
+        (image_index, crop_index)
+        for image_index, indices in enumerate(selections)
+        for crop_index in indices
+    ]
+    rotated = [False] * len(crops_per_image)
+    if not flat:
+        return rotated
+
+    classified, cls_res, _ = engine.text_classifier(
+        [crops_per_image[image_index][crop_index] for image_index, crop_index in flat]
+    )
+    for (image_index, crop_index), crop_image, (label, score) in zip(flat, classified, cls_res):
+        crops_per_image[image_index][crop_index] = crop_image
+        if "180" in label and score > engine.args.cls_thresh:
+            rotated[image_index] = True
+    return rotated
+
+
+def _to_ocr_result(
+        boxes: Any,
+        rec_res: list,
+        drop_score: float = 0.0,
+        angle_cls: str = "off",
+) -> OCRResult:
+    """
+    detection box + recognition 결과 (text, score) → OCRResult
+
+    boxes[i] ↔ rec_res[i] (PaddleOCR 2.x 라인 결과와 동일 순서)
+    - drop_score 미만 / 빈 텍스트 / score 변환 불가 라인 제외
+    - polygon은 (N,4,2) float32 배열 하나로 변환
+      (det_box_type="poly"의 다각형은 외접 사각형으로 변환, 하위 단계는 box min/max만 사용)
+    """
+    texts: list[str] = []
+    scores: list[float] = []
+    kept_boxes: list[np.ndarray] = []
+
+    for box, rec in zip(boxes, rec_res):
+        if not rec or len(rec) < 2:
+            continue
+
+        text, score = rec[0], rec[1]
         if not text:
             continue
 
@@ -56,31 +351,38 @@ def run_ocr(image: np.ndarray) -> OCRResult:
             score = float(score)
         except (TypeError, ValueError):
             continue
+        if score < drop_score:
+            continue
 
-        height = None
-        try:
-            box_arr = np.array(box)
-            if box_arr.ndim == 2 and box_arr.shape[1] == 2:
-                ys = box_arr[:, 1]
-                height = float(max(ys) - min(ys))
-        except Exception:
-            height = None
+        texts.append(text)
+        scores.append(score)
+        kept_boxes.append(_as_quad(box))
 
-        lines.append({
-            "text": text,
-            "confidence": score * 100.0,
-            "box": box,
-            "height": height
-        })
+    if not texts:
+        return empty_ocr_result(angle_cls)
 
-        confidences.append(score)
+    return {
+        "texts": texts,
+        "scores": np.asarray(scores, dtype=np.float64) * 100.0,
+        "boxes": np.stack(kept_boxes),
+        "confidence": sum(scores) / len(scores) * 100.0,
+        "angle_cls": angle_cls,
+    }
+
+
+def _as_quad(box: Any) -> np.ndarray:
+    points = np.asarray(box, dtype=np.float32).reshape(-1, 2)
+    if points.shape[0] == 4:
+        return points
+    (x1, y1), (x2, y2) = points.min(axis=0), points.max(axis=0)
+    return np.array([[x1, y1], [x2, y1], [x2, y2], [x1, y2]], dtype=np.float32)
 
-    avg_confidence = (
-        sum(confidences) / len(confidences)
-        if confidences else 0.0
-    )
 
+def empty_ocr_result(angle_cls: str = "off") -> OCRResult:
     return {
-        "raw": lines,
-        "confidence": avg_confidence * 100.0
+        "texts": [],
+        "scores": np.zeros(0, dtype=np.float64),
+        "boxes": np.zeros((0, 4, 2), dtype=np.float32),
+        "confidence": 0.0,
+        "angle_cls": angle_cls,
     }
@@ -0,0 +1,245 @@
+"""
+OCR 엔진 실행기
+
+책임:
+- 프로세스 내 OCR 호출(gRPC 서버 스레드 / OcrKafkaWorker)이 공유하는 단일 진입점
+- 엔진 구성 2종
+  - InProcessOcrEngine: 현재 프로세스의 PaddleOCR 1개 (lock으로 직렬화)
+  - OcrEnginePool     : N개 자식 프로세스가 각자 PaddleOCR 인스턴스 보유, 공용 작업 큐로 분배
+- 자식 프로세스 비정상 종료(BrokenProcessPool) 시 pool 재생성
+- 요청 deadline 만료/취소 시 결과 대기 중단 (OcrDeadlineExceeded)
+- 엔진 프로세스의 단계 소요 시간(ocr.detect 등)은 결과와 함께 반환받아 호출 프로세스에 기록
+
+설정:
+- OCR_ENGINE_POOL_SIZE (OcrConfig.engine_pool_size)
+  0이면 InProcessOcrEngine, 1 이상이면 해당 개수의 엔진 프로세스
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from infra.config.ocr_config import load_ocr_config
+from infra.metrics import collect_stages, observe_stages
+from ocr.deadline import OcrDeadline, OcrDeadlineExceeded
+from ocr.engine import EngineState, OCRResult, engine_state, run_ocr_batch, warmup_engine
+
+logger = logging.getLogger(__name__)
+
+# deadline 지정 시 결과 대기 중 만료/취소 확인 주기 (gRPC 취소는 시각으로 알 수 없어 polling)
+_DEADLINE_POLL_SEC = 0.2
+
+
+# ==================================================
+# Pool 자식 프로세스 전용 (spawn 시 모듈 재import)
+# ==================================================
+def _init_engine_process() -> None:
+    """자식 프로세스 초기화: PaddleOCR 모델 로드 (logging 재적용은 엔진 로드 과정에 포함)"""
+    warmup_engine()
+
+
+def _engine_process_pid() -> int:
+    return os.getpid()
+
+
+# (결과, 예외, 단계별 소요 시간)
+_BatchOutcome = Tuple[Optional[List[OCRResult]], Optional[Exception], List[Tuple[str, float]]]
+
+
+def _run_ocr_batch_in_pool(images: list[np.ndarray], deadline: Optional[OcrDeadline]) -> _BatchOutcome:
+    """
+    자식 프로세스 배치 OCR
+
+    자식 프로세스는 /metrics를 노출하지 않으므로 단계 소요 시간은 수집만 해서 결과와 함께 반환
+    (실패도 예외 대신 반환값으로 전달해 측정값을 잃지 않음)
+    """
+    with collect_stages() as stages:
+        try:
+            return run_ocr_batch(images, deadline), None, stages
+        except Exception as e:
+            return None, e, stages
+
+
+class InProcessOcrEngine:
+    """현재 프로세스의 PaddleOCR 1개 (run_ocr_batch 내부 lock으로 직렬화)"""
+
+    parallelism = 1
+
+    @property
+    def ready(self) -> bool:
+        return engine_state() is EngineState.READY
+
+    def run_many(self, images: list[np.ndarray], deadline: Optional[OcrDeadline] = None) -> list[OCRResult]:
+        return run_ocr_batch(images, deadline)
+
+    def warmup(self) -> None:
+        warmup_engine()
+
+    def shutdown(self) -> None:
+        pass
+
+
+class OcrEnginePool:
+    """
+    OCR 엔진 프로세스 pool
+
+    - 이미지(ndarray)는 pickle로 자식 프로세스에 전달된다
+    - 같은 pool을 여러 스레드가 동시에 사용할 수 있다 (작업 큐 공유)
+    - run_many 이미지 목록은 최대 parallelism개 연속 묶음으로 나눠 프로세스별 배치 OCR
+    - 입력 순서대로 결과 반환
+    - deadline: 자식 프로세스에는 시간 조건만 전달 (단계 사이에서 스스로 중단)
+                호출 스레드는 만료/취소 시 시작 전 묶음을 취소하고 진행 중 묶음은 기다리지 않는다
+    """
+
+    def __init__(self, size: int):
+        self.parallelism = max(1, size)
+        self._lock = threading.Lock()
+        self._ready = False
+        self._executor = self._create_executor()
+
+    @property
+    def ready(self) -> bool:
+        """전체 엔진 프로세스 모델 로드 완료 여부 (pool 재생성 중에는 False)"""
+        return self._ready
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.parallelism,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_engine_process,
+        )
+
+    def run_many(self, images: list[np.ndarray], deadline: Optional[OcrDeadline] = None) -> list[OCRResult]:
+        executor = self._executor
+        child_deadline = deadline.detached() if deadline is not None else None
+        try:
+            futures = [
+                executor.submit(_run_ocr_batch_in_pool, chunk, child_deadline)
+                for chunk in _split_chunks(images, self.parallelism)
+            ]
+            if deadline is not None:
+                try:
+                    _wait_within_deadline(futures, deadline)
+                except OcrDeadlineExceeded:
+                    # 이미 끝난 묶음의 측정값은 기록
+                    for future in futures:
+                        if _finished_normally(future):
+                            observe_stages(future.result()[2])
+                    raise
+            outcomes = [future.result() for future in futures]
+        except BrokenProcessPool:
+            self._recreate(executor)
+            raise
+
+        for _, _, stages in outcomes:
+            observe_stages(stages)
+        for _, error, _ in outcomes:
+            if error is not None:
+                raise error
+        return [result for results, _, _ in outcomes for result in results]
+
+    def warmup(self) -> None:
+        """엔진 프로세스 전체 기동 + 모델 로드 완료까지 대기 (spawn pool은 프로세스를 요청 시 생성)"""
+        executor = self._executor
+        futures = [executor.submit(_engine_process_pid) for _ in range(self.parallelism)]
+        wait(futures)
+        pids = sorted({future.result() for future in futures})
+        if executor is self._executor:
+            self._ready = True
+        logger.info("OCR engine pool ready", extra={"pool_size": self.parallelism, "pids": pids})
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _recreate(self, broken: ProcessPoolExecutor) -> None:
+        # 여러 스레드가 동시에 broken을 감지해도 한 번만 재생성
+        with self._lock:
+            if self._executor is not broken:
+                return
+            logger.error(
+                "OCR engine pool broken, recreating",
+                extra={"pool_size": self.parallelism},
+            )
+            self._ready = False
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._create_executor()
+
+        # 새 엔진 프로세스 모델 로드는 백그라운드에서 (완료 시 ready 복귀)
+        threading.Thread(target=self._rewarm, name="ocr-engine-rewarm", daemon=True).start()
+
+    def _rewarm(self) -> None:
+        try:
+            self.warmup()
+        except Exception as e:
+            logger.error("OCR engine pool rewarm failed", extra={"error": str(e)})
+
+
+def _wait_within_deadline(futures: list, deadline: OcrDeadline) -> None:
+    """전체 완료(또는 실패)까지 대기, 그 전에 만료/취소되면 남은 작업 취소 후 OcrDeadlineExceeded"""
+    pending = futures
+    while pending:
+        reason = deadline.reason()
+        if reason is not None:
+            for future in pending:
+                future.cancel()
+            raise OcrDeadlineExceeded(reason)
+        remaining = deadline.remaining()
+        timeout = _DEADLINE_POLL_SEC if remaining is None else min(_DEADLINE_POLL_SEC, remaining)
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_EXCEPTION)
+        # 자식 예외는 반환값으로 전달되므로 FIRST_EXCEPTION만으로는 실패를 알 수 없음
+        if any(not _finished_normally(future) or future.result()[1] is not None for future in done):
+            return
+
+
+def _finished_normally(future) -> bool:
+    """완료되었고 취소/pool 예외 없이 자식 결과(_BatchOutcome)를 받은 작업"""
+    return future.done() and not future.cancelled() and future.exception() is None
+
+
+def _split_chunks(items: list, count: int) -> list[list]:
+    """items를 순서 유지한 채 최대 count개의 연속 묶음으로 균등 분할"""
+    count = min(count, len(items))
+    if count <= 0:
+        return []
+    size, extra = divmod(len(items), count)
+    chunks = []
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+OcrEngine = Union[InProcessOcrEngine, OcrEnginePool]
+
+_engine: Optional[OcrEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_ocr_engine() -> OcrEngine:
+    """프로세스 공용 OCR 엔진 (첫 호출 시 OcrConfig.engine_pool_size 기준으로 생성)"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            pool_size = load_ocr_config().engine_pool_size
+            _engine = OcrEnginePool(pool_size) if pool_size > 0 else InProcessOcrEngine()
+            logger.info(
+                "OCR engine created",
+                extra={"engine": type(_engine).__name__, "parallelism": _engine.parallelism},
+            )
+        return _engine
+
+
+def shutdown_ocr_engine() -> None:
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.shutdown()
+            _engine = None
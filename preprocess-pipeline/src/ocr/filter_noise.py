@@ -1,11 +1,12 @@
 from common.section.loader import load_jd_meta_keywords
+from ocr.line_batch import OcrLineBatch
 
 def filter_ocr_noise_lines(
-        lines,
+        lines: OcrLineBatch,
         noise_keywords
-):
+) -> OcrLineBatch:
     """
-    JD 처리 단계에서 '의미/도메인 관점의 노이즈'를 제거한다.
+    JD 처리 단계에서 '의미/도메인 관점의 노이즈'를 제거한다. (제자리 수정)
 
     이 함수의 책임:
     - JD 문서로서 의미 없는 라인 제거
@@ -15,18 +16,16 @@ def filter_ocr_noise_lines(
     - JD 본문과 무관한 시스템 문장
     """
 
-    # JD 의미 필터를 통과한 라인만 누적
-    result: list[dict] = []
-
     # JD 필요 데이터 로드
     meta_keywords = load_jd_meta_keywords()
 
     # JD 처리 대상 라인 순회
-    for line in lines:
+    for index in lines.indices():
 
         # 라인 텍스트 추출 및 공백 제거
-        text = line["text"].strip()
+        text = lines.texts[index].strip()
         if not text:
+            lines.drop(index)
             continue
 
         # 키워드 매칭을 위한 소문자 변환
@@ -34,19 +33,15 @@ def filter_ocr_noise_lines(
 
         # #  JD 메타 라인은 무조건 통과
         if any(k in text_lower for k in meta_keywords):
-            result.append(line)
             continue
 
         #  ️UI / 메타 / boilerplate 키워드 포함 여부 검사
         # → JD 본문과 무관한 문장 제거
         if _is_noise_line(text, noise_keywords):
-            continue
-
-        # JD 의미 기준을 통과한 라인만 추가
-        result.append(line)
+            lines.drop(index)
 
-    # JD noise 제거가 완료된 라인 목록 반환
-    return result
+    # JD noise 제거가 완료된 라인 묶음 반환
+    return lines
 
 def _is_noise_line(text: str, noise_keywords: dict[str, set[str]]) -> bool:
     text_lower = text.lower().strip()
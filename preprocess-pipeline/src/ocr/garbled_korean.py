@@ -30,6 +30,43 @@ GARBLED_PATTERNS = [
     re.compile(r"[ㄱ-ㅎㅏ-ㅣ]{2,}"),        # ㅇㅆ, ㄱㅏ
 ]
 
+# =========================
+# 판별용 사전 컴파일 (import 시 1회)
+# =========================
+# 헤더 키워드 포함 여부: 공백 제거 + 소문자 키워드를 하나의 alternation으로
+_HEADER_KEYWORD_PATTERN = re.compile(
+    "|".join(
+        re.escape(kw)
+        for kw in sorted({kw.replace(" ", "").lower() for kw in JD_HEADER_KEYWORDS}, key=len, reverse=True)
+    )
+)
+
+# 깨짐 패턴 중 하나라도 있는지: 한 번의 search
+_GARBLED_PATTERN = re.compile("|".join(f"(?:{pattern.pattern})" for pattern in GARBLED_PATTERNS))
+
+# 특수문자로 세지 않는 문장부호
+_ALLOWED_PUNCTUATION = frozenset(":-,.()/▶")
+
+
+def _count_char_classes(text: str) -> tuple[int, int, int]:
+    """
+    한 번의 순회로 문자 종류별 개수 계산
+
+    반환: (한글 음절 수, 대문자 수, 특수문자 수)
+    - 한글 음절은 나머지 두 종류에 속하지 않음 (대소문자 없음, alnum)
+    - 대문자와 특수문자는 겹칠 수 있음 (예: Ⓐ는 isupper이지만 alnum 아님 → 둘 다 집계)
+    """
+    korean = upper = special = 0
+    for c in text:
+        if '가' <= c <= '힣':
+            korean += 1
+            continue
+        if c.isupper():
+            upper += 1
+        if not (c.isalnum() or c.isspace() or c in _ALLOWED_PUNCTUATION):
+            special += 1
+    return korean, upper, special
+
 
 def is_garbled_korean(text: str) -> bool:
     """
@@ -42,20 +79,16 @@ def is_garbled_korean(text: str) -> bool:
     if len(text) < 2:
         return True
 
-    compact = text.replace(" ", "").lower()
-
     # 0️⃣ JD 헤더 / 메타는 무조건 보호
-    for kw in JD_HEADER_KEYWORDS:
-        if kw.replace(" ", "").lower() in compact:
-            return False
+    if _HEADER_KEYWORD_PATTERN.search(text.replace(" ", "").lower()):
+        return False
 
     # 1️⃣ 명백한 깨짐 패턴
-    for pattern in GARBLED_PATTERNS:
-        if pattern.search(text):
-            return True
+    if _GARBLED_PATTERN.search(text):
+        return True
 
     # 2️⃣ 한글 비율 계산
-    korean_chars = sum(1 for c in text if '가' <= c <= '힣')
+    korean_chars, upper_count, special_chars = _count_char_classes(text)
     total_chars = len(text)
 
     if korean_chars == 0:
@@ -64,23 +97,18 @@ def is_garbled_korean(text: str) -> bool:
     korean_ratio = korean_chars / total_chars
 
     # 3️⃣ 짧은 텍스트 (≤ 12자)
-    if len(text) <= 12:
+    if total_chars <= 12:
         if korean_ratio > 0.9 and not KOREAN_PARTICLE_PATTERN.search(text):
             return True
 
-        upper_count = sum(1 for c in text if c.isupper())
         if korean_ratio >= 0.7 and upper_count == 1:
             return True
 
     # 4️⃣ 중간 길이 (13 ~ 30자)
-    elif 13 <= len(text) <= 30:
+    elif total_chars <= 30:
         if korean_ratio > 0.8 and not KOREAN_PARTICLE_PATTERN.search(text):
             return True
 
-        special_chars = sum(
-            1 for c in text
-            if not (c.isalnum() or c.isspace() or c in ":-,.()/▶")
-        )
         if special_chars / total_chars > 0.3:
             return True
 
@@ -88,10 +116,8 @@ def is_garbled_korean(text: str) -> bool:
     else:
         if korean_chars >= 50:
             return False
-        
-        has_particles = KOREAN_PARTICLE_PATTERN.search(text)
 
-        if korean_ratio > 0.9 and not has_particles:
+        if korean_ratio > 0.9 and not KOREAN_PARTICLE_PATTERN.search(text):
             return True
 
     return False
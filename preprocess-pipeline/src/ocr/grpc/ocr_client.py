@@ -1,12 +1,14 @@
 # src/ocr/grpc/ocr_client.py
 
-import json
 import logging
+from typing import Iterator, Optional
 
 import grpc
 
+from ocr.aggregate import aggregate_image_results, normalize_image_paths
 from ocr.grpc import ocr_service_pb2
 from ocr.grpc import ocr_service_pb2_grpc
+from ocr.grpc.ocr_line_codec import image_result_from_proto
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,10 @@ _DEFAULT_PORT = 50051
 _DEFAULT_TIMEOUT_SEC = 60
 
 
+class OcrGrpcDeadlineExceeded(RuntimeError):
+    """OCR gRPC 호출 deadline 초과 (서버 응답 전 클라이언트 timeout)"""
+
+
 class OcrGrpcClient:
     """
     OCR gRPC 클라이언트
@@ -28,58 +34,97 @@ class OcrGrpcClient:
     - 섹션 파싱 ❌
     """
 
-    def __init__(self, host: str = _DEFAULT_HOST, port: int = _DEFAULT_PORT):
+    def __init__(
+            self,
+            host: str = _DEFAULT_HOST,
+            port: int = _DEFAULT_PORT,
+            timeout_sec: float = _DEFAULT_TIMEOUT_SEC,
+    ):
         self._channel = grpc.insecure_channel(f"{host}:{port}")
         self._stub = ocr_service_pb2_grpc.OcrServiceStub(self._channel)
+        self._timeout_sec = timeout_sec
         logger.debug(
-            "[OCR_GRPC_CLIENT] initialized | target=%s:%d", host, port
+            "[OCR_GRPC_CLIENT] initialized | target=%s:%d | timeout_sec=%s", host, port, timeout_sec
         )
 
-    def run_ocr(self, images: list[str], timeout_sec: int = _DEFAULT_TIMEOUT_SEC) -> dict:
+    def run_ocr(self, images: list[str], timeout_sec: Optional[float] = None) -> dict:
         """
         OCR 프로세스에 OCR 실행을 위임하고 결과를 반환.
 
+        RunOcrStream으로 이미지별 결과를 받아 합친다.
+        (수신/proto 디코딩이 서버의 다음 이미지 OCR과 겹침, lines JSON 직렬화 없음)
+
+        deadline(timeout_sec, 기본: 생성 시 지정값)은 서버에 전달되어
+        만료 시 서버는 남은 이미지를 OCR하지 않고 응답한다 → status PARTIAL.
+        서버 응답보다 클라이언트 timeout이 먼저 나도 수신한 이미지까지 PARTIAL로 반환한다.
+
         Returns:
             process_ocr_input()과 동일한 구조:
-            {rawText, lines, confidence, status, errors}
+            {rawText, lines, confidence, status, scales, errors}
 
         Raises:
-            RuntimeError: gRPC 호출 실패 시
+            RuntimeError: gRPC 호출 실패 시 (deadline 초과 제외)
+        """
+        # 서버와 같은 기준으로 정규화 (빈 값 제거 / 쉼표 분리) → 미수신 이미지를 순서로 대응
+        images = normalize_image_paths(images)
+        received = []
+        try:
+            for item in self.run_ocr_stream(images, timeout_sec):
+                received.append(item)
+        except OcrGrpcDeadlineExceeded as e:
+            logger.warning(
+                "[OCR_GRPC_CLIENT] RunOcrStream deadline exceeded | received=%d | image_count=%d",
+                len(received), len(images),
+            )
+            # 결과를 받지 못한 이미지는 서버 deadline 초과 응답과 같은 형태로 채움
+            received.extend(
+                (path, {"error": f"{e}: image not received", "deadlineExceeded": True})
+                for path in images[len(received):]
+            )
+        result = aggregate_image_results(received)
+
+        logger.debug(
+            "[OCR_GRPC_CLIENT] RunOcrStream response | status=%s | line_count=%d",
+            result["status"],
+            len(result["lines"]),
+        )
+        return result
+
+    def run_ocr_stream(
+            self,
+            images: list[str],
+            timeout_sec: Optional[float] = None,
+    ) -> Iterator[tuple[str, dict]]:
         """
+        이미지별 (path, 결과)를 입력 순서대로 수신 즉시 반환.
+
+        timeout_sec(기본: 생성 시 지정값)은 스트림 전체(마지막 이미지 수신까지)에 적용된다.
+
+        Raises:
+            OcrGrpcDeadlineExceeded: timeout_sec 초과 (이미 반환된 이미지 결과는 유효)
+            RuntimeError: gRPC 호출 실패 시 (이미 반환된 이미지 결과는 유효)
+        """
+        if timeout_sec is None:
+            timeout_sec = self._timeout_sec
         request = ocr_service_pb2.OcrRequest(images=images)
 
         logger.debug(
-            "[OCR_GRPC_CLIENT] RunOcr called | image_count=%d", len(images)
+            "[OCR_GRPC_CLIENT] RunOcrStream called | image_count=%d", len(images)
         )
 
+        responses = self._stub.RunOcrStream(request, timeout=timeout_sec)
         try:
-            response = self._stub.RunOcr(request, timeout=timeout_sec)
+            for message in responses:
+                yield image_result_from_proto(message)
         except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                raise OcrGrpcDeadlineExceeded(f"OCR gRPC deadline exceeded | timeout_sec={timeout_sec}") from e
             raise RuntimeError(
                 f"OCR gRPC call failed | code={e.code()} | detail={e.details()}"
             ) from e
-
-        lines = json.loads(response.lines_json) if response.lines_json else []
-        errors = []
-        for raw in response.errors:
-            try:
-                errors.append(json.loads(raw))
-            except Exception:
-                errors.append({"error": raw})
-
-        logger.debug(
-            "[OCR_GRPC_CLIENT] RunOcr response | status=%s | line_count=%d",
-            response.status,
-            len(lines),
-        )
-
-        return {
-            "status": response.status,
-            "confidence": response.confidence,
-            "rawText": response.raw_text,
-            "lines": lines,
-            "errors": errors,
-        }
+        finally:
+            # 소비 중단(break/예외) 시 서버 측 OCR도 중단되도록 스트림 취소
+            responses.cancel()
 
     def close(self) -> None:
         self._channel.close()
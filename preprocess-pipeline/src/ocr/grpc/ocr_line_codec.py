@@ -0,0 +1,90 @@
+# src/ocr/grpc/ocr_line_codec.py
+
+"""
+OCR 결과 dict ↔ proto 메시지 변환
+
+- 라인 dict는 ocr.pipeline 후처리 결과 포맷 (ocr.lines.build_lines + header_detector 필드)
+- JSON 직렬화(lines_json) 없이 OcrLine 필드로 직접 매핑
+- proto3 optional(height)은 HasField로 None 복원
+"""
+
+from ocr.grpc import ocr_service_pb2
+
+
+def line_to_proto(line: dict) -> ocr_service_pb2.OcrLine:
+    message = ocr_service_pb2.OcrLine(
+        text=line.get("text", ""),
+        confidence_avg=float(line.get("confidence_avg", 0.0)),
+        confidence_min=float(line.get("confidence_min", 0.0)),
+        low_conf_ratio=float(line.get("low_conf_ratio", 0.0)),
+        bbox=[float(v) for v in line.get("bbox") or ()],
+        token_count=int(line.get("token_count", 0)),
+        role=line.get("role", ""),
+        header_score=int(line.get("header_score", 0)),
+    )
+    if line.get("height") is not None:
+        message.height = float(line["height"])
+    return message
+
+
+def line_from_proto(message: ocr_service_pb2.OcrLine) -> dict:
+    line = {
+        "text": message.text,
+        "confidence_avg": message.confidence_avg,
+        "confidence_min": message.confidence_min,
+        "low_conf_ratio": message.low_conf_ratio,
+        "bbox": tuple(message.bbox),
+        "token_count": message.token_count,
+        "height": message.height if message.HasField("height") else None,
+    }
+    # header_detector 미적용 라인은 role/header_score 키 자체가 없음
+    if message.role:
+        line["role"] = message.role
+        line["header_score"] = message.header_score
+    return line
+
+
+def image_result_to_proto(index: int, path: str, result: dict) -> ocr_service_pb2.OcrImageResult:
+    if result.get("error"):
+        return ocr_service_pb2.OcrImageResult(
+            index=index,
+            path=path,
+            status="FAIL",
+            error=result["error"],
+            deadline_exceeded=bool(result.get("deadlineExceeded")),
+        )
+
+    return ocr_service_pb2.OcrImageResult(
+        index=index,
+        path=path,
+        status=result.get("status", "FAIL"),
+        confidence=float(result.get("confidence", 0.0)),
+        raw_text=result.get("rawText", ""),
+        lines=[line_to_proto(line) for line in result.get("lines", [])],
+        scale=float(result.get("scale") or 0.0),
+        angle_cls=result.get("angleCls") or "",
+    )
+
+
+def image_result_from_proto(message: ocr_service_pb2.OcrImageResult) -> tuple[str, dict]:
+    """OcrImageResult → (path, 이미지 단위 결과 dict) (ocr.aggregate 입력 형식)"""
+    if message.error:
+        result = {
+            "rawText": "",
+            "lines": [],
+            "confidence": 0.0,
+            "status": "FAIL",
+            "error": message.error,
+        }
+        if message.deadline_exceeded:
+            result["deadlineExceeded"] = True
+        return message.path, result
+
+    return message.path, {
+        "rawText": message.raw_text,
+        "lines": [line_from_proto(line) for line in message.lines],
+        "confidence": message.confidence,
+        "status": message.status,
+        "scale": message.scale or None,
+        "angleCls": message.angle_cls or None,
+    }
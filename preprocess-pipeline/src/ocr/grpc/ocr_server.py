@@ -4,16 +4,23 @@ import json
 import logging
 import threading
 from concurrent import futures
+from typing import Optional
 
 import grpc
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
 
+from infra.metrics import metric_labels, stage_timer
 from ocr.grpc import ocr_service_pb2
 from ocr.grpc import ocr_service_pb2_grpc
+from ocr.deadline import OcrDeadline
+from ocr.grpc.ocr_line_codec import image_result_to_proto
+from ocr.engine_pool import get_ocr_engine
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_PORT = 50051
-_GRPC_WORKERS = 1  # PaddleOCR은 thread-safe 보장 없음 → 직렬 처리
+_SERVICE_NAME = ocr_service_pb2.DESCRIPTOR.services_by_name["OcrService"].full_name
+_READINESS_POLL_SEC = 1.0
 
 
 class _NumpyEncoder(json.JSONEncoder):
@@ -29,25 +36,29 @@ class _OcrServicer(ocr_service_pb2_grpc.OcrServiceServicer):
     gRPC OcrService 구현체
 
     - URL Worker 로부터 이미지 경로를 받아 OCR 실행
-    - process_ocr_input() 결과를 proto 응답으로 반환
-    - PaddleOCR thread-safety를 위해 lock으로 직렬화
+    - RunOcr      : process_ocr_input() 결과를 proto 응답 1개로 반환 (lines_json, 하위 호환)
+    - RunOcrStream: 이미지 1장 완료 시마다 OcrImageResult 전송 (입력 순서 유지)
+    - 엔진 직렬화/분배는 OCR 엔진(get_ocr_engine)이 담당 (OcrKafkaWorker와 공유)
+    - 클라이언트 deadline/취소를 OCR 파이프라인에 전달 (OcrDeadline)
+      만료 후에는 남은 이미지를 OCR하지 않고 deadline_exceeded로 응답 → 처리 스레드/엔진 즉시 반환
     """
 
-    def __init__(self):
-        self._lock = threading.Lock()
-
     def RunOcr(self, request, context):
         from ocr.pipeline import process_ocr_input
 
         images = list(request.images)
+        deadline = OcrDeadline.from_grpc_context(context)
 
         logger.debug(
-            "[OCR_GRPC_SERVER] RunOcr called | image_count=%d", len(images)
+            "[OCR_GRPC_SERVER] RunOcr called | image_count=%d | timeout_sec=%s",
+            len(images), deadline.remaining(),
         )
 
-        with self._lock:
+        # URL Worker 요청분은 OCR Worker 자체 처리와 구분되도록 별도 worker 라벨로 기록
+        with metric_labels("OCR_GRPC_SERVER", "URL"):
             try:
-                result = process_ocr_input(images)
+                with stage_timer("total"):
+                    result = process_ocr_input(images, deadline)
             except Exception as e:
                 logger.error(
                     "[OCR_GRPC_SERVER] process_ocr_input failed | error=%s", e, exc_info=True
@@ -81,6 +92,45 @@ class _OcrServicer(ocr_service_pb2_grpc.OcrServiceServicer):
             errors=errors,
         )
 
+    def RunOcrStream(self, request, context):
+        from ocr.pipeline import iter_ocr_results
+
+        images = list(request.images)
+        deadline = OcrDeadline.from_grpc_context(context)
+
+        logger.debug(
+            "[OCR_GRPC_SERVER] RunOcrStream called | image_count=%d | timeout_sec=%s",
+            len(images), deadline.remaining(),
+        )
+
+        sent = 0
+        expired = 0
+        with metric_labels("OCR_GRPC_SERVER", "URL"):
+            try:
+                with stage_timer("total"):
+                    for index, (path, result) in enumerate(iter_ocr_results(images, deadline)):
+                        # 클라이언트 timeout/취소 시 남은 이미지 OCR 중단
+                        if not context.is_active():
+                            logger.warning(
+                                "[OCR_GRPC_SERVER] RunOcrStream cancelled | sent=%d", sent
+                            )
+                            return
+                        yield image_result_to_proto(index, path, result)
+                        sent += 1
+                        expired += bool(result.get("deadlineExceeded"))
+            except Exception as e:
+                logger.error(
+                    "[OCR_GRPC_SERVER] iter_ocr_results failed | error=%s", e, exc_info=True
+                )
+                context.abort(grpc.StatusCode.INTERNAL, str(e))
+
+        if expired:
+            logger.warning(
+                "[OCR_GRPC_SERVER] RunOcrStream deadline exceeded | sent=%d | not_processed=%d",
+                sent, expired,
+            )
+        logger.debug("[OCR_GRPC_SERVER] RunOcrStream completed | sent=%d", sent)
+
 
 class OcrGrpcServer:
     """
@@ -88,24 +138,79 @@ class OcrGrpcServer:
 
     OCR 프로세스에서 백그라운드 스레드로 기동.
     OcrKafkaWorker 메인 루프와 독립적으로 실행됨.
+    요청 처리 스레드 수는 OCR 엔진 병렬도와 동일 (단일 엔진이면 1).
+
+    readiness (grpc.health.v1):
+    - OCR 엔진 모델 로드 완료 전에는 NOT_SERVING, 완료되면 SERVING (엔진 상태 polling)
+    - 엔진 로드 전에 서버를 먼저 기동해도 된다 (로드 중 요청은 엔진 lock에서 대기)
+    - health_port 지정 시 health 전용 서버를 별도 기동
+      (OCR 요청이 처리 스레드를 모두 점유해도 probe 응답이 밀리지 않음)
     """
 
-    def __init__(self, port: int = _DEFAULT_PORT):
+    def __init__(self, port: int = _DEFAULT_PORT, health_port: Optional[int] = None):
         self._port = port
+        self._health_port = health_port
         self._server: grpc.Server | None = None
+        self._health_server: grpc.Server | None = None
+        self._health = health.HealthServicer()
+        self._stop_event = threading.Event()
 
     def start(self) -> None:
+        workers = get_ocr_engine().parallelism
+        self._set_serving(False)
+
         self._server = grpc.server(
-            futures.ThreadPoolExecutor(max_workers=_GRPC_WORKERS)
+            futures.ThreadPoolExecutor(max_workers=workers)
         )
         ocr_service_pb2_grpc.add_OcrServiceServicer_to_server(
             _OcrServicer(), self._server
         )
+        health_pb2_grpc.add_HealthServicer_to_server(self._health, self._server)
         self._server.add_insecure_port(f"[::]:{self._port}")
         self._server.start()
-        logger.info("[OCR_GRPC_SERVER] started | port=%d", self._port)
+
+        if self._health_port:
+            self._health_server = grpc.server(
+                futures.ThreadPoolExecutor(max_workers=1)
+            )
+            health_pb2_grpc.add_HealthServicer_to_server(self._health, self._health_server)
+            self._health_server.add_insecure_port(f"[::]:{self._health_port}")
+            self._health_server.start()
+
+        threading.Thread(
+            target=self._watch_readiness, name="ocr-grpc-readiness", daemon=True
+        ).start()
+        logger.info(
+            "[OCR_GRPC_SERVER] started | port=%d | workers=%d | health_port=%s",
+            self._port, workers, self._health_port,
+        )
 
     def stop(self, grace_sec: int = 5) -> None:
+        self._stop_event.set()
+        # 종료 중에는 새 요청이 들어오지 않도록 NOT_SERVING 먼저 전환
+        self._health.enter_graceful_shutdown()
         if self._server:
             self._server.stop(grace_sec)
             logger.info("[OCR_GRPC_SERVER] stopped")
+        if self._health_server:
+            self._health_server.stop(0)
+
+    def _watch_readiness(self) -> None:
+        serving = False
+        while not self._stop_event.is_set():
+            ready = get_ocr_engine().ready
+            if ready != serving:
+                self._set_serving(ready)
+                serving = ready
+                logger.info("[OCR_GRPC_SERVER] readiness changed | serving=%s", ready)
+            self._stop_event.wait(_READINESS_POLL_SEC)
+
+    def _set_serving(self, serving: bool) -> None:
+        status = (
+            health_pb2.HealthCheckResponse.SERVING
+            if serving
+            else health_pb2.HealthCheckResponse.NOT_SERVING
+        )
+        # "" : 서버 전체 (grpc_health_probe / k8s grpc probe 기본 service)
+        for service in ("", _SERVICE_NAME):
+            self._health.set(service, status)
@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1aocr/grpc/ocr_service.proto\x12\x03ocr\"\x1c\n\nOcrRequest\x12\x0e\n\x06images\x18\x01 \x03(\t\"g\n\x0bOcrResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x10\n\x08raw_text\x18\x03 \x01(\t\x12\x12\n\nlines_json\x18\x04 \x01(\t\x12\x0e\n\x06\x65rrors\x18\x05 \x03(\t29\n\nOcrService\x12+\n\x06RunOcr\x12\x0f.ocr.OcrRequest\x1a\x10.ocr.OcrResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1aocr/grpc/ocr_service.proto\x12\x03ocr\"\x1c\n\nOcrRequest\x12\x0e\n\x06images\x18\x01 \x03(\t\"g\n\x0bOcrResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x10\n\x08raw_text\x18\x03 \x01(\t\x12\x12\n\nlines_json\x18\x04 \x01(\t\x12\x0e\n\x06\x65rrors\x18\x05 \x03(\t\"\xc6\x01\n\x07OcrLine\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x16\n\x0e\x63onfidence_avg\x18\x02 \x01(\x02\x12\x16\n\x0e\x63onfidence_min\x18\x03 \x01(\x02\x12\x16\n\x0elow_conf_ratio\x18\x04 \x01(\x02\x12\x0c\n\x04\x62\x62ox\x18\x05 \x03(\x02\x12\x13\n\x0btoken_count\x18\x06 \x01(\x05\x12\x13\n\x06height\x18\x07 \x01(\x02H\x00\x88\x01\x01\x12\x0c\n\x04role\x18\x08 \x01(\t\x12\x14\n\x0cheader_score\x18\t \x01(\x05\x42\t\n\x07_height\"\xcc\x01\n\x0eOcrImageResult\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x12\n\nconfidence\x18\x04 \x01(\x02\x12\x10\n\x08raw_text\x18\x05 \x01(\t\x12\x1b\n\x05lines\x18\x06 \x03(\x0b\x32\x0c.ocr.OcrLine\x12\r\n\x05scale\x18\x07 \x01(\x02\x12\r\n\x05\x65rror\x18\x08 \x01(\t\x12\x11\n\tangle_cls\x18\t \x01(\t\x12\x19\n\x11\x64\x65\x61\x64line_exceeded\x18\n \x01(\x08\x32q\n\nOcrService\x12+\n\x06RunOcr\x12\x0f.ocr.OcrRequest\x1a\x10.ocr.OcrResponse\x12\x36\n\x0cRunOcrStream\x12\x0f.ocr.OcrRequest\x1a\x13.ocr.OcrImageResult0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -25,6 +25,10 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['_OCRREQUEST']._serialized_end=63
   _globals['_OCRRESPONSE']._serialized_start=65
   _globals['_OCRRESPONSE']._serialized_end=168
-  _globals['_OCRSERVICE']._serialized_start=170
-  _globals['_OCRSERVICE']._serialized_end=227
+  _globals['_OCRLINE']._serialized_start=171
+  _globals['_OCRLINE']._serialized_end=369
+  _globals['_OCRIMAGERESULT']._serialized_start=372
+  _globals['_OCRIMAGERESULT']._serialized_end=576
+  _globals['_OCRSERVICE']._serialized_start=578
+  _globals['_OCRSERVICE']._serialized_end=691
 # @@protoc_insertion_point(module_scope)
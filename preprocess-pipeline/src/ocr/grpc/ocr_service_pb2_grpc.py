@@ -19,6 +19,11 @@ class OcrServiceStub(object):
                 request_serializer=ocr_dot_grpc_dot_ocr__service__pb2.OcrRequest.SerializeToString,
                 response_deserializer=ocr_dot_grpc_dot_ocr__service__pb2.OcrResponse.FromString,
                 )
+        self.RunOcrStream = channel.unary_stream(
+                '/ocr.OcrService/RunOcrStream',
+                request_serializer=ocr_dot_grpc_dot_ocr__service__pb2.OcrRequest.SerializeToString,
+                response_deserializer=ocr_dot_grpc_dot_ocr__service__pb2.OcrImageResult.FromString,
+                )
 
 
 class OcrServiceServicer(object):
@@ -30,6 +35,13 @@ class OcrServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def RunOcrStream(self, request, context):
+        """이미지 단위 결과를 입력 순서대로 스트리밍 (이미지 1장 완료 즉시 전송)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_OcrServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -38,6 +50,11 @@ def add_OcrServiceServicer_to_server(servicer, server):
                     request_deserializer=ocr_dot_grpc_dot_ocr__service__pb2.OcrRequest.FromString,
                     response_serializer=ocr_dot_grpc_dot_ocr__service__pb2.OcrResponse.SerializeToString,
             ),
+            'RunOcrStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.RunOcrStream,
+                    request_deserializer=ocr_dot_grpc_dot_ocr__service__pb2.OcrRequest.FromString,
+                    response_serializer=ocr_dot_grpc_dot_ocr__service__pb2.OcrImageResult.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'ocr.OcrService', rpc_method_handlers)
@@ -64,3 +81,20 @@ class OcrService(object):
             ocr_dot_grpc_dot_ocr__service__pb2.OcrResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def RunOcrStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/ocr.OcrService/RunOcrStream',
+            ocr_dot_grpc_dot_ocr__service__pb2.OcrRequest.SerializeToString,
+            ocr_dot_grpc_dot_ocr__service__pb2.OcrImageResult.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
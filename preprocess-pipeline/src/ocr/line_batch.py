@@ -0,0 +1,141 @@
+"""
+OCR 라인 묶음 (struct-of-arrays)
+
+책임:
+- build_lines 이후 후처리 단계가 공유하는 라인 컬럼 보관
+  (build_lines → detect_visual_headers → normalize_lines → filter_low_quality_lines → postprocess_ocr_lines)
+- JD 파이프라인 표준 line dict는 마지막에 살아남은 라인만 생성 (to_dicts)
+
+설계 원칙:
+- 단계 간 복사 없음: 라인 제거는 active mask만 내리고, 텍스트 변경은 texts[i] 교체
+- 라인 인덱스는 build_lines 정렬 순서 그대로 유지 (제거돼도 당겨지지 않음)
+"""
+
+import numpy as np
+
+# header_score 이 값 이상이면 헤더 후보
+HEADER_SCORE_THRESHOLD = 3
+
+
+class OcrLineBatch:
+    """
+    이미지 1장의 OCR 라인 컬럼 (인덱스 i가 같은 라인)
+
+    - texts         : 라인 텍스트
+    - confidence_*  : (N,) float64, 0~100
+    - bboxes        : (N,4) float64 (x, y, w, h)
+    - heights       : (N,) float64 글자 높이 (병합 라인은 첫 줄 기준)
+    - token_counts  : (N,) int64 (build_lines 시점 텍스트 기준)
+    - header_scores : (N,) int64 (detect_visual_headers가 채움)
+    - active        : (N,) bool, False면 제거된 라인
+    """
+
+    __slots__ = (
+        "texts",
+        "confidence_avg",
+        "confidence_min",
+        "low_conf_ratio",
+        "bboxes",
+        "token_counts",
+        "heights",
+        "header_scores",
+        "active",
+    )
+
+    def __init__(
+            self,
+            texts: list[str],
+            confidence_avg: np.ndarray,
+            confidence_min: np.ndarray,
+            low_conf_ratio: np.ndarray,
+            bboxes: np.ndarray,
+            token_counts: np.ndarray,
+            heights: np.ndarray,
+    ):
+        count = len(texts)
+        self.texts = texts
+        self.confidence_avg = confidence_avg
+        self.confidence_min = confidence_min
+        self.low_conf_ratio = low_conf_ratio
+        self.bboxes = bboxes
+        self.token_counts = token_counts
+        self.heights = heights
+        self.header_scores = np.zeros(count, dtype=np.int64)
+        self.active = np.ones(count, dtype=bool)
+
+    @classmethod
+    def empty(cls) -> "OcrLineBatch":
+        return cls(
+            texts=[],
+            confidence_avg=np.zeros(0, dtype=np.float64),
+            confidence_min=np.zeros(0, dtype=np.float64),
+            low_conf_ratio=np.zeros(0, dtype=np.float64),
+            bboxes=np.zeros((0, 4), dtype=np.float64),
+            token_counts=np.zeros(0, dtype=np.int64),
+            heights=np.zeros(0, dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        """살아남은 라인 수"""
+        return int(np.count_nonzero(self.active))
+
+    def indices(self) -> list[int]:
+        """살아남은 라인 인덱스 (정렬 순서)"""
+        return np.flatnonzero(self.active).tolist()
+
+    def drop(self, index: int) -> None:
+        self.active[index] = False
+
+    def line(self, index: int) -> dict:
+        """라인 1개 dict (디버그용 제거 라인 기록 등)"""
+        return self._to_dict(
+            index,
+            self.confidence_avg[index].item(),
+            self.confidence_min[index].item(),
+            self.low_conf_ratio[index].item(),
+            tuple(self.bboxes[index].tolist()),
+            self.token_counts[index].item(),
+            self.heights[index].item(),
+            self.header_scores[index].item(),
+        )
+
+    def to_dicts(self) -> list[dict]:
+        """살아남은 라인 → JD 파이프라인 표준 line dict 리스트"""
+        indices = np.flatnonzero(self.active)
+        columns = zip(
+            indices.tolist(),
+            self.confidence_avg[indices].tolist(),
+            self.confidence_min[indices].tolist(),
+            self.low_conf_ratio[indices].tolist(),
+            self.bboxes[indices].tolist(),
+            self.token_counts[indices].tolist(),
+            self.heights[indices].tolist(),
+            self.header_scores[indices].tolist(),
+        )
+        return [
+            self._to_dict(index, avg, minimum, low_ratio, tuple(bbox), tokens, height, score)
+            for index, avg, minimum, low_ratio, bbox, tokens, height, score in columns
+        ]
+
+    def _to_dict(
+            self,
+            index: int,
+            confidence_avg: float,
+            confidence_min: float,
+            low_conf_ratio: float,
+            bbox: tuple,
+            token_count: int,
+            height: float,
+            header_score: int,
+    ) -> dict:
+        return {
+            "text": self.texts[index],
+            "confidence_avg": confidence_avg,
+            "confidence_min": confidence_min,
+            "low_conf_ratio": low_conf_ratio,
+            "bbox": bbox,
+            "token_count": token_count,
+            "height": height,
+            "header_score": header_score,
+            "role": "header_candidate" if header_score >= HEADER_SCORE_THRESHOLD else "body",
+        }
@@ -4,150 +4,147 @@ PaddleOCR raw 결과를 line 단위 구조로 정규화하는 모듈
 책임:
 - OCR line 결과를 JD 파이프라인 표준 line 포맷으로 변환
 - JD 도메인 기준으로 "같은 bullet 내부 줄바꿈"만 병합
+
+설계 원칙:
+- bbox / height / 정렬 / 병합 후보는 OCRResult의 (N,4,2) box 배열에서 한 번에 계산
+- 결과는 병합 그룹당 1라인의 OcrLineBatch (line dict는 후처리 마지막에 생성)
 """
 
 import re
 
+import numpy as np
+
+from ocr.line_batch import OcrLineBatch
+
 ROW_TOLERANCE = 5          # 시각적 정렬용
 MAX_Y_GAP = 25             # 같은 bullet 내 줄바꿈 허용 범위
 HEIGHT_SIMILAR_RATIO = 0.8 # 스타일 동일성 보조 기준
 
 
-def _sort_key(line):
-    x, y, *_ = line["bbox"]
-    return (y // ROW_TOLERANCE, x)
-
-
-def build_lines(raw):
+def build_lines(ocr_result: dict) -> OcrLineBatch:
     """
-    PaddleOCR raw 결과 → JD 파이프라인용 line 리스트 변환
+    PaddleOCR 결과(OCRResult: texts / scores / boxes) → JD 파이프라인용 라인 묶음 변환
     """
-    lines = []
-
-    for item in raw:
-        text = item["text"].strip()
-        if not text:
-            continue
+    texts = ocr_result["texts"]
+    if not texts:
+        return OcrLineBatch.empty()
 
-        score = float(item["confidence"])
-        box = item["box"]
-        height = item["height"]
+    boxes = ocr_result["boxes"]
+    mins = boxes.min(axis=1)
+    maxs = boxes.max(axis=1)
+    xs, ys = mins[:, 0], mins[:, 1]
 
-        bbox = _calculate_bbox_from_polygon(box)
+    # 시각적 위 → 아래 정렬 (row bucket, x 순, 동률은 입력 순서 유지)
+    order = np.lexsort((xs, np.floor_divide(ys, ROW_TOLERANCE)))
 
-        lines.append({
-            "text": text,
-            "confidence_avg": score,
-            "confidence_min": score,
-            "low_conf_ratio": 1.0 if score < 60 else 0.0,
-            "bbox": bbox,
-            "token_count": len(text.split()),
-            "height": height,
-        })
-
-    # 시각적 위 → 아래 정렬
-    lines.sort(key=_sort_key)
+    sorted_texts = [texts[i] for i in order]
+    mins, maxs = mins[order], maxs[order]
+    scores = ocr_result["scores"][order]
+    heights = maxs[:, 1] - mins[:, 1]
 
     # JD 도메인 기준 줄 병합
-    return merge_wrapped_lines(lines)
-
-
-def _calculate_bbox_from_polygon(box):
-    xs = [p[0] for p in box]
-    ys = [p[1] for p in box]
-
-    x = min(xs)
-    y = min(ys)
-    w = max(xs) - x
-    h = max(ys) - y
-
-    return (x, y, w, h)
+    groups = _group_wrapped_lines(sorted_texts, mins[:, 1], heights)
+    return _build_batch(sorted_texts, scores, mins, maxs, heights, groups)
 
 
 # ============================================================
 # JD 전용 병합 로직
 # ============================================================
 
-def merge_wrapped_lines(lines: list[dict]) -> list[dict]:
-    """
-    JD bullet 내부에서 줄바꿈으로 분리된 라인만 병합
-    """
-    if not lines:
-        return []
-
-    merged: list[dict] = []
-    buffer = lines[0].copy()
-
-    for current in lines[1:]:
-        if _should_merge(buffer, current):
-            _merge_into_buffer(buffer, current)
-        else:
-            merged.append(buffer)
-            buffer = current.copy()
-
-    merged.append(buffer)
-    return merged
-
-
-def _should_merge(prev: dict, curr: dict) -> bool:
+def _group_wrapped_lines(texts: list[str], ys: np.ndarray, heights: np.ndarray) -> list[tuple[int, int]]:
     """
-    병합 여부 판단 (JD 기준)
+    JD bullet 내부에서 줄바꿈으로 분리된 라인 그룹 [(start, end), ...] (정렬된 라인 인덱스 구간)
+
+    그룹 첫 줄(bullet)에 이어 붙일 수 있는 줄:
+    1. 그룹 첫 줄이 bullet
+    2. 현재 줄이 bullet이 아님 (bullet이면 새로운 항목)
+    3. 그룹 상단(y 최소)과의 y 간격이 MAX_Y_GAP 이하 (크면 다른 문단)
+    4. 그룹 첫 줄과 글자 높이 비율이 HEIGHT_SIMILAR_RATIO 이상 (스타일이 너무 다르면 금지)
+    5. 현재 줄이 continuation 형태
     """
-    prev_text = prev["text"].strip()
-    curr_text = curr["text"].strip()
-
-    # 1. 이전 줄이 bullet이 아니면 병합 금지
-    if not _is_bullet(prev_text):
-        return False
+    count = len(texts)
+    is_bullet = np.fromiter((_is_bullet(text) for text in texts), dtype=bool, count=count)
+    # 조건 2, 5는 라인 단독으로 결정 → 병합 후보를 미리 계산
+    candidates = ~is_bullet & np.fromiter(
+        (_is_continuation_line(text) for text in texts), dtype=bool, count=count
+    )
 
-    # 2. 다음 줄이 bullet이면 새로운 항목 → 병합 금지
-    if _is_bullet(curr_text):
-        return False
+    is_bullet = is_bullet.tolist()
+    candidates = candidates.tolist()
+    ys = ys.tolist()
+    heights = heights.tolist()
+
+    groups: list[tuple[int, int]] = []
+    start = 0
+    group_y = ys[0]
+    for i in range(1, count):
+        if (
+            candidates[i]
+            and is_bullet[start]
+            and ys[i] - group_y <= MAX_Y_GAP
+            and _is_similar_height(heights[start], heights[i])
+        ):
+            group_y = min(group_y, ys[i])
+            continue
+        groups.append((start, i))
+        start = i
+        group_y = ys[i]
 
-    # 3. y 간격이 너무 크면 다른 문단
-    prev_y = prev["bbox"][1]
-    curr_y = curr["bbox"][1]
-    if curr_y - prev_y > MAX_Y_GAP:
-        return False
+    groups.append((start, count))
+    return groups
 
-    # 4. 글자 크기 스타일이 너무 다르면 병합 금지
-    prev_h = prev.get("height", 0)
-    curr_h = curr.get("height", 0)
-    if prev_h and curr_h:
-        ratio = min(prev_h, curr_h) / max(prev_h, curr_h)
-        if ratio < HEIGHT_SIMILAR_RATIO:
-            return False
 
-    # 5. 다음 줄이 continuation 형태인지 확인
-    return _is_continuation_line(curr_text)
+def _is_similar_height(prev_h: float, curr_h: float) -> bool:
+    if not prev_h or not curr_h:
+        return True
+    return min(prev_h, curr_h) / max(prev_h, curr_h) >= HEIGHT_SIMILAR_RATIO
 
 
-def _merge_into_buffer(buffer: dict, current: dict):
+def _build_batch(
+        texts: list[str],
+        scores: np.ndarray,
+        mins: np.ndarray,
+        maxs: np.ndarray,
+        heights: np.ndarray,
+        groups: list[tuple[int, int]],
+) -> OcrLineBatch:
     """
-    current line을 buffer에 병합
+    병합 그룹 → 라인 묶음
+
+    - bbox: 그룹 box 합집합 (x, y, w, h)
+    - height / low_conf_ratio: 그룹 첫 줄 기준
+    - confidence: 이어 붙인 순서대로 보수적 갱신 (평균은 직전 값과 2등분, 최소값)
     """
-    buffer["text"] = buffer["text"].rstrip() + current["text"].lstrip()
-
-    # bbox 확장
-    x1 = min(buffer["bbox"][0], current["bbox"][0])
-    y1 = min(buffer["bbox"][1], current["bbox"][1])
-    x2 = max(buffer["bbox"][0] + buffer["bbox"][2],
-             current["bbox"][0] + current["bbox"][2])
-    y2 = max(buffer["bbox"][1] + buffer["bbox"][3],
-             current["bbox"][1] + current["bbox"][3])
-
-    buffer["bbox"] = (x1, y1, x2 - x1, y2 - y1)
-
-    # confidence 보수적 갱신
-    buffer["confidence_avg"] = (
-        buffer["confidence_avg"] + current["confidence_avg"]
-    ) / 2
-    buffer["confidence_min"] = min(
-        buffer["confidence_min"], current["confidence_min"]
+    starts = [start for start, _ in groups]
+    group_mins = np.minimum.reduceat(mins, starts, axis=0).astype(np.float64)
+    group_maxs = np.maximum.reduceat(maxs, starts, axis=0).astype(np.float64)
+    first_scores = scores[starts]
+    score_list = scores.tolist()
+
+    merged_texts = []
+    confidence_avg = []
+    confidence_min = []
+    for start, end in groups:
+        text = texts[start]
+        avg = minimum = score_list[start]
+        for i in range(start + 1, end):
+            text = text.rstrip() + texts[i].lstrip()
+            avg = (avg + score_list[i]) / 2
+            minimum = min(minimum, score_list[i])
+        merged_texts.append(text)
+        confidence_avg.append(avg)
+        confidence_min.append(minimum)
+
+    return OcrLineBatch(
+        texts=merged_texts,
+        confidence_avg=np.array(confidence_avg, dtype=np.float64),
+        confidence_min=np.array(confidence_min, dtype=np.float64),
+        low_conf_ratio=np.where(first_scores < 60, 1.0, 0.0),
+        bboxes=np.concatenate([group_mins, group_maxs - group_mins], axis=1),
+        token_counts=np.fromiter((len(text.split()) for text in merged_texts), dtype=np.int64, count=len(groups)),
+        heights=heights[starts].astype(np.float64),
     )
 
-    buffer["token_count"] = len(buffer["text"].split())
-
 
 # ============================================================
 # 판단 유틸
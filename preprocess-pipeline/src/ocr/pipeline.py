@@ -1,57 +1,155 @@
+import contextvars
 import logging
 import os
-import tempfile
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Iterator, Optional
 from urllib.parse import urlparse
 
+import numpy as np
 import requests
 
+from infra.config.ocr_config import load_ocr_config
+from infra.metrics import OCR_TRIAGE_TOTAL, stage_timer
 from normalize.pipeline import normalize_lines
+from ocr.aggregate import aggregate_image_results, normalize_image_paths
 from ocr.confidence import classify_confidence
-from ocr.engine import run_ocr
+from ocr.deadline import OcrDeadline, OcrDeadlineExceeded
+from ocr.engine import ENGINE_VERSION
+from ocr.engine_pool import get_ocr_engine
 from ocr.header_detector import detect_visual_headers
 from ocr.lines import build_lines
 from ocr.postprocess import postprocess_ocr_lines
-from ocr.preprocess import preprocess_image
+from ocr.preprocess import (
+    PREPROCESS_VERSION,
+    PreprocessedImage,
+    decode_image_bytes,
+    preprocess_decoded_image,
+    to_reference_frame,
+)
 from ocr.quality import filter_low_quality_lines
+from ocr.result_cache import OcrResultCache, build_cache_key
+from ocr.tiling import run_tiled_ocr_many
+from ocr.triage import DECISION_DEFER, DECISION_OCR, DECISION_SKIP, TriageResult, triage_image
 from utils.rawtext import build_raw_text
 
 logger = logging.getLogger(__name__)
 
+_OCR_CONFIG = load_ocr_config()
 
-def process_ocr_input(image_input: str | list[str]) -> dict:
+# build_lines ~ postprocess_ocr_lines 로직 변경 시 올린다 (캐시된 결과 무효화)
+_POSTPROCESS_VERSION = "2"
+_CACHE_VERSION = (
+    f"{ENGINE_VERSION}|{PREPROCESS_VERSION}"
+    f"|tile={_OCR_CONFIG.tile_height}/{_OCR_CONFIG.tile_overlap}|post={_POSTPROCESS_VERSION}"
+)
+
+_RESULT_CACHE = OcrResultCache(
+    memory_entries=_OCR_CONFIG.cache_memory_entries,
+    cache_dir=_OCR_CONFIG.cache_dir,
+    max_disk_bytes=_OCR_CONFIG.cache_max_bytes,
+)
+
+_NO_TRIAGE = TriageResult(DECISION_OCR, "disabled")
+
+
+def process_ocr_input(image_input: str | list[str], deadline: Optional[OcrDeadline] = None) -> dict:
+    """
+    이미지 목록 OCR → 요청 단위 결과 (ocr.aggregate)
+
+    deadline: 만료/취소 시 남은 이미지는 OCR 없이 deadlineExceeded 실패로 채워
+              처리된 이미지까지의 부분 결과(status PARTIAL)를 반환
+    """
     image_paths = normalize_image_paths(image_input)
     if not image_paths:
         return _fail("no image paths provided")
 
-    aggregated_raw_texts = []
-    aggregated_lines = []
-    confidences = []
-    errors = []
+    return aggregate_image_results(zip(image_paths, _iter_image_results(image_paths, deadline)))
 
-    for path in image_paths:
-        result = _process_single_image(path)
-        if result.get("error"):
-            errors.append({"path": path, "error": result["error"]})
-            continue
 
-        if result["rawText"]:
-            aggregated_raw_texts.append(result["rawText"])
-        if result["lines"]:
-            aggregated_lines.extend(result["lines"])
-        if result["confidence"] > 0:
-            confidences.append(result["confidence"])
+def iter_ocr_results(
+        image_input: str | list[str],
+        deadline: Optional[OcrDeadline] = None,
+) -> Iterator[tuple[str, dict]]:
+    """
+    이미지별 (path, 결과)를 입력 순서대로 완료 즉시 반환 (스트리밍 gRPC용)
+    (triage 보류 이미지가 있으면 그 뒤 결과는 보류 이미지 처리 후 반환)
 
-    final_raw_text = "\n\n".join(aggregated_raw_texts)
-    final_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-    final_status = classify_confidence(final_confidence).value
+    결과 구조는 이미지 단위 process_ocr_input 결과와 동일하며,
+    실패한 이미지는 "error" 키를 포함한다.
+    (deadline 만료/취소로 처리하지 못한 이미지는 "deadlineExceeded": True 추가)
+    """
+    image_paths = normalize_image_paths(image_input)
+    yield from zip(image_paths, _iter_image_results(image_paths, deadline))
+
+
+def _iter_image_results(image_paths: list[str], deadline: Optional[OcrDeadline]) -> Iterator[dict]:
+    """
+    이미지별 OCR 결과를 입력 순서대로 반환
+
+    - triage에서 보류(defer)된 이미지는 나머지 이미지를 모두 처리한 뒤 OCR
+      (요청 시작부터 triage_budget_sec를 넘겼으면 OCR 없이 skip 사유를 error로 반환)
+    - 보류 이미지 뒤의 결과는 입력 순서 유지를 위해 보류 이미지가 처리될 때까지 대기
+    - deadline은 이미지 준비 / OCR 추론(이미지·타일 단위) / 보류 이미지 처리 전마다 확인
+    """
+    started = time.monotonic()
+    held: list[dict] = []
+    for result in _iter_first_pass_results(image_paths, deadline):
+        if held or "deferred" in result:
+            held.append(result)
+        else:
+            yield result
+
+    for result in held:
+        yield _finish_deferred(result, started, deadline) if "deferred" in result else result
+
+
+def _iter_first_pass_results(image_paths: list[str], deadline: Optional[OcrDeadline]) -> Iterator[dict]:
+    """
+    이미지별 OCR 결과(보류 이미지는 준비 결과 그대로)를 입력 순서대로 반환
+
+    - 다운로드/캐시 조회/디코딩/리사이즈(_prepare_image)는 prefetch 스레드에서 미리 수행
+    - PaddleOCR 추론 이후 단계(_finish_images)
+      - 단일 엔진: 호출 스레드에서 수행, 이미 준비가 끝난 다음 이미지들은 함께 배치 OCR
+      - 엔진 pool: prefetch 스레드에서 바로 수행 (이미지 여러 장을 엔진 프로세스에서 동시 추론)
+    - 동시에 준비되는 이미지는 prefetch_workers 개로 제한 (업스케일 이미지 메모리 상한)
+    """
+    workers = min(_OCR_CONFIG.prefetch_workers, len(image_paths))
+    if workers <= 1:
+        for path in image_paths:
+            yield _process_single_image(path, deadline)
+        return
+
+    infer_in_prefetch = get_ocr_engine().parallelism > 1
+    task = partial(_process_single_image if infer_in_prefetch else _prepare_image, deadline=deadline)
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr-prefetch")
+    pending: deque[Future] = deque()
+    remaining = iter(image_paths)
+
+    def submit_next() -> None:
+        path = next(remaining, None)
+        if path is not None:
+            # 스레드는 contextvar를 상속하지 않으므로 메트릭 라벨 컨텍스트를 복사해 실행
+            pending.append(executor.submit(contextvars.copy_context().run, task, path))
 
-    return {
-        "rawText": final_raw_text,
-        "lines": aggregated_lines,
-        "confidence": final_confidence,
-        "status": final_status,
-        "errors": errors,
-    }
+    try:
+        for _ in range(workers):
+            submit_next()
+
+        while pending:
+            completed = [pending.popleft().result()]
+            if not infer_in_prefetch:
+                # 대기 없이 바로 꺼낼 수 있는 이미지까지만 묶는다 (첫 이미지 지연 방지)
+                while pending and pending[0].done():
+                    completed.append(pending.popleft().result())
+            for _ in completed:
+                submit_next()
+            yield from completed if infer_in_prefetch else _finish_images(completed, deadline)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
 
 
 def _fail(reason: str) -> dict:
@@ -64,94 +162,252 @@ def _fail(reason: str) -> dict:
     }
 
 
-def _process_single_image(image_path: str) -> dict:
-    temp_local_path = None
-    local_image_path = image_path
+def _deadline_fail(reason: str) -> dict:
+    return {**_fail(f"{reason}: image not processed"), "deadlineExceeded": True}
+
+
+def _process_single_image(image_path: str, deadline: Optional[OcrDeadline] = None) -> dict:
+    return _finish_image(_prepare_image(image_path, deadline), deadline)
+
+
+def _prepare_image(image_path: str, deadline: Optional[OcrDeadline] = None) -> dict:
+    """
+    OCR 입력 이미지 준비 (다운로드/읽기 → 캐시 조회 → 디코딩/리사이즈)
+
+    - 원격 이미지: 응답 bytes를 메모리에서 바로 디코딩 (임시 파일 미사용)
+    - 로컬 경로: 파일 검증 후 bytes로 읽어 동일 경로로 처리
+
+    Returns:
+        {"error": str} | {"cached": 결과 dict} | {"image": PreprocessedImage, "cache_key": str | None}
+        | {"deferred": 원본 이미지, "triage": TriageResult, "cache_key": str | None} (triage 보류)
+        | {"expired": 사유} (deadline 만료/취소, 다운로드부터 생략)
+    """
+    expired = deadline.reason() if deadline is not None else None
+    if expired is not None:
+        return {"expired": expired}
 
     if _is_remote_image_path(image_path):
-        downloaded = _download_remote_image_to_temp(image_path)
+        with stage_timer("ocr.download"):
+            downloaded = _download_remote_image(image_path)
         if downloaded.get("error"):
-            return _fail(downloaded["error"])
-        local_image_path = downloaded["path"]
-        temp_local_path = local_image_path
+            return {"error": downloaded["error"]}
+        data = downloaded["data"]
+    else:
+        loaded = _read_local_image(image_path)
+        if loaded.get("error"):
+            return {"error": loaded["error"]}
+        data = loaded["data"]
+
+    cache_key = None
+    if _RESULT_CACHE.enabled:
+        cache_key = build_cache_key(data, _CACHE_VERSION)
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            return {"cached": cached}
 
     try:
-        if not isinstance(local_image_path, str):
-            return _fail("image_path is not a string")
-        if not os.path.exists(local_image_path):
-            return _fail(f"image not found: {local_image_path}")
-        if not os.path.isfile(local_image_path):
-            return _fail(f"image_path is not a file: {local_image_path}")
-        if not os.access(local_image_path, os.R_OK):
-            return _fail(f"image not readable: {local_image_path}")
-
-        try:
-            preprocessed_image = preprocess_image(local_image_path)
-        except Exception as e:
-            return _fail(f"preprocess_image failed: {e}")
-
-        ocr_result = run_ocr(preprocessed_image)
-        if not ocr_result.get("raw"):
-            return _fail("ocr returned empty raw result")
+        with stage_timer("ocr.image_preprocess"):
+            image = decode_image_bytes(data)
+            triage = _triage(image)
+            # skip / 보류 이미지는 업스케일하지 않음 (보류 중에는 원본만 보관)
+            if triage.decision == DECISION_OCR:
+                preprocessed = preprocess_decoded_image(image)
+    except Exception as e:
+        return {"error": f"preprocess_image failed: {e}"}
+
+    if triage.decision == DECISION_SKIP:
+        return {"error": f"skipped by triage: {triage.describe()}"}
+    if triage.decision == DECISION_DEFER:
+        return {"deferred": image, "triage": triage, "cache_key": cache_key}
+    return {"image": preprocessed, "cache_key": cache_key}
+
 
+def _triage(image: np.ndarray) -> TriageResult:
+    if not _OCR_CONFIG.triage_enabled:
+        return _NO_TRIAGE
+
+    with stage_timer("ocr.triage"):
+        triage = triage_image(image)
+    OCR_TRIAGE_TOTAL.labels(decision=triage.decision, reason=triage.reason).inc()
+    if triage.decision != DECISION_OCR:
         logger.debug(
-            "OCR raw result",
-            extra={
-                "raw_line_count": len(ocr_result["raw"]),
-                "confidence": round(ocr_result.get("confidence", 0), 2),
-            },
+            "OCR image triaged",
+            extra={"decision": triage.decision, "reason": triage.describe()},
         )
+    return triage
 
-        lines = build_lines(ocr_result["raw"])
-        logger.debug("OCR lines built", extra={"line_count": len(lines)})
 
-        lines = detect_visual_headers(lines)
-        normalized = normalize_lines(lines)
-        passed_lines, dropped_lines = filter_low_quality_lines(
-            normalized,
-            min_confidence=45,
-            max_garbage_ratio=0.6,
-        )
+def _finish_deferred(prepared: dict, started: float, deadline: Optional[OcrDeadline]) -> dict:
+    """triage 보류 이미지: 요청 시간 예산이 남았으면 전처리 + OCR, 아니면 skip"""
+    expired = deadline.reason() if deadline is not None else None
+    if expired is not None:
+        return _deadline_fail(expired)
 
-        ocr_lines = postprocess_ocr_lines(passed_lines)
-        logger.debug(
-            "OCR postprocess completed",
-            extra={
-                "passed_line_count": len(ocr_lines),
-                "dropped_line_count": len(dropped_lines),
-            },
+    triage = prepared["triage"]
+    budget = _OCR_CONFIG.triage_budget_sec
+    if budget > 0 and time.monotonic() - started >= budget:
+        OCR_TRIAGE_TOTAL.labels(decision="budget_skip", reason=triage.reason).inc()
+        return _fail(f"skipped by triage: {triage.describe()}, time budget {budget}s exhausted")
+
+    try:
+        with stage_timer("ocr.image_preprocess"):
+            preprocessed = preprocess_decoded_image(prepared["deferred"])
+    except Exception as e:
+        return _fail(f"preprocess_image failed: {e}")
+
+    return _finish_image({"image": preprocessed, "cache_key": prepared["cache_key"]}, deadline)
+
+
+def _finish_image(prepared: dict, deadline: Optional[OcrDeadline] = None) -> dict:
+    return _finish_images([prepared], deadline)[0]
+
+
+def _finish_images(prepared_list: list[dict], deadline: Optional[OcrDeadline] = None) -> list[dict]:
+    """
+    준비 결과 → 이미지 단위 OCR 결과, 입력 순서대로 반환
+
+    - 캐시 hit / 준비 실패 이미지는 추론 생략
+    - triage 보류 이미지는 준비 결과 그대로 반환 (_iter_image_results가 마지막에 처리)
+    - 나머지 이미지는 한 번에 OCR (text 영역 recognition 배치 공유)
+    - 성공 결과는 캐시에 저장
+    - OCR 도중 deadline 만료/취소 시 이번 묶음의 추론 대상 이미지는 모두 deadlineExceeded 실패
+    """
+    to_recognize = [prepared for prepared in prepared_list if "image" in prepared]
+    try:
+        recognized = iter(_recognize_images([prepared["image"] for prepared in to_recognize], deadline))
+    except OcrDeadlineExceeded as e:
+        logger.warning(
+            "OCR inference abandoned",
+            extra={"reason": str(e), "image_count": len(to_recognize)},
         )
+        recognized = iter([_deadline_fail(str(e))] * len(to_recognize))
+
+    results = []
+    for prepared in prepared_list:
+        if prepared.get("error"):
+            results.append(_fail(prepared["error"]))
+            continue
+        if "expired" in prepared:
+            results.append(_deadline_fail(prepared["expired"]))
+            continue
+        if "cached" in prepared:
+            results.append(prepared["cached"])
+            continue
+        if "deferred" in prepared:
+            results.append(prepared)
+            continue
 
-        raw_text = build_raw_text(ocr_lines)
-        status = classify_confidence(ocr_result["confidence"]).value
+        result = next(recognized)
+        if prepared["cache_key"] and not result.get("error"):
+            _RESULT_CACHE.put(prepared["cache_key"], result)
+        results.append(result)
+    return results
 
-        return {
-            "rawText": raw_text,
-            "lines": ocr_lines,
-            "confidence": ocr_result["confidence"],
-            "status": status,
-        }
-    finally:
-        if temp_local_path and os.path.exists(temp_local_path):
-            try:
-                os.remove(temp_local_path)
-            except Exception:
-                pass
-
-
-def normalize_image_paths(image_input) -> list[str]:
-    paths: list[str] = []
-    if isinstance(image_input, str):
-        paths = image_input.split(",")
-    elif isinstance(image_input, list):
-        for item in image_input:
-            if not item:
-                continue
-            if isinstance(item, str) and "," in item:
-                paths.extend(item.split(","))
-            else:
-                paths.append(str(item))
-    return [p.strip() for p in paths if p and p.strip()]
+
+def _read_local_image(image_path: str) -> dict:
+    if not isinstance(image_path, str):
+        return {"error": "image_path is not a string"}
+    if not os.path.exists(image_path):
+        return {"error": f"image not found: {image_path}"}
+    if not os.path.isfile(image_path):
+        return {"error": f"image_path is not a file: {image_path}"}
+    if not os.access(image_path, os.R_OK):
+        return {"error": f"image not readable: {image_path}"}
+
+    try:
+        with open(image_path, "rb") as f:
+            return {"data": f.read()}
+    except OSError as e:
+        return {"error": f"image read failed: {e}"}
+
+
+def _recognize_images(
+        preprocessed_list: list[PreprocessedImage],
+        deadline: Optional[OcrDeadline] = None,
+) -> list[dict]:
+    """
+    전처리된 이미지 목록 OCR 추론 (한 번에) + 이미지별 라인 후처리
+
+    Raises:
+        OcrDeadlineExceeded: 추론 중 deadline 만료/취소 (이미지·타일 단위로 확인)
+    """
+    if not preprocessed_list:
+        return []
+
+    with stage_timer("ocr.inference"):
+        # 긴 이미지는 타일 분할 OCR (타일 box는 전체 이미지 좌표로 환산됨)
+        ocr_results = run_tiled_ocr_many(
+            [preprocessed.image for preprocessed in preprocessed_list],
+            tile_height=_OCR_CONFIG.tile_height,
+            overlap=_OCR_CONFIG.tile_overlap,
+            run_many=partial(get_ocr_engine().run_many, deadline=deadline),
+        )
+    return [
+        _build_image_result(preprocessed, ocr_result)
+        for preprocessed, ocr_result in zip(preprocessed_list, ocr_results)
+    ]
+
+
+def _build_image_result(preprocessed: PreprocessedImage, ocr_result: dict) -> dict:
+    """OCR 추론 결과 → 라인화/헤더 감지/normalize/품질 필터/후처리"""
+    if not ocr_result.get("texts"):
+        return _fail("ocr returned empty raw result")
+
+    logger.debug(
+        "OCR raw result",
+        extra={
+            "raw_line_count": len(ocr_result["texts"]),
+            "confidence": round(ocr_result.get("confidence", 0), 2),
+            "scale": preprocessed.scale,
+            "text_height": preprocessed.text_height,
+            "angle_cls": ocr_result.get("angle_cls"),
+        },
+    )
+
+    with stage_timer("ocr.lines"):
+        # 실제 업스케일 배율과 무관하게 기준 좌표계(REFERENCE_SCALE)로 환산 후 라인화
+        lines = build_lines(to_reference_frame(ocr_result, preprocessed.scale))
+    logger.debug("OCR lines built", extra={"line_count": len(lines)})
+
+    # 이후 단계는 라인 묶음을 제자리 수정 (라인 제거 = active mask)
+    with stage_timer("ocr.headers"):
+        detect_visual_headers(lines)
+    with stage_timer("ocr.normalize"):
+        normalize_lines(lines)
+    with stage_timer("ocr.quality"):
+        normalized_count = len(lines)
+        dropped_lines = filter_low_quality_lines(
+            lines,
+            min_confidence=45,
+            max_garbage_ratio=0.6,
+            collect_dropped=_OCR_CONFIG.debug_dropped_lines,
+        )
+        dropped_count = normalized_count - len(lines)
+
+    with stage_timer("ocr.postprocess"):
+        postprocess_ocr_lines(lines)
+        ocr_lines = lines.to_dicts()
+    logger.debug(
+        "OCR postprocess completed",
+        extra={
+            "passed_line_count": len(ocr_lines),
+            "dropped_line_count": dropped_count,
+        },
+    )
+    if dropped_lines:
+        logger.debug("OCR dropped lines", extra={"dropped_lines": dropped_lines})
+
+    raw_text = build_raw_text(ocr_lines)
+    status = classify_confidence(ocr_result["confidence"]).value
+
+    return {
+        "rawText": raw_text,
+        "lines": ocr_lines,
+        "confidence": ocr_result["confidence"],
+        "status": status,
+        "scale": preprocessed.scale,
+        "angleCls": ocr_result.get("angle_cls", "off"),
+    }
 
 
 def _is_remote_image_path(path: str) -> bool:
@@ -161,7 +417,8 @@ def _is_remote_image_path(path: str) -> bool:
     return scheme in ("http", "https")
 
 
-def _download_remote_image_to_temp(url: str) -> dict:
+def _download_remote_image(url: str) -> dict:
+    """원격 이미지 다운로드 → {"data": bytes} 또는 {"error": str}"""
     try:
         parsed = urlparse(url)
         referer = f"{parsed.scheme}://{parsed.netloc}/" if parsed.scheme and parsed.netloc else ""
@@ -182,30 +439,13 @@ def _download_remote_image_to_temp(url: str) -> dict:
         resp = requests.get(url, headers=headers, timeout=15)
         resp.raise_for_status()
 
-        suffix = ".jpg"
         content_type = (resp.headers.get("Content-Type") or "").lower()
         # Some job-site image endpoints return octet-stream for image bytes.
-        # Accept octet-stream and infer by magic bytes when needed.
-        raw = resp.content or b""
+        # Accept octet-stream; the actual format is detected by cv2.imdecode.
         is_octet_stream = "application/octet-stream" in content_type
         if content_type and ("image" not in content_type) and not is_octet_stream:
             return {"error": f"remote image download failed: non-image content-type ({content_type})"}
 
-        if "png" in content_type or raw.startswith(b"\x89PNG"):
-            suffix = ".png"
-        elif "webp" in content_type or raw.startswith(b"RIFF") and raw[8:12] == b"WEBP":
-            suffix = ".webp"
-        elif "bmp" in content_type or raw.startswith(b"BM"):
-            suffix = ".bmp"
-        elif raw.startswith(b"\xff\xd8\xff"):
-            suffix = ".jpg"
-        elif "jpeg" in content_type or "jpg" in content_type:
-            suffix = ".jpg"
-
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            tmp.write(raw)
-            tmp_path = tmp.name
-
-        return {"path": tmp_path}
+        return {"data": resp.content or b""}
     except Exception as e:
         return {"error": f"remote image download failed: {e}"}
@@ -15,6 +15,7 @@ from common.vocab.loader import load_jd_vocab
 from ocr.garbled_korean import is_garbled_korean
 from common.section.loader import load_jd_meta_keywords
 from common.section.loader import load_header_keywords
+from ocr.line_batch import OcrLineBatch
 
 def is_korean_sentence(text: str) -> bool:
     """
@@ -32,15 +33,15 @@ def is_korean_sentence(text: str) -> bool:
     return sum(1 for c in text if '가' <= c <= '힣') >= 3
 
 
-def postprocess_ocr_lines(lines: list[dict]) -> list[dict]:
+def postprocess_ocr_lines(lines: OcrLineBatch) -> OcrLineBatch:
     """
-    JD 도메인 후처리 파이프라인
+    JD 도메인 후처리 파이프라인 (제자리 수정)
 
     입력:
-    - normalize_lines를 통과한 OCR 라인 리스트
+    - normalize_lines / 품질 필터를 통과한 OCR 라인 묶음
 
     출력:
-    - 의미가 보존된 JD 라인 리스트
+    - 의미가 보존된 JD 라인 묶음
     - (섹션 구조화, 요약 단계는 여기서 수행하지 않음)
     """
 
@@ -58,12 +59,12 @@ def postprocess_ocr_lines(lines: list[dict]) -> list[dict]:
 
     # JD와 무관한 라인 제거
     # (푸터, 전형절차 안내 등 명백한 노이즈만 제거)
-    filtered = filter_ocr_noise_lines(lines, noise_keywords)
-    processed: list[dict] = []
+    filter_ocr_noise_lines(lines, noise_keywords)
 
-    for line in filtered:
-        text = line.get("text", "")
-        section = line.get("section")
+    for index in lines.indices():
+        text = lines.texts[index]
+        # OCR 라인은 섹션 구조화 이전 단계 → section 없음
+        section = None
         # print(f"\n--- [LINE START] ---")
         # print(f"text = '{text}'")
 
@@ -72,23 +73,21 @@ def postprocess_ocr_lines(lines: list[dict]) -> list[dict]:
         # 0️⃣ 헤더 키워드면 무조건 보존
         if text_lower in header_keywords:
             # print("✅ KEEP: header keyword")
-            processed.append(line)
             continue
 
         # 1️⃣ OCR 깨진 한글 제거
         if is_garbled_korean(text):
             # print("❌ DROP: is_garbled_korean")
+            lines.drop(index)
             continue
 
         # 2️⃣ JD 메타 정보 보호 (전형절차, 고용형태 등)
         if any(k in text_lower for k in meta_keywords):
             # print("✅ KEEP: meta keyword")
-            processed.append(line)
             continue
 
         # 3️⃣ 한국어 설명 문장 보호
         if is_korean_sentence(text):
-            processed.append(line)
             continue
 
         # 3️⃣ 기술/영문 토큰만 정규화
@@ -114,16 +113,10 @@ def postprocess_ocr_lines(lines: list[dict]) -> list[dict]:
         # (의미 있는 라인이 사라지는 것을 방지)
         if not new_tokens:
             # print("⚠️ KEEP: empty tokens, keeping original")
-            processed.append(line)
             continue
-        
-        new_text = " ".join(new_tokens)
 
         # 5️⃣ 정규화된 토큰으로 텍스트 교체
-        processed.append({
-            **line,
-            "text": new_text
-        })
+        lines.texts[index] = " ".join(new_tokens)
 
     # 이 단계에서는 구조화(build_sections) 하지 않음
-    return processed
+    return lines
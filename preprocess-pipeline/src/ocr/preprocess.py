@@ -1,16 +1,57 @@
+from dataclasses import dataclass
 from pathlib import Path
 import cv2
+import numpy as np
 
 
-UPSCALE_FACTOR = 2.0
+# 좌표 기준 배율
+# - 기존 고정 업스케일(2.0) 기준으로 build_lines / header 감지 임계값(px)이 튜닝되어 있음
+# - 실제 배율과 무관하게 OCR box는 이 배율 좌표계로 환산해서 하위 단계에 넘긴다
+REFERENCE_SCALE = 2.0
 
-def preprocess_image(image_path: str):
+# 적응형 업스케일 정책
+MAX_UPSCALE = 2.0
+TARGET_TEXT_HEIGHT = 32.0      # 업스케일 후 목표 본문 글자 높이(px)
+MIN_WORTHWHILE_SCALE = 1.2     # 이보다 작은 배율은 리사이즈 비용 대비 이득 없음 → 원본 유지
+FALLBACK_WIDTH = 1200          # 글자 높이 추정 실패 시: 폭이 이보다 작을 때만 업스케일
+MAX_SIDE = 8000                # 업스케일 후 최대 변 길이 (이 제한으로 원본보다 축소하지는 않음)
+
+# 글자 높이 추정 파라미터
+_ESTIMATE_MAX_WIDTH = 800      # 추정 시 가로 방향 샘플링 폭
+_INK_ROW_RATIO = 0.002         # 이 비율 이상 잉크 픽셀이 있는 row를 텍스트 row로 간주
+_SOLID_ROW_RATIO = 0.9         # 구분선/배경 띠 등 거의 꽉 찬 row 제외
+_MIN_RUN = 4
+_MIN_RUN_COUNT = 3
+
+# OCR 결과 캐시 키에 포함 (전처리 정책이 바뀌면 기존 캐시 무효)
+PREPROCESS_VERSION = (
+    f"adaptive:max={MAX_UPSCALE}:target={TARGET_TEXT_HEIGHT}:min={MIN_WORTHWHILE_SCALE}"
+    f":width={FALLBACK_WIDTH}:side={MAX_SIDE}:cubic"
+)
+
+
+@dataclass(frozen=True, eq=False)
+class PreprocessedImage:
+    """
+    전처리 결과
+
+    - image: PaddleOCR 입력 (3채널 BGR)
+    - scale: 원본 대비 적용 배율
+    - text_height: 원본 기준 추정 글자 높이(px), 추정 실패 시 None
+    """
+    image: np.ndarray
+    scale: float
+    text_height: float | None = None
+
+
+def preprocess_image(image_path: str) -> PreprocessedImage:
     """
     PaddleOCR 기반 JD OCR을 위한 이미지 전처리 함수.
 
     이 함수의 역할:
     - PaddleOCR가 요구하는 3채널 이미지 형식을 유지한다.
     - JD의 작은 폰트 인식을 위해 해상도만 보조적으로 보정한다.
+      (이미 글자가 충분히 큰 이미지는 그대로 둔다)
 
     설계 원칙:
     - PaddleOCR 내부 전처리를 신뢰한다.
@@ -26,7 +67,107 @@ def preprocess_image(image_path: str):
     if image is None:
         raise ValueError(f"Failed to load image: {image_path}")
 
-    # JD의 작은 폰트 보조용 업스케일
-    image = cv2.resize(image, None, fx=UPSCALE_FACTOR, fy=UPSCALE_FACTOR, interpolation=cv2.INTER_CUBIC)
+    return _upscale(image)
+
+
+def preprocess_image_bytes(data: bytes | bytearray | memoryview) -> PreprocessedImage:
+    """
+    메모리상의 인코딩된 이미지(다운로드 응답 등)를 디스크 경유 없이 전처리한다.
+
+    preprocess_image와 동일한 결과를 반환한다. (imread 대신 imdecode)
+    """
+    return preprocess_decoded_image(decode_image_bytes(data))
 
+
+def decode_image_bytes(data: bytes | bytearray | memoryview) -> np.ndarray:
+    """인코딩된 이미지 → 3채널 BGR 원본 (전처리 전, triage 등 원본 기준 판단용)"""
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    if buffer.size == 0:
+        raise ValueError("Empty image buffer")
+
+    image = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError(f"Failed to decode image buffer ({buffer.size} bytes)")
     return image
+
+
+def preprocess_decoded_image(image: np.ndarray) -> PreprocessedImage:
+    """decode_image_bytes 결과 전처리 (preprocess_image_bytes의 디코딩 이후 단계)"""
+    return _upscale(image)
+
+
+def to_reference_frame(ocr_result: dict, scale: float) -> dict:
+    """
+    OCR 결과 boxes((N,4,2) 배열)를 REFERENCE_SCALE 좌표계로 환산한다.
+
+    build_lines / detect_visual_headers 등 하위 단계의 px 임계값이
+    업스케일 배율과 무관하게 동일한 의미를 갖도록 하기 위함.
+    """
+    factor = REFERENCE_SCALE / scale
+    if factor == 1.0:
+        return ocr_result
+
+    converted = dict(ocr_result)
+    converted["boxes"] = ocr_result["boxes"] * np.float32(factor)
+    return converted
+
+
+def choose_scale(image: np.ndarray, text_height: float | None) -> float:
+    """
+    업스케일 배율 결정
+
+    - 글자 높이 추정 성공: TARGET_TEXT_HEIGHT에 맞추되 MAX_UPSCALE 이하
+    - 추정 실패: 폭이 FALLBACK_WIDTH 미만일 때만 MAX_UPSCALE
+    - 업스케일 후 최대 변이 MAX_SIDE를 넘지 않도록 제한 (축소는 하지 않음)
+    """
+    height, width = image.shape[:2]
+
+    if text_height:
+        scale = min(MAX_UPSCALE, TARGET_TEXT_HEIGHT / text_height)
+    else:
+        scale = MAX_UPSCALE if width < FALLBACK_WIDTH else 1.0
+
+    scale = min(scale, MAX_SIDE / max(height, width))
+    if scale < MIN_WORTHWHILE_SCALE:
+        return 1.0
+    return round(scale, 3)
+
+
+def estimate_text_height(image: np.ndarray) -> float | None:
+    """
+    가로 projection 기반 본문 글자 높이 추정 (원본 px)
+
+    - Otsu 이진화 후 잉크가 있는 row의 연속 구간(run) 길이 median
+    - 배경이 어두운 이미지는 반전해서 처리
+    - 유효 run이 충분하지 않으면 None
+    """
+    height, width = image.shape[:2]
+    step = max(1, width // _ESTIMATE_MAX_WIDTH)
+    gray = cv2.cvtColor(image[:, ::step], cv2.COLOR_BGR2GRAY)
+
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    ink = binary == 0
+    if ink.mean() > 0.5:
+        ink = ~ink
+
+    row_ratio = ink.mean(axis=1)
+    text_rows = (row_ratio >= _INK_ROW_RATIO) & (row_ratio <= _SOLID_ROW_RATIO)
+
+    edges = np.diff(np.concatenate(([0], text_rows.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    runs = ends - starts
+    runs = runs[(runs >= _MIN_RUN) & (runs <= max(_MIN_RUN, height // 4))]
+
+    if runs.size < _MIN_RUN_COUNT:
+        return None
+    return float(np.median(runs))
+
+
+def _upscale(image: np.ndarray) -> PreprocessedImage:
+    # JD의 작은 폰트 보조용 업스케일 (필요한 경우에만)
+    text_height = estimate_text_height(image)
+    scale = choose_scale(image, text_height)
+    if scale != 1.0:
+        image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+    return PreprocessedImage(image=image, scale=scale, text_height=text_height)
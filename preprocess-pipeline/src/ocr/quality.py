@@ -1,15 +1,19 @@
 
+from ocr.line_batch import OcrLineBatch
+
+
 def filter_low_quality_lines(
-        lines: list[dict],
+        lines: OcrLineBatch,
         min_confidence: int = 45,
         max_garbage_ratio: float = 0.6,
-) -> tuple[list[dict], list[dict]]:
+        collect_dropped: bool = False,
+) -> list[dict]:
     """
-    OCR 결과에 대한 라인 단위 품질 게이트.
+    OCR 결과에 대한 라인 단위 품질 게이트. (제자리 수정)
 
     이 함수의 역할:
     - OCR 결과 중 명백히 신뢰하기 어려운 라인을 초기 단계에서 제거한다.
-    - 제거된 라인은 이후 품질 기준 조정과 분석을 위해 별도로 보관한다.
+    - collect_dropped=True(디버그)면 제거된 라인을 품질 기준 조정/분석용으로 별도 기록한다.
 
     설계 원칙:
     - 이 단계에서는 텍스트를 교정하지 않는다.
@@ -17,47 +21,43 @@ def filter_low_quality_lines(
     - 'OCR 실패 가능성이 높은 라인'만 보수적으로 차단한다.
 
     입력:
-    - lines: normalize_lines 이후의 line 단위 OCR 결과
+    - lines: normalize_lines 이후의 OCR 라인 묶음
 
     출력:
-    - passed_lines: 품질 기준을 통과한 라인 리스트
-    - dropped_lines: 품질 기준에 의해 제거된 라인 리스트 (사유 포함)
+    - 제거된 라인 리스트 (사유 포함, collect_dropped=False면 항상 빈 리스트)
+    - 통과 여부는 lines.active 에 반영
     """
 
-    passed_lines = []
-    dropped_lines = []
+    dropped_lines: list[dict] = []
+
+    def drop(index: int, reason: str, **detail) -> None:
+        if collect_dropped:
+            dropped_lines.append({"reason": reason, **detail, "line": lines.line(index)})
+        lines.drop(index)
 
-    for line in lines:
-        text = line.get("text", "").strip()
+    confidences = lines.confidence_avg
+
+    for index in lines.indices():
+        text = lines.texts[index].strip()
 
         # 빈 텍스트 라인은 OCR 실패로 간주하고 제거한다.
         if not text:
-            dropped_lines.append({
-                "reason": "empty_text",
-                "line": line
-            })
+            drop(index, "empty_text")
             continue
 
         tokens = text.split()
 
         # 토큰이 없는 라인은 의미 없는 결과로 간주한다.
         if not tokens:
-            dropped_lines.append({
-                "reason": "no_tokens",
-                "line": line
-            })
+            drop(index, "no_tokens")
             continue
 
         # PaddleOCR 기준: line-level confidence 사용
-        confidence = line.get("confidence_avg", 100)
+        confidence = confidences[index].item()
 
         # OCR 엔진 자체가 신뢰하지 않는 라인은 초기에 차단한다.
         if confidence < min_confidence:
-            dropped_lines.append({
-                "reason": "low_confidence",
-                "confidence": confidence,
-                "line": line
-            })
+            drop(index, "low_confidence", confidence=confidence)
             continue
 
         # 라인 내 garbage 토큰 비율 계산
@@ -69,17 +69,9 @@ def filter_low_quality_lines(
 
         # 의미 있는 텍스트보다 잡음이 많은 라인은 제거한다.
         if garbage_ratio > max_garbage_ratio:
-            dropped_lines.append({
-                "reason": "high_garbage_ratio",
-                "garbage_ratio": garbage_ratio,
-                "line": line
-            })
-            continue
-
-        # 모든 품질 기준을 통과한 라인
-        passed_lines.append(line)
+            drop(index, "high_garbage_ratio", garbage_ratio=garbage_ratio)
 
-    return passed_lines, dropped_lines
+    return dropped_lines
 
 def _looks_garbage_token(token: str) -> bool:
     """
@@ -0,0 +1,216 @@
+"""
+OCR 결과 캐시 (이미지 content hash 기반)
+
+책임:
+- 이미지 bytes + OCR 엔진/전처리/후처리 버전으로 캐시 키 생성
+- 후처리까지 끝난 이미지 단위 결과(rawText/lines/confidence/status) 저장
+- 2단 구성
+  - memory: 프로세스 내 LRU (엔트리 수 제한, pickle bytes로 보관 → 호출자 수정이 캐시에 전파되지 않음)
+  - disk  : cache_dir 하위 파일 (총 용량 제한, 오래 사용되지 않은 순으로 삭제)
+
+설계 원칙:
+- 같은 이미지라도 엔진/전처리/후처리 로직이 바뀌면 키가 달라진다 (버전 문자열 포함)
+- 캐시 장애는 OCR 처리를 막지 않는다 (읽기/쓰기 실패 시 miss로 취급)
+- disk tier는 여러 OCR 프로세스가 공유할 수 있다 (임시 파일 → os.replace로 원자적 기록)
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from infra.metrics import OCR_CACHE_REQUESTS_TOTAL
+
+logger = logging.getLogger(__name__)
+
+_FILE_SUFFIX = ".pkl"
+# 용량 초과 시 max_bytes의 이 비율까지 줄인다 (매 put마다 evict 반복 방지)
+_EVICT_TARGET_RATIO = 0.9
+
+
+def build_cache_key(data: bytes | bytearray | memoryview, version: str) -> str:
+    """이미지 content hash + 버전 문자열 → 캐시 키 (sha256 hex)"""
+    content_hash = hashlib.sha256(data).hexdigest()
+    return hashlib.sha256(f"{content_hash}|{version}".encode("utf-8")).hexdigest()
+
+
+class OcrResultCache:
+    """
+    OCR 이미지 결과 2단 캐시 (memory LRU + size-bounded disk)
+
+    - memory_entries <= 0 이면 memory tier 비활성
+    - cache_dir 미지정이면 disk tier 비활성
+    - thread-safe (prefetch 스레드 조회 / 추론 스레드 저장)
+    """
+
+    def __init__(
+            self,
+            memory_entries: int = 256,
+            cache_dir: Optional[str] = None,
+            max_disk_bytes: int = 512 * 1024 * 1024,
+    ):
+        self._memory_entries = memory_entries
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._cache_dir = cache_dir or None
+        self._max_disk_bytes = max_disk_bytes
+        self._disk_bytes = 0
+
+        if self._cache_dir:
+            try:
+                os.makedirs(self._cache_dir, exist_ok=True)
+                self._disk_bytes = sum(size for _, _, size in self._scan_disk())
+            except OSError as e:
+                logger.error(
+                    "OCR cache dir unavailable, disk tier disabled",
+                    extra={"cache_dir": self._cache_dir, "error": str(e)},
+                )
+                self._cache_dir = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._memory_entries > 0 or self._cache_dir is not None
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+
+        if payload is not None:
+            OCR_CACHE_REQUESTS_TOTAL.labels(result="memory_hit").inc()
+            return pickle.loads(payload)
+
+        payload = self._disk_get(key)
+        if payload is None:
+            OCR_CACHE_REQUESTS_TOTAL.labels(result="miss").inc()
+            return None
+
+        try:
+            result = pickle.loads(payload)
+        except Exception as e:
+            logger.warning("OCR cache entry corrupted", extra={"key": key, "error": str(e)})
+            OCR_CACHE_REQUESTS_TOTAL.labels(result="miss").inc()
+            return None
+
+        OCR_CACHE_REQUESTS_TOTAL.labels(result="disk_hit").inc()
+        self._memory_put(key, payload)
+        return result
+
+    def put(self, key: str, result: dict) -> None:
+        try:
+            payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning("OCR cache serialize failed", extra={"key": key, "error": str(e)})
+            return
+
+        self._memory_put(key, payload)
+        self._disk_put(key, payload)
+
+    # ==================================================
+    # memory tier
+    # ==================================================
+    def _memory_put(self, key: str, payload: bytes) -> None:
+        if self._memory_entries <= 0:
+            return
+        with self._lock:
+            self._memory[key] = payload
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_entries:
+                self._memory.popitem(last=False)
+
+    # ==================================================
+    # disk tier
+    # ==================================================
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key[:2], key + _FILE_SUFFIX)
+
+    def _disk_get(self, key: str) -> Optional[bytes]:
+        if not self._cache_dir:
+            return None
+
+        path = self._path_for(key)
+        try:
+            with open(path, "rb") as f:
+                payload = f.read()
+            # LRU 기준 갱신 (eviction은 mtime 오래된 순)
+            os.utime(path)
+            return payload
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("OCR cache read failed", extra={"path": path, "error": str(e)})
+            return None
+
+    def _disk_put(self, key: str, payload: bytes) -> None:
+        if not self._cache_dir:
+            return
+
+        path = self._path_for(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning("OCR cache write failed", extra={"path": path, "error": str(e)})
+            return
+
+        with self._lock:
+            self._disk_bytes += len(payload)
+            over_limit = self._disk_bytes > self._max_disk_bytes
+        if over_limit:
+            self._evict_disk()
+
+    def _scan_disk(self) -> list[tuple[float, str, int]]:
+        """(mtime, path, size) 목록 (다른 프로세스가 기록한 파일 포함)"""
+        entries = []
+        for dirpath, _, filenames in os.walk(self._cache_dir):
+            for name in filenames:
+                if not name.endswith(_FILE_SUFFIX):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, path, stat.st_size))
+        return entries
+
+    def _evict_disk(self) -> None:
+        entries = sorted(self._scan_disk())
+        total = sum(size for _, _, size in entries)
+        target = int(self._max_disk_bytes * _EVICT_TARGET_RATIO)
+        removed = 0
+
+        for _, path, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("OCR cache evict failed", extra={"path": path, "error": str(e)})
+                continue
+            total -= size
+            removed += 1
+
+        with self._lock:
+            self._disk_bytes = total
+
+        logger.info(
+            "OCR cache evicted",
+            extra={"removed": removed, "disk_bytes": total, "max_disk_bytes": self._max_disk_bytes},
+        )
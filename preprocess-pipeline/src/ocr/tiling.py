@@ -0,0 +1,221 @@
+"""
+세로로 긴 JD 이미지 타일 분할 OCR
+
+책임:
+- 긴 이미지를 겹치는(overlap) 가로 띠 타일로 분할해 타일별 OCR 실행
+- 타일 box를 전체 이미지 좌표로 환산 (build_lines 정렬 / 줄 병합 유지)
+- overlap 구간에서 중복 인식된 라인 제거 (bbox 겹침 + 텍스트 유사도)
+
+설계 원칙:
+- 타일은 numpy view (복사 없음)
+- overlap은 본문 한 줄 높이보다 충분히 커야 한다 (경계에 걸린 줄이 어느 한 타일에는 온전히 포함)
+- 타일 OCR 실행 방식(run_many)은 호출자가 결정 (엔진 pool이면 타일 병렬)
+- 여러 이미지의 타일을 한 번의 run_many로 실행 (recognition 배치가 이미지/타일 경계에서 끊기지 않음)
+"""
+
+from difflib import SequenceMatcher
+from typing import Callable
+
+import numpy as np
+
+from ocr.engine import OCRResult, empty_ocr_result, run_ocr_batch
+
+# 타일 경계에 이만큼(px) 붙어 있으면 잘린 라인으로 간주
+_EDGE_MARGIN = 2
+# 같은 라인 판정: 작은 box 기준 가로/세로 겹침 비율 + 텍스트 유사도
+_MIN_X_OVERLAP = 0.5
+_MIN_Y_OVERLAP = 0.5
+_MIN_TEXT_SIMILARITY = 0.6
+# 타일별 방향 분류 경로 → 이미지 대표값 (앞쪽 우선)
+_ANGLE_CLS_PRIORITY = ("full", "sampled", "off")
+
+
+def split_tiles(image: np.ndarray, tile_height: int, overlap: int) -> list[tuple[int, np.ndarray]]:
+    """
+    (y_offset, tile) 목록
+
+    - 마지막 타일은 이미지 하단에 맞춘다 (짧은 자투리 타일 방지)
+    - 이미지 높이가 tile_height 이하이면 단일 타일
+    """
+    height = image.shape[0]
+    if height <= tile_height:
+        return [(0, image)]
+
+    stride = tile_height - overlap
+    offsets = list(range(0, height - tile_height, stride))
+    offsets.append(height - tile_height)
+    return [(y, image[y:y + tile_height]) for y in offsets]
+
+
+def run_tiled_ocr(
+        image: np.ndarray,
+        tile_height: int,
+        overlap: int,
+        run_many: Callable[[list[np.ndarray]], list[OCRResult]] = run_ocr_batch,
+) -> OCRResult:
+    """타일 분할 OCR (tile_height 이하 이미지는 단일 OCR과 동일)"""
+    return run_tiled_ocr_many([image], tile_height, overlap, run_many)[0]
+
+
+def run_tiled_ocr_many(
+        images: list[np.ndarray],
+        tile_height: int,
+        overlap: int,
+        run_many: Callable[[list[np.ndarray]], list[OCRResult]] = run_ocr_batch,
+) -> list[OCRResult]:
+    """
+    여러 이미지 타일 분할 OCR, 입력 순서대로 결과 반환
+
+    Args:
+        run_many: 이미지 목록 OCR (입력 순서대로 결과 반환, OcrEngine.run_many)
+                  전체 이미지의 타일을 한 번에 전달한다
+    """
+    plans = [_plan_tiles(image, tile_height, overlap) for image in images]
+    flat_results = run_many([tile for plan in plans for _, tile in plan])
+
+    results = []
+    position = 0
+    for image, tiles in zip(images, plans):
+        tile_results = flat_results[position:position + len(tiles)]
+        position += len(tiles)
+        results.append(tile_results[0] if len(tiles) == 1 else _merge_tiles(image, tiles, tile_results))
+    return results
+
+
+def _plan_tiles(image: np.ndarray, tile_height: int, overlap: int) -> list[tuple[int, np.ndarray]]:
+    if tile_height <= 0 or image.shape[0] <= tile_height:
+        return [(0, image)]
+    if not 0 <= overlap < tile_height:
+        raise ValueError(f"invalid tile overlap: {overlap} (tile_height={tile_height})")
+    return split_tiles(image, tile_height, overlap)
+
+
+def _merge_tiles(
+        image: np.ndarray,
+        tiles: list[tuple[int, np.ndarray]],
+        results: list[OCRResult],
+) -> OCRResult:
+    merged: list[_TiledLine] = []
+    prev_bottom = 0
+    for (y_offset, tile), result in zip(tiles, results):
+        tile_bottom = y_offset + tile.shape[0]
+        incoming = _tiled_lines(result, y_offset, tile_bottom, image.shape[0])
+        merged = _merge_overlap(merged, incoming, zone_top=y_offset, zone_bottom=prev_bottom)
+        prev_bottom = tile_bottom
+
+    # 타일 중 하나라도 전체 분류했으면 full
+    angle_cls = min(
+        (result.get("angle_cls", "off") for result in results),
+        key=_ANGLE_CLS_PRIORITY.index,
+    )
+    if not merged:
+        return empty_ocr_result(angle_cls)
+
+    scores = np.array([item.score for item in merged], dtype=np.float64)
+    return {
+        "texts": [item.text for item in merged],
+        "scores": scores,
+        "boxes": np.stack([item.box for item in merged]),
+        # run_ocr와 동일한 척도 (라인 score 평균 × 100)
+        "confidence": float(scores.mean()),
+        "angle_cls": angle_cls,
+    }
+
+
+class _TiledLine:
+    """전역 좌표 라인 + 출처 타일 범위 (중복 제거 판단용)"""
+
+    __slots__ = ("text", "score", "box", "left", "top", "right", "bottom", "truncated")
+
+    def __init__(self, text: str, score: float, box: np.ndarray, bounds: list[float], truncated: bool):
+        self.text = text
+        self.score = score
+        self.box = box
+        self.left, self.top, self.right, self.bottom = bounds
+        self.truncated = truncated
+
+
+def _tiled_lines(result: OCRResult, tile_top: int, tile_bottom: int, image_height: int) -> list[_TiledLine]:
+    """타일 결과 → 전역 좌표 라인 (box 이동 / 범위 / 잘림 판정은 타일 단위 배열 연산)"""
+    boxes = result["boxes"]
+    if not len(boxes):
+        return []
+
+    boxes = boxes + np.array((0.0, tile_top), dtype=np.float32)
+    bounds = np.concatenate([boxes.min(axis=1), boxes.max(axis=1)], axis=1)
+    tops, bottoms = bounds[:, 1], bounds[:, 3]
+    # 이미지 실제 상/하단이 아닌 타일 경계에 닿은 라인은 잘렸을 수 있음
+    truncated = np.zeros(len(boxes), dtype=bool)
+    if tile_top > 0:
+        truncated |= tops <= tile_top + _EDGE_MARGIN
+    if tile_bottom < image_height:
+        truncated |= bottoms >= tile_bottom - _EDGE_MARGIN
+
+    return [
+        _TiledLine(text, score, box, line_bounds, line_truncated)
+        for text, score, box, line_bounds, line_truncated in zip(
+            result["texts"], result["scores"].tolist(), boxes, bounds.tolist(), truncated.tolist()
+        )
+    ]
+
+
+def _merge_overlap(
+        merged: list[_TiledLine],
+        incoming: list[_TiledLine],
+        zone_top: int,
+        zone_bottom: int,
+) -> list[_TiledLine]:
+    """
+    이전 타일까지의 결과(merged)에 다음 타일 라인(incoming) 병합
+
+    overlap 구간 [zone_top, zone_bottom)에 걸친 라인끼리만 비교하고,
+    중복이면 잘리지 않은/더 긴/더 확신도 높은 쪽을 남긴다.
+    """
+    candidates = [i for i, item in enumerate(merged) if item.bottom > zone_top]
+
+    for item in incoming:
+        if item.top >= zone_bottom:
+            merged.append(item)
+            continue
+
+        match = next((i for i in candidates if _is_same_line(merged[i], item)), None)
+        if match is None:
+            merged.append(item)
+            continue
+
+        # 이전 타일 라인 하나는 한 번만 매칭
+        candidates.remove(match)
+        if _prefer(item, merged[match]):
+            merged[match] = item
+
+    return merged
+
+
+def _is_same_line(a: _TiledLine, b: _TiledLine) -> bool:
+    x_overlap = min(a.right, b.right) - max(a.left, b.left)
+    y_overlap = min(a.bottom, b.bottom) - max(a.top, b.top)
+    if x_overlap <= 0 or y_overlap <= 0:
+        return False
+
+    min_width = min(a.right - a.left, b.right - b.left) or 1.0
+    min_height = min(a.bottom - a.top, b.bottom - b.top) or 1.0
+    if x_overlap / min_width < _MIN_X_OVERLAP or y_overlap / min_height < _MIN_Y_OVERLAP:
+        return False
+
+    # 잘린 라인은 텍스트 일부만 인식되므로 위치 겹침만으로 중복 판정
+    if a.truncated or b.truncated:
+        return True
+
+    text_a, text_b = a.text, b.text
+    if text_a in text_b or text_b in text_a:
+        return True
+    return SequenceMatcher(None, text_a, text_b).ratio() >= _MIN_TEXT_SIMILARITY
+
+
+def _prefer(candidate: _TiledLine, current: _TiledLine) -> bool:
+    if candidate.truncated != current.truncated:
+        return current.truncated
+    candidate_len, current_len = len(candidate.text), len(current.text)
+    if candidate_len != current_len:
+        return candidate_len > current_len
+    return candidate.score > current.score
@@ -0,0 +1,96 @@
+"""
+OCR 전 이미지 분류 (triage)
+
+책임:
+- 디코딩된 원본 이미지를 축소해 edge 기반으로 "JD 텍스트가 있을 법한지" 추정
+- 결정: OCR(ocr) / 뒤로 미룸(defer, 요청 시간 예산 안에서만 OCR) / 건너뜀(skip)
+
+판단 기준 (축소 이미지의 Canny edge):
+- too_small: 아이콘/구분선/추적 픽셀 등 최소 변이 _MIN_SIDE 미만
+- blank    : edge가 거의 없음 (단색/그라데이션 배경, 빈 이미지)
+- low_text : 텍스트 줄 밀도가 낮음 (사진/일러스트/장식 배너)
+  텍스트 줄 = edge가 있는 row의 연속 구간 중 줄 높이 범위인 것 (사진은 하나의 긴 구간)
+
+설계 원칙:
+- OCR 엔진을 쓰지 않는다 (prefetch 스레드에서 실행, 이미지당 수 ms)
+- 보수적으로: 확실히 텍스트가 없는 이미지만 skip, 애매하면 defer
+"""
+
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+# 판단용 축소 폭 (원본이 더 작으면 그대로)
+_TRIAGE_WIDTH = 480
+_MIN_SIDE = 32
+_CANNY_LOW = 50
+_CANNY_HIGH = 150
+# 이 비율 미만이면 blank
+_MIN_EDGE_DENSITY = 0.001
+# 이 비율 이상 edge 픽셀이 있는 row를 텍스트 후보 row로 간주
+_TEXT_ROW_EDGE_RATIO = 0.01
+# 텍스트 줄로 볼 연속 row 수 범위 (축소 이미지 기준)
+_MIN_LINE_ROWS = 2
+_MAX_LINE_ROWS = 48
+# 텍스트 줄 row 비율이 이 값 미만이면 low_text
+_MIN_TEXT_ROW_RATIO = 0.05
+
+DECISION_OCR = "ocr"
+DECISION_DEFER = "defer"
+DECISION_SKIP = "skip"
+
+
+@dataclass(frozen=True)
+class TriageResult:
+    """
+    - decision   : ocr | defer | skip
+    - reason     : ok | too_small | blank | low_text
+    - edge_density / text_row_ratio: 축소 이미지 기준 추정치 (판단 전에 끝난 경우 None)
+    """
+    decision: str
+    reason: str
+    edge_density: float | None = None
+    text_row_ratio: float | None = None
+
+    def describe(self) -> str:
+        """skip/defer 사유 문자열 (errors 기록용)"""
+        metrics = []
+        if self.edge_density is not None:
+            metrics.append(f"edge_density={self.edge_density:.4f}")
+        if self.text_row_ratio is not None:
+            metrics.append(f"text_row_ratio={self.text_row_ratio:.3f}")
+        return f"{self.reason} ({', '.join(metrics)})" if metrics else self.reason
+
+
+def triage_image(image: np.ndarray) -> TriageResult:
+    """디코딩된 원본 이미지(BGR) → OCR 우선순위 결정"""
+    height, width = image.shape[:2]
+    if min(height, width) < _MIN_SIDE:
+        return TriageResult(DECISION_SKIP, "too_small")
+
+    if width > _TRIAGE_WIDTH:
+        factor = _TRIAGE_WIDTH / width
+        image = cv2.resize(image, None, fx=factor, fy=factor, interpolation=cv2.INTER_LINEAR)
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    edges = cv2.Canny(gray, _CANNY_LOW, _CANNY_HIGH) > 0
+    edge_density = float(edges.mean())
+    if edge_density < _MIN_EDGE_DENSITY:
+        return TriageResult(DECISION_SKIP, "blank", edge_density)
+
+    text_row_ratio = _text_row_ratio(edges)
+    if text_row_ratio < _MIN_TEXT_ROW_RATIO:
+        return TriageResult(DECISION_DEFER, "low_text", edge_density, text_row_ratio)
+    return TriageResult(DECISION_OCR, "ok", edge_density, text_row_ratio)
+
+
+def _text_row_ratio(edges: np.ndarray) -> float:
+    """텍스트 줄 높이 범위의 edge row 연속 구간이 차지하는 row 비율"""
+    rows = edges.shape[0]
+    text_rows = edges.mean(axis=1) >= _TEXT_ROW_EDGE_RATIO
+
+    boundaries = np.diff(np.concatenate(([0], text_rows.astype(np.int8), [0])))
+    runs = np.flatnonzero(boundaries == -1) - np.flatnonzero(boundaries == 1)
+    line_runs = runs[(runs >= _MIN_LINE_ROWS) & (runs <= _MAX_LINE_ROWS)]
+    return float(line_runs.sum()) / rows
@@ -1,6 +1,6 @@
 # src/outputs/kafka_jd_preprocess_output.py
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Optional, Dict, List, Any
 from datetime import date
 from domain.job_source import JobSource
@@ -53,50 +53,44 @@ class KafkaJdPreprocessOutput:
 
     def to_dict(self) -> Dict[str, Any]:
         """
-        Kafka 메시지로 직렬화
+        Kafka 메시지로 직렬화 (camelCase, Spring 규약)
+
+        asdict() 깊은 복사 없이 필드를 직접 참조한다.
+        canonical_map / skills는 원본 객체를 공유하므로 반환 dict는 직렬화 용도로만 사용한다.
 
         Returns:
             JSON 직렬화 가능한 dict
         """
-        data = asdict(self)
-
-        # JobSource enum을 문자열로 변환
-        if isinstance(self.source, JobSource):
-            data['source'] = self.source.value
-
-        # 필드명을 camelCase로 변환 (Spring 규약)
-        kafka_message = {
+        return {
             # Event Identity
-            "eventId": data["event_id"],
-            "requestId": data["request_id"],
+            "eventId": self.event_id,
+            "requestId": self.request_id,
 
             # Event Metadata
-            "eventType": data["event_type"],
-            "version": data["version"],
-            "occurredAt": data["occurred_at"],
+            "eventType": self.event_type,
+            "version": self.version,
+            "occurredAt": self.occurred_at,
 
             # Context
-            "brandName": data["brand_name"],
-            "positionName": data["position_name"],
+            "brandName": self.brand_name,
+            "positionName": self.position_name,
 
-            # Source
-            "source": data["source"],
-            "sourceUrl": data["source_url"],
+            # Source (JobSource enum → 문자열)
+            "source": self.source.value if isinstance(self.source, JobSource) else self.source,
+            "sourceUrl": self.source_url,
 
             # Canonical Result
-            "canonicalMap": data["canonical_map"] or {},
+            "canonicalMap": self.canonical_map or {},
 
             # Recruitment Info
-            "recruitmentPeriodType": data["recruitment_period_type"],
-            "openedDate": data["opened_date"],
-            "closedDate": data["closed_date"],
+            "recruitmentPeriodType": self.recruitment_period_type,
+            "openedDate": self.opened_date,
+            "closedDate": self.closed_date,
 
             # Skills
-            "skills": data["skills"] or [],
+            "skills": self.skills or [],
         }
 
-        return kafka_message
-
     @staticmethod
     def from_domain(
             request_id: str,
@@ -1,4 +1,5 @@
 import logging
+from infra.metrics import stage_timer
 from inputs.jd_preprocess_input import JdPreprocessInput
 from ocr.pipeline import process_ocr_input
 from ocr.structure.header_grouping import extract_sections_by_header
@@ -29,7 +30,8 @@ class OcrPipeline:
             raise ValueError("images is required for OcrPipeline")
 
         # 1️⃣ OCR 실행
-        ocr_result = process_ocr_input(input.images)
+        with stage_timer("ocr.run"):
+            ocr_result = process_ocr_input(input.images)
 
         logger.info(
             "OCR executed",
@@ -52,10 +54,11 @@ class OcrPipeline:
             raise RuntimeError("OCR failed: confidence too low")
 
         # 2️⃣ Header 기반 구조화 (OCR 전용)
-        raw_sections = extract_sections_by_header(ocr_result["lines"])
+        with stage_timer("ocr.sections"):
+            raw_sections = extract_sections_by_header(ocr_result["lines"])
 
-        # 2.5️⃣ 섹션 구조 후보정
-        raw_sections = validate_raw_sections(raw_sections)
+            # 2.5️⃣ 섹션 구조 후보정
+            raw_sections = validate_raw_sections(raw_sections)
 
         if not raw_sections:
             logger.warning(
@@ -81,13 +84,15 @@ class OcrPipeline:
         sections = adapt_ocr_sections_to_sections(raw_sections)
 
         # 4️⃣ Metadata (OCR 원본 기준)
-        document_meta = self.metadata.process(
-            [line["text"] for line in ocr_result["lines"] if line.get("text")]
-        )
+        with stage_timer("ocr.metadata"):
+            document_meta = self.metadata.process(
+                [line["text"] for line in ocr_result["lines"] if line.get("text")]
+            )
 
         # 5️⃣ Canonical 후처리 (Semantic → Filter → Canonical)
-        canonical_map = self.canonical.process(sections)
-        canonical_map = self.canonical.to_jobsummary_canonical_map(canonical_map)
+        with stage_timer("ocr.canonical"):
+            canonical_map = self.canonical.process(sections)
+            canonical_map = self.canonical.to_jobsummary_canonical_map(canonical_map)
 
         # 6️⃣ 최종 결과
         logger.info(
@@ -1,4 +1,5 @@
 import logging
+from infra.metrics import stage_timer
 from inputs.jd_preprocess_input import JdPreprocessInput
 
 from preprocess.core_preprocess.core_preprocessor import CorePreprocessor
@@ -40,21 +41,26 @@ class TextPreprocessPipeline:
         # 1️⃣ Core
         # - 줄 단위 정규화
         # - 노이즈 제거
-        core_lines = self.core.process(raw_text)
+        with stage_timer("text.core"):
+            core_lines = self.core.process(raw_text)
 
         # 2️⃣ Metadata (문서 전역 메타)
-        document_meta = self.metadata.process(core_lines)
+        with stage_timer("text.metadata"):
+            document_meta = self.metadata.process(core_lines)
 
         # 2️⃣ Structural
         # - 텍스트 레이아웃 기반 섹션 구조 생성
-        sections = self.structural.process(core_lines)
+        with stage_timer("text.structural"):
+            sections = self.structural.process(core_lines)
 
         # 2.5️⃣ 섹션 구조 후보정
-        sections = validate_section_objects(sections)
+        with stage_timer("text.validate"):
+            sections = validate_section_objects(sections)
 
         # 3️⃣ Canonical (공통 후반 파이프라인)
-        canonical_map = self.canonical.process(sections)
-        canonical_map = self.canonical.to_jobsummary_canonical_map(canonical_map)
+        with stage_timer("text.canonical"):
+            canonical_map = self.canonical.process(sections)
+            canonical_map = self.canonical.to_jobsummary_canonical_map(canonical_map)
 
         logger.info(
             "TEXT pipeline completed",
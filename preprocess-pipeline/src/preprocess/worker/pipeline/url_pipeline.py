@@ -3,6 +3,7 @@ import os
 import re
 
 from domain.job_platform import JobPlatform
+from infra.metrics import stage_timer
 from inputs.jd_preprocess_input import JdPreprocessInput
 from ocr.grpc.ocr_client import OcrGrpcClient
 from preprocess.adapter.url_section_adapter import adapt_url_sections_to_sections
@@ -37,7 +38,12 @@ class UrlPipeline:
 
         ocr_grpc_host = os.environ.get("OCR_GRPC_HOST", "localhost")
         ocr_grpc_port = int(os.environ.get("OCR_GRPC_PORT", "50051"))
-        ocr_client = OcrGrpcClient(host=ocr_grpc_host, port=ocr_grpc_port)
+        ocr_grpc_timeout_sec = float(os.environ.get("OCR_GRPC_TIMEOUT_SEC", "60"))
+        ocr_client = OcrGrpcClient(
+            host=ocr_grpc_host,
+            port=ocr_grpc_port,
+            timeout_sec=ocr_grpc_timeout_sec,
+        )
 
         self.jobkorea_support = JobKoreaUrlSupport(
             self.canonical,
@@ -53,28 +59,29 @@ class UrlPipeline:
         fetch_url = self.jobkorea_support.normalize_doc_url(input.url) if effective_platform == JobPlatform.JOBKOREA else input.url
 
         # 1) Fetch
-        try:
-            html_content = self.fetcher.fetch(fetch_url)
+        with stage_timer("url.fetch"):
+            try:
+                html_content = self.fetcher.fetch(fetch_url)
+
+                if effective_platform == JobPlatform.SARAMIN:
+                    logger.debug(
+                        "Saramin request uses dedicated Playwright fetcher",
+                        extra={"url": input.url, "static_html_length": len(html_content or "")},
+                    )
+                    html_content = self.saramin_dynamic_fetcher.fetch(input.url)
+                elif self.fetcher._needs_js_rendering(html_content):
+                    logger.debug("JS rendering required, switching to Playwright", extra={"url": fetch_url})
+                    html_content = self.dynamic_fetcher.fetch(fetch_url)
 
-            if effective_platform == JobPlatform.SARAMIN:
-                logger.debug(
-                    "Saramin request uses dedicated Playwright fetcher",
-                    extra={"url": input.url, "static_html_length": len(html_content or "")},
+            except Exception as e:
+                logger.warning(
+                    "Static fetch failed, retrying with Playwright",
+                    extra={"url": fetch_url, "error": str(e)},
                 )
-                html_content = self.saramin_dynamic_fetcher.fetch(input.url)
-            elif self.fetcher._needs_js_rendering(html_content):
-                logger.debug("JS rendering required, switching to Playwright", extra={"url": fetch_url})
-                html_content = self.dynamic_fetcher.fetch(fetch_url)
-
-        except Exception as e:
-            logger.warning(
-                "Static fetch failed, retrying with Playwright",
-                extra={"url": fetch_url, "error": str(e)},
-            )
-            if effective_platform == JobPlatform.SARAMIN:
-                html_content = self.saramin_dynamic_fetcher.fetch(input.url)
-            else:
-                html_content = self.dynamic_fetcher.fetch(fetch_url)
+                if effective_platform == JobPlatform.SARAMIN:
+                    html_content = self.saramin_dynamic_fetcher.fetch(input.url)
+                else:
+                    html_content = self.dynamic_fetcher.fetch(fetch_url)
 
         # 2) Parse
         if effective_platform == JobPlatform.SARAMIN:
@@ -84,13 +91,15 @@ class UrlPipeline:
         else:
             parser = self.default_parser
 
-        parsed_data = parser.parse(html_content, url=fetch_url)
+        with stage_timer("url.parse"):
+            parsed_data = parser.parse(html_content, url=fetch_url)
         title = parsed_data.get("title", "")
         body_text = parsed_data.get("body", "")
 
         ocr_images = []
         if effective_platform == JobPlatform.JOBKOREA:
-            ocr_images = self.jobkorea_support.collect_ocr_images(input.images, html_content, fetch_url)
+            with stage_timer("url.ocr_images"):
+                ocr_images = self.jobkorea_support.collect_ocr_images(input.images, html_content, fetch_url)
 
         logger.debug(
             "URL fetched and parsed",
@@ -142,7 +151,8 @@ class UrlPipeline:
             }
 
         # 3) Preprocess lines
-        cleaned_lines = preprocess_url_text(body_text, platform=effective_platform)
+        with stage_timer("url.preprocess_lines"):
+            cleaned_lines = preprocess_url_text(body_text, platform=effective_platform)
         if not cleaned_lines:
             logger.warning(
                 "No lines after URL preprocessing",
@@ -161,9 +171,10 @@ class UrlPipeline:
             }
 
         # 4) Extract sections
-        platform_mod = get_platform_module(effective_platform)
-        raw_sections = platform_mod.extract_sections(cleaned_lines)
-        raw_sections = validate_raw_sections(raw_sections)
+        with stage_timer("url.sections"):
+            platform_mod = get_platform_module(effective_platform)
+            raw_sections = platform_mod.extract_sections(cleaned_lines)
+            raw_sections = validate_raw_sections(raw_sections)
 
         if not raw_sections:
             logger.warning(
@@ -186,14 +197,16 @@ class UrlPipeline:
         sections = adapt_url_sections_to_sections(raw_sections)
 
         # 6) Metadata
-        document_meta = self.metadata.process(cleaned_lines)
+        with stage_timer("url.metadata"):
+            document_meta = self.metadata.process(cleaned_lines)
 
         # 7) Canonical
-        canonical_map = self.canonical.process(sections)
-        canonical_map = self._normalize_intake_required_canonical(canonical_map)
-        if effective_platform == JobPlatform.JOBKOREA:
-            canonical_map = self.jobkorea_support.ocr_fallback_merge(canonical_map, ocr_images)
-        canonical_map = self.canonical.to_jobsummary_canonical_map(canonical_map)
+        with stage_timer("url.canonical"):
+            canonical_map = self.canonical.process(sections)
+            canonical_map = self._normalize_intake_required_canonical(canonical_map)
+            if effective_platform == JobPlatform.JOBKOREA:
+                canonical_map = self.jobkorea_support.ocr_fallback_merge(canonical_map, ocr_images)
+            canonical_map = self.canonical.to_jobsummary_canonical_map(canonical_map)
 
         # 8) Done
         logger.info(
@@ -2,10 +2,12 @@
 
 from worker.base_kafka_worker import BaseKafkaWorker
 from worker.text_kafka_worker import TextKafkaWorker
+from worker.text_kafka_pool_worker import TextKafkaPoolWorker
 from worker.url_kafka_worker import UrlKafkaWorker
 
 __all__ = [
     "BaseKafkaWorker",
     "TextKafkaWorker",
+    "TextKafkaPoolWorker",
     "UrlKafkaWorker",
 ]
@@ -13,26 +13,51 @@ Kafka 기반 Base Worker
 1. 처리 실패 시 fail 토픽 발행 시도
 2. fail 토픽 발행 실패 시 로컬 파일 백업
 3. 무조건 commit
+
+work queue 모드 (WorkerConfig.work_queue_size > 0):
+- 처리 스레드가 메시지를 순서대로 처리하고, 메인 스레드는 poll을 계속한다
+  (긴 OCR/Playwright 처리 중에도 max.poll.interval.ms 초과로 인한 rebalance 방지)
+- queue가 가득 차면 할당 파티션 pause, 절반 이하로 줄면 resume
+- revoke된 파티션의 처리 전 메시지는 queue에서 제거 (새 소유자가 처리)
+
+단계별 소요 시간 (infra.metrics.stage_timer):
+- parse / preprocess / publish / publish_fail / commit / total
+- 라벨: worker(worker_name) + source(메시지 source), 하위 파이프라인 단계도 같은 라벨로 기록
+
+delivery 확인 모드 (WorkerConfig.confirm_delivery):
+- result/fail 발행 후 broker delivery 결과를 비동기로 추적 (poll loop 비차단)
+- result delivery 실패 → fail 토픽 발행 (PUBLISH_RESULT_DELIVERY 단계)
+  delivery callback은 producer poll 안에서 실행되므로 실패를 bounded queue에 적재만 하고,
+  발행은 워커 루프가 poll/consume 반환 후 수행 (callback 안에서 publish/poll 재진입 금지)
+  queue가 가득 차면 발행 없이 로컬 파일 백업
+- fail delivery 실패 → 로컬 파일 백업
 """
 
-import json
+import functools
 import logging
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from common.exceptions import ErrorCode, ProcessingError
 from infra.config.kafka_config import WorkerConfig
 from infra.kafka.kafka_consumer import KafkaStreamConsumer
 from infra.kafka.kafka_producer import KafkaStreamProducer
+from infra.metrics import WORKER_QUEUE_DEPTH, metric_labels, set_metric_source, stage_timer
+from inputs.kafka_jd_preprocess_input import KafkaJdPreprocessInput
+from inputs.kafka_message_decoder import DecodedKafkaMessage, KafkaMessageDecoder
 from outputs.kafka_fail_output import KafkaFailOutput
 from outputs.kafka_jd_preprocess_output import KafkaJdPreprocessOutput
 from utils.fail_backup import get_fail_backup_writer
 
 logger = logging.getLogger(__name__)
 
+# work queue 모드: pause 중 queue 상태 확인 주기 (poll timeout)
+_QUEUE_CHECK_SEC = 0.1
+
 
 @dataclass
 class ProcessContext:
@@ -50,11 +75,11 @@ class BaseKafkaWorker(ABC):
     Kafka 기반 Base Worker
 
     책임:
-    - Kafka 메시지 polling
+    - Kafka 메시지 polling (단건 poll / batch consume / work queue)
     - process() 호출
     - 성공 시 result 토픽 발행
     - 실패 시 fail 토픽 발행(실패하면 로컬 백업)
-    - 무조건 commit
+    - 무조건 commit (완료 기록 후 연속 구간만 비동기 coalesced commit)
     - Graceful shutdown
 
     하위 Worker 책임:
@@ -80,14 +105,26 @@ class BaseKafkaWorker(ABC):
         self.worker_name = worker_name
         self._shutdown_requested = shutdown_event or threading.Event()
         self._fail_backup = get_fail_backup_writer()
+        self._decoder = KafkaMessageDecoder()
+
+        # work queue 모드 상태 (처리 스레드와 공유)
+        self._work_queue: Deque[Any] = deque()
+        self._queue_cond = threading.Condition()
+        self._queue_closed = False
+        self._in_process = 0
+
+        # confirm_delivery 모드: result delivery 실패 (callback에서 적재 → 워커 루프에서 fail 토픽 발행)
+        self._delivery_failures: Deque[Tuple[ProcessContext, str]] = deque()
+        self._delivery_failures_lock = threading.Lock()
+        self._max_delivery_failures = max(1, config.producer_profile.max_pending_deliveries)
 
     @abstractmethod
-    def process(self, message: Dict[str, Any]) -> KafkaJdPreprocessOutput:
+    def process(self, jd_input: KafkaJdPreprocessInput) -> KafkaJdPreprocessOutput:
         """
         메시지 처리 (하위 Worker 구현)
 
         Args:
-            message: 파싱된 Kafka 메시지
+            jd_input: 디코딩/검증된 입력 DTO
 
         Returns:
             KafkaJdPreprocessOutput: 처리 결과
@@ -99,135 +136,401 @@ class BaseKafkaWorker(ABC):
 
     def run(self):
         """Worker 메인 루프"""
-        logger.info("Worker started", extra={"worker_name": self.worker_name})
+        logger.info(
+            "Worker started",
+            extra={"worker_name": self.worker_name, "batch_size": self.config.batch_size},
+        )
+
+        try:
+            with metric_labels(self.worker_name):
+                if self.config.work_queue_size > 0:
+                    self._run_queued()
+                elif self.config.batch_size > 1:
+                    self._run_batch()
+                else:
+                    self._run_single()
+
+        finally:
+            self._cleanup()
+
+    def _run_single(self) -> None:
+        """단건 poll 모드: 메시지 1건 처리 후 1건 commit"""
+        idle_count = 0
+
+        while not self._shutdown_requested.is_set():
+            self._serve_deliveries()
+            kafka_msg = self.consumer.poll()
+
+            if kafka_msg is None:
+                idle_count += 1
+                self._log_idle(idle_count)
+                continue
+
+            idle_count = 0
+            self._handle_message(kafka_msg)
+
+    def _run_batch(self) -> None:
+        """
+        배치 consume 모드
 
+        - 최대 batch_size 건을 batch_linger_ms 동안 수집
+        - 수집된 메시지를 순서대로 처리(_process_message)
+        - 파티션별 최대 offset을 배치당 1회 commit
+        - shutdown 요청 시 처리 완료된 메시지까지만 commit
+        """
+        batch_size = self.config.batch_size
+        linger_sec = self.config.batch_linger_ms / 1000
         idle_count = 0
 
+        while not self._shutdown_requested.is_set():
+            self._serve_deliveries()
+            batch = []
+            deadline = time.monotonic() + linger_sec
+
+            while len(batch) < batch_size and not self._shutdown_requested.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                batch.extend(self.consumer.consume(batch_size - len(batch), remaining))
+
+            if not batch:
+                idle_count += 1
+                self._log_idle(idle_count)
+                continue
+
+            idle_count = 0
+            processed = []
+            for kafka_msg in batch:
+                if self._shutdown_requested.is_set():
+                    break
+                self._process_message(kafka_msg)
+                processed.append(kafka_msg)
+
+            self._safe_commit_batch(processed)
+
+    def _run_queued(self) -> None:
+        """
+        work queue 모드
+
+        - 메인 스레드: poll → queue 적재, delivery callback 처리, pause/resume 판단
+        - 처리 스레드: queue 순서대로 _handle_message (단일 스레드라 파티션 내 순서 유지)
+        - shutdown 시 처리 중 메시지만 완료 대기, 미처리 메시지는 commit하지 않음 (재기동 후 재처리)
+        """
+        capacity = self.config.work_queue_size
+        resume_threshold = capacity // 2
+        idle_count = 0
+
+        self.consumer.set_revoke_listener(self._discard_revoked)
+        processor = threading.Thread(
+            target=self._queue_loop,
+            name=f"{self.worker_name}-processor",
+            daemon=True,
+        )
+        processor.start()
+
         try:
             while not self._shutdown_requested.is_set():
-                kafka_msg = self.consumer.poll()
+                self._serve_deliveries()
+
+                if not processor.is_alive():
+                    raise RuntimeError("Work queue processor thread stopped")
+
+                depth = self._queue_depth()
+                if depth >= capacity and not self.consumer.paused:
+                    logger.info(
+                        "Work queue full, pausing consumption",
+                        extra={"worker_name": self.worker_name, "queue_depth": depth},
+                    )
+                    self.consumer.pause_all()
+                elif depth <= resume_threshold and self.consumer.paused:
+                    logger.info(
+                        "Work queue drained, resuming consumption",
+                        extra={"worker_name": self.worker_name, "queue_depth": depth},
+                    )
+                    self.consumer.resume_all()
+
+                kafka_msg = self.consumer.poll(
+                    timeout_sec=_QUEUE_CHECK_SEC if self.consumer.paused else None,
+                )
 
                 if kafka_msg is None:
-                    idle_count += 1
-                    if idle_count % 86400 == 0:
-                        logger.warning(
-                            "Worker idle for extended period",
-                            extra={"worker_name": self.worker_name, "idle_polls": idle_count},
-                        )
+                    if depth == 0:
+                        idle_count += 1
+                        self._log_idle(idle_count)
                     continue
 
                 idle_count = 0
-                self._handle_message(kafka_msg)
+                self._enqueue(kafka_msg)
 
         finally:
-            self._cleanup()
+            self._stop_processor(processor)
+
+    def _enqueue(self, kafka_msg) -> None:
+        with self._queue_cond:
+            self._work_queue.append(kafka_msg)
+            self._queue_cond.notify()
+        WORKER_QUEUE_DEPTH.labels(worker=self.worker_name).set(self._queue_depth())
+
+    def _queue_depth(self) -> int:
+        with self._queue_cond:
+            return len(self._work_queue) + self._in_process
+
+    def _queue_loop(self) -> None:
+        """처리 스레드: queue에서 꺼내 처리 + 완료 기록"""
+        # 새 스레드는 contextvar를 상속하지 않으므로 라벨 재설정
+        with metric_labels(self.worker_name):
+            self._process_queue()
+
+    def _process_queue(self) -> None:
+        while True:
+            with self._queue_cond:
+                while not self._work_queue and not self._queue_closed:
+                    self._queue_cond.wait()
+                if self._queue_closed:
+                    return
+                kafka_msg = self._work_queue.popleft()
+                self._in_process = 1
+
+            try:
+                self._handle_message(kafka_msg)
+            finally:
+                with self._queue_cond:
+                    self._in_process = 0
+                    self._queue_cond.notify_all()
+                WORKER_QUEUE_DEPTH.labels(worker=self.worker_name).set(self._queue_depth())
 
-    def _handle_message(self, kafka_msg) -> None:
+    def _discard_revoked(self, partitions: List[Tuple[str, int]]) -> None:
         """
-        메시지 처리 + 발행 + commit 일괄 처리
+        revoke된 파티션의 처리 전 메시지 제거 (poll 스레드, rebalance callback)
 
-        핵심: 어떤 실패도 commit을 막지 않음
+        처리 중인 메시지는 끝까지 처리되지만 완료 기록은 무시된다. (KafkaCommitTracker)
         """
-        context: Optional[ProcessContext] = None
+        revoked = set(partitions)
+        with self._queue_cond:
+            kept = deque(
+                msg for msg in self._work_queue
+                if (msg.topic(), msg.partition()) not in revoked
+            )
+            discarded = len(self._work_queue) - len(kept)
+            self._work_queue = kept
 
-        try:
-            # 1. 메시지 파싱
-            message = self._parse_kafka_message(kafka_msg)
+        if discarded:
+            logger.warning(
+                "Discarded queued messages of revoked partitions",
+                extra={"worker_name": self.worker_name, "discarded": discarded},
+            )
+        WORKER_QUEUE_DEPTH.labels(worker=self.worker_name).set(self._queue_depth())
 
-            if message is None:
-                # JSON 파싱 실패: 재시도 의미 없음 -> commit
-                return
+    def _stop_processor(self, processor: threading.Thread) -> None:
+        """처리 스레드 종료 (처리 중 메시지는 shutdown_timeout_sec까지 대기)"""
+        with self._queue_cond:
+            self._queue_closed = True
+            dropped = len(self._work_queue)
+            self._work_queue.clear()
+            self._queue_cond.notify_all()
 
-            context = ProcessContext(
-                kafka_meta=message.get("_kafka_meta", {}),
-                request_id=message.get("requestId", "unknown"),
-                source=self._get_source_from_message(message),
-                start_time=time.time(),
-                pipeline_stage="MESSAGE_PARSE",
-            )
+        processor.join(timeout=self.config.shutdown_timeout_sec)
 
+        if dropped:
             logger.info(
-                "Message received",
-                extra={
-                    "worker_name": self.worker_name,
-                    "offset": context.kafka_meta.get("offset", "unknown"),
-                    "request_id": context.request_id,
-                },
+                "Unprocessed queued messages left uncommitted",
+                extra={"worker_name": self.worker_name, "dropped": dropped},
             )
-
-            # 2. 전처리 실행
-            context.pipeline_stage = "PREPROCESS"
-            result = self.process(message)
-            logger.info(
-                "Preprocess completed",
-                extra={
-                    "worker_name": self.worker_name,
-                    "request_id": context.request_id,
-                    "source": context.source,
-                    "section_count": len(result.canonical_map) if result.canonical_map else 0,
-                    "has_skills": bool(result.skills),
-                    "has_period": result.recruitment_period_type is not None,
-                },
+        if processor.is_alive():
+            logger.warning(
+                "Processor thread did not finish in time",
+                extra={"worker_name": self.worker_name},
             )
-            logger.debug(
-                "Canonical map",
-                extra={
-                    "worker_name": self.worker_name,
-                    "request_id": context.request_id,
-                    "canonical_map": result.canonical_map,
-                },
+
+    def _serve_deliveries(self) -> None:
+        """delivery callback 처리 후 적재된 result delivery 실패를 fail 토픽으로 (confirm_delivery 모드)"""
+        if not self.config.confirm_delivery:
+            return
+        try:
+            self.producer.poll(0)
+        except Exception as e:
+            logger.error(
+                "Producer poll failed",
+                extra={"worker_name": self.worker_name, "error": str(e)},
             )
+        self._drain_delivery_failures()
+        # on_failure로 fail 토픽/로컬 백업에 라우팅된 실패는 producer 기록에서 수거 (기록 무한 증가 방지)
+        self.producer.drain_failed()
 
-            # 3. 성공 결과 발행
-            context.pipeline_stage = "PUBLISH_RESULT"
-            self._publish_success(result, context)
+    def _drain_delivery_failures(self) -> None:
+        """
+        적재된 result delivery 실패 → fail 토픽 발행 (워커 루프 스레드, poll 밖에서 호출)
 
-            logger.info(
-                "Message processed",
-                extra={"worker_name": self.worker_name, "request_id": context.request_id},
+        발행 중 poll로 새로 적재된 실패는 다음 루프에서 처리한다.
+        """
+        with self._delivery_failures_lock:
+            count = len(self._delivery_failures)
+
+        for _ in range(count):
+            with self._delivery_failures_lock:
+                if not self._delivery_failures:
+                    return
+                context, delivery_error = self._delivery_failures.popleft()
+
+            context.pipeline_stage = "PUBLISH_RESULT_DELIVERY"
+            wrapped = ProcessingError(
+                error_code=ErrorCode.INFRA_KAFKA_001,
+                message=f"Result topic delivery failed: {delivery_error}",
             )
+            self._handle_failure(wrapped, context)
 
-        except ProcessingError as e:
-            # 4. 처리 실패 시 fail 토픽 발행
-            logger.error(
-                "Processing failed",
-                extra={
-                    "worker_name": self.worker_name,
-                    "request_id": context.request_id if context else "unknown",
-                    "error_code": e.error_code.value,
-                    "error_msg": e.message,
-                },
+    def _log_idle(self, idle_count: int) -> None:
+        if idle_count % 86400 == 0:
+            logger.warning(
+                "Worker idle for extended period",
+                extra={"worker_name": self.worker_name, "idle_polls": idle_count},
             )
-            self._handle_failure(e, context)
 
-        except Exception as e:
-            # 5. 예상치 못한 예외는 ProcessingError로 래핑
-            logger.exception(
-                "Unexpected error",
+    def _handle_message(self, kafka_msg) -> None:
+        """
+        메시지 처리 + 발행 + commit 일괄 처리
+
+        핵심: 어떤 실패도 commit을 막지 않음
+        """
+        try:
+            self._process_message(kafka_msg)
+        finally:
+            # 무조건 commit
+            self._safe_commit(kafka_msg)
+
+    def _process_message(self, kafka_msg) -> None:
+        """
+        메시지 처리 + 발행 (commit 제외)
+
+        핵심: 모든 예외를 내부에서 흡수 (commit 경로를 막지 않음)
+        """
+        context: Optional[ProcessContext] = None
+
+        with stage_timer("total"):
+            try:
+                # 1. 메시지 파싱
+                with stage_timer("parse"):
+                    decoded = self._parse_kafka_message(kafka_msg)
+                    set_metric_source(decoded.source if decoded else None)
+
+                if decoded is None:
+                    # JSON 파싱 실패: 재시도 의미 없음 -> commit
+                    return
+
+                context = self._create_context(decoded)
+                jd_input = self._require_input(decoded)
+
+                # 2. 전처리 실행
+                context.pipeline_stage = "PREPROCESS"
+                with stage_timer("preprocess"):
+                    result = self.process(jd_input)
+
+                # 3. 성공 결과 발행
+                self._complete_success(result, context)
+
+            except Exception as e:
+                # 4. 실패 시 fail 토픽 발행
+                self._complete_failure(e, context)
+
+    def _create_context(self, decoded: DecodedKafkaMessage) -> ProcessContext:
+        """디코딩된 메시지로부터 처리 컨텍스트 생성"""
+        context = ProcessContext(
+            kafka_meta=decoded.kafka_meta,
+            request_id=decoded.request_id,
+            source=decoded.source,
+            start_time=time.time(),
+            pipeline_stage="MESSAGE_PARSE",
+        )
+
+        logger.info(
+            "Message received",
+            extra={
+                "worker_name": self.worker_name,
+                "offset": context.kafka_meta.get("offset", "unknown"),
+                "request_id": context.request_id,
+            },
+        )
+        return context
+
+    def _complete_success(self, result: KafkaJdPreprocessOutput, context: ProcessContext) -> None:
+        """전처리 성공 결과 로깅 + result 토픽 발행"""
+        logger.info(
+            "Preprocess completed",
+            extra={
+                "worker_name": self.worker_name,
+                "request_id": context.request_id,
+                "source": context.source,
+                "section_count": len(result.canonical_map) if result.canonical_map else 0,
+                "has_skills": bool(result.skills),
+                "has_period": result.recruitment_period_type is not None,
+            },
+        )
+        logger.debug(
+            "Canonical map",
+            extra={
+                "worker_name": self.worker_name,
+                "request_id": context.request_id,
+                "canonical_map": result.canonical_map,
+            },
+        )
+
+        context.pipeline_stage = "PUBLISH_RESULT"
+        self._publish_success(result, context)
+
+        logger.info(
+            "Message processed",
+            extra={"worker_name": self.worker_name, "request_id": context.request_id},
+        )
+
+    def _complete_failure(self, error: Exception, context: Optional[ProcessContext]) -> None:
+        """
+        처리 실패 결과 처리
+
+        - ProcessingError: 그대로 fail 토픽 경로
+        - 예상치 못한 예외: ProcessingError(UNKNOWN_001)로 래핑
+        """
+        if isinstance(error, ProcessingError):
+            logger.error(
+                "Processing failed",
                 extra={
                     "worker_name": self.worker_name,
                     "request_id": context.request_id if context else "unknown",
+                    "error_code": error.error_code.value,
+                    "error_msg": error.message,
                 },
             )
-            wrapped = ProcessingError(
-                error_code=ErrorCode.UNKNOWN_001,
-                message=str(e),
-                cause=e,
-            )
-            self._handle_failure(wrapped, context)
+            self._handle_failure(error, context)
+            return
 
-        finally:
-            # 6. 무조건 commit
-            self._safe_commit(kafka_msg)
+        logger.error(
+            "Unexpected error",
+            exc_info=error,
+            extra={
+                "worker_name": self.worker_name,
+                "request_id": context.request_id if context else "unknown",
+            },
+        )
+        wrapped = ProcessingError(
+            error_code=ErrorCode.UNKNOWN_001,
+            message=str(error),
+            cause=error,
+        )
+        self._handle_failure(wrapped, context)
 
     def _publish_success(self, result: KafkaJdPreprocessOutput, context: ProcessContext) -> None:
         """성공 결과 발행"""
+        on_failure = None
+        if self.config.confirm_delivery:
+            on_failure = functools.partial(self._on_result_delivery_failed, context)
+
         try:
-            self.producer.publish(
-                topic=self.result_topic,
-                message=result.to_dict(),
-                key=result.request_id,
-            )
+            with stage_timer("publish"):
+                self.producer.publish(
+                    topic=self.result_topic,
+                    message=result.to_dict(),
+                    key=result.request_id,
+                    on_failure=on_failure,
+                )
             logger.debug(
                 "Published to result topic",
                 extra={
@@ -253,6 +556,58 @@ class BaseKafkaWorker(ABC):
             )
             self._handle_failure(wrapped, context)
 
+    def _on_result_delivery_failed(self, context: ProcessContext, delivery_error: str) -> None:
+        """
+        result 토픽 delivery 실패 (confirm_delivery 모드, producer poll 안에서 호출)
+
+        input offset은 이미 commit되었으므로 fail 토픽 경로로 결과 유실을 통지한다.
+        여기서는 적재만 하고 발행은 _drain_delivery_failures가 수행 (poll 재진입 방지)
+        """
+        logger.error(
+            "Result delivery failed",
+            extra={
+                "worker_name": self.worker_name,
+                "request_id": context.request_id,
+                "error": delivery_error,
+            },
+        )
+        with self._delivery_failures_lock:
+            if len(self._delivery_failures) < self._max_delivery_failures:
+                self._delivery_failures.append((context, delivery_error))
+                return
+
+        # 적재 상한 도달 (broker 장애 지속): 발행 없이 로컬 백업
+        self._fail_backup.write(
+            request_id=context.request_id,
+            source=context.source,
+            error_code=ErrorCode.INFRA_KAFKA_001.value,
+            error_message=f"Result topic delivery failed: {delivery_error}",
+            publish_error="delivery failure queue full",
+        )
+
+    def _on_fail_delivery_failed(
+        self,
+        context: ProcessContext,
+        error: ProcessingError,
+        delivery_error: str,
+    ) -> None:
+        """fail 토픽 delivery 실패 (confirm_delivery 모드) → 로컬 백업"""
+        logger.error(
+            "Fail topic delivery failed",
+            extra={
+                "worker_name": self.worker_name,
+                "request_id": context.request_id,
+                "error": delivery_error,
+            },
+        )
+        self._fail_backup.write(
+            request_id=context.request_id,
+            source=context.source,
+            error_code=error.error_code.value,
+            error_message=error.message,
+            publish_error=delivery_error,
+        )
+
     def _handle_failure(self, error: ProcessingError, context: Optional[ProcessContext]) -> None:
         """
         실패 처리: fail 토픽 발행, 실패하면 로컬 백업
@@ -281,12 +636,18 @@ class BaseKafkaWorker(ABC):
         # 1차 시도: fail 토픽 발행
         publish_error: Optional[str] = None
 
+        on_failure = None
+        if self.config.confirm_delivery:
+            on_failure = functools.partial(self._on_fail_delivery_failed, context, error)
+
         try:
-            self.producer.publish(
-                topic=self.fail_topic,
-                message=fail_output.to_dict(),
-                key=context.request_id,
-            )
+            with stage_timer("publish_fail"):
+                self.producer.publish(
+                    topic=self.fail_topic,
+                    message=fail_output.to_dict(),
+                    key=context.request_id,
+                    on_failure=on_failure,
+                )
             logger.warning(
                 "Published to fail topic",
                 extra={
@@ -320,7 +681,8 @@ class BaseKafkaWorker(ABC):
     def _safe_commit(self, kafka_msg) -> None:
         """안전한 commit (실패해도 예외 전파 없음)"""
         try:
-            self.consumer.commit(kafka_msg)
+            with stage_timer("commit"):
+                self.consumer.commit(kafka_msg)
         except Exception as e:
             # commit 실패여도 파이프라인은 멈추지 않음
             logger.error(
@@ -332,49 +694,38 @@ class BaseKafkaWorker(ABC):
                 },
             )
 
-    def _parse_kafka_message(self, kafka_msg) -> Optional[Dict[str, Any]]:
-        """Kafka 메시지 파싱
+    def _safe_commit_batch(self, messages) -> None:
+        """안전한 배치 commit (실패해도 예외 전파 없음)"""
+        if not messages:
+            return
+        try:
+            with stage_timer("commit"):
+                self.consumer.commit_batch(messages)
+        except Exception as e:
+            logger.error(
+                "Batch commit failed",
+                extra={
+                    "worker_name": self.worker_name,
+                    "message_count": len(messages),
+                    "last_offset": messages[-1].offset(),
+                    "error": str(e),
+                },
+            )
+
+    def _parse_kafka_message(self, kafka_msg) -> Optional[DecodedKafkaMessage]:
+        """Kafka 메시지 디코딩 (bytes → 입력 DTO)
 
-        Debezium outbox TEXT 컬럼 특성:
-        - JsonConverter 사용 시 payload가 JSON string으로 한 번 더 래핑될 수 있음(이중 인코딩)
-        - json.loads() 결과가 str이면 한 번 더 파싱
+        - 이중 인코딩/스키마 검증은 KafkaMessageDecoder가 처리
+        - JSON 자체가 잘못된 경우 None 반환 (재시도 의미 없음)
+        - 스키마 검증 실패는 DecodedKafkaMessage.parse_error로 전달 (fail 토픽 대상)
         """
         raw_bytes = kafka_msg.value()
-        raw_str = ""
 
         try:
-            raw_str = raw_bytes.decode("utf-8")
-            message = json.loads(raw_str)
-
-            # Debezium + JsonConverter 조합에서 발생 가능한 이중 인코딩 처리
-            if isinstance(message, str):
-                logger.debug(
-                    "Double-encoded JSON detected, re-parsing",
-                    extra={"worker_name": self.worker_name, "offset": kafka_msg.offset()},
-                )
-                message = json.loads(message)
-
-            if not isinstance(message, dict):
-                logger.error(
-                    "Unexpected message type",
-                    extra={
-                        "worker_name": self.worker_name,
-                        "offset": kafka_msg.offset(),
-                        "msg_type": type(message).__name__,
-                        "raw_preview": raw_str[:200],
-                    },
-                )
-                return None
-
-            message["_kafka_meta"] = {
-                "topic": kafka_msg.topic(),
-                "partition": kafka_msg.partition(),
-                "offset": kafka_msg.offset(),
-                "timestamp": kafka_msg.timestamp()[1] if kafka_msg.timestamp() else None,
-            }
-            return message
+            decoded = self._decoder.decode(raw_bytes)
 
         except Exception as e:
+            # preview는 실패 경로에서만 1회 디코딩
             logger.error(
                 "Message parse failed",
                 extra={
@@ -382,18 +733,29 @@ class BaseKafkaWorker(ABC):
                     "offset": kafka_msg.offset(),
                     "error": str(e),
                     "raw_preview": (
-                        raw_str or (raw_bytes.decode("utf-8", errors="replace") if raw_bytes else "None")
-                    )[:200],
+                        raw_bytes[:200].decode("utf-8", errors="replace") if raw_bytes else "None"
+                    ),
                 },
             )
             return None
 
-    def _get_source_from_message(self, message: Dict[str, Any]) -> str:
-        """메시지에서 source 추출"""
-        source = message.get("source", "")
-        if isinstance(source, str):
-            return source.upper()
-        return "UNKNOWN"
+        decoded.kafka_meta = {
+            "topic": kafka_msg.topic(),
+            "partition": kafka_msg.partition(),
+            "offset": kafka_msg.offset(),
+            "timestamp": kafka_msg.timestamp()[1] if kafka_msg.timestamp() else None,
+        }
+        return decoded
+
+    def _require_input(self, decoded: DecodedKafkaMessage) -> KafkaJdPreprocessInput:
+        """스키마 검증 실패를 ProcessingError로 변환"""
+        if decoded.parse_error is not None:
+            raise ProcessingError(
+                error_code=ErrorCode.MSG_PARSE_002,
+                message=f"메시지 파싱 실패: {str(decoded.parse_error)}",
+                cause=decoded.parse_error,
+            )
+        return decoded.jd_input
 
     def shutdown(self):
         """Graceful shutdown 요청"""
@@ -403,5 +765,32 @@ class BaseKafkaWorker(ABC):
     def _cleanup(self):
         """리소스 정리"""
         logger.info("Cleaning up", extra={"worker_name": self.worker_name})
+        if self.config.confirm_delivery:
+            self._flush_deliveries()
+        try:
+            # 마지막 완료 offset까지 동기 commit
+            self.consumer.flush_commits()
+        except Exception as e:
+            logger.error(
+                "Final commit flush failed",
+                extra={"worker_name": self.worker_name, "error": str(e)},
+            )
         self.consumer.close()
         logger.info("Worker stopped", extra={"worker_name": self.worker_name})
+
+    def _flush_deliveries(self) -> None:
+        """
+        종료 전 delivery 결과 확정 (confirm_delivery 모드)
+
+        result delivery 실패가 fail 토픽 발행으로 이어지므로 적재분 발행 후 한 번 더 flush한다.
+        """
+        for _ in range(2):
+            try:
+                self.producer.flush(timeout=self.config.shutdown_timeout_sec / 2)
+            except Exception as e:
+                logger.error(
+                    "Producer flush failed",
+                    extra={"worker_name": self.worker_name, "error": str(e)},
+                )
+                return
+            self._drain_delivery_failures()
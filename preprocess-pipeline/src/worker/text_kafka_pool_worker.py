@@ -0,0 +1,414 @@
+# src/worker/text_kafka_pool_worker.py
+
+"""
+TEXT 소스 전용 Kafka Worker (ProcessPool 병렬 모드)
+
+단일 consumer가 메시지를 polling하고,
+TextPreprocessPipeline 실행은 ProcessPoolExecutor 자식 프로세스에 위임한다.
+
+순서 보장:
+- 같은 requestId(파티션 key)의 메시지는 lane에 직렬로 쌓아 한 번에 하나만 실행
+- 서로 다른 requestId는 pool_size만큼 병렬 실행
+
+backpressure:
+- 보유 메시지가 max_pending에 도달하면 할당 파티션 pause, 절반 이하로 줄면 resume
+- pause 중에도 poll은 계속 (rebalance/heartbeat, max.poll.interval.ms 유지)
+
+commit:
+- 메시지 처리(발행 포함) 완료 후에만 완료 기록
+- KafkaCommitTracker가 연속 완료 구간까지만 commit (느린 JD가 앞선 offset을 잡고 있으면 대기)
+
+자식 프로세스 비정상 종료 (BrokenProcessPool):
+- 자식 1개가 죽으면 pool의 in-flight 작업이 모두 BrokenProcessPool로 실패한다
+- pool 재생성 후 해당 작업은 lane head 그대로 재제출 (실패 발행/commit 없음)
+- 재제출 작업은 pool에 단독으로 실행 → 다시 깨지면 그 작업이 원인으로 좁혀짐
+  (재시도 대기/진행 중에는 새 lane head 제출을 보류, 진행 중 작업이 모두 끝난 뒤 재제출)
+- _BROKEN_POOL_RETRIES회 재제출 후에도 깨진 작업만 fail 토픽 발행
+
+단계별 소요 시간:
+- 자식 프로세스의 text.* 단계 측정값은 결과와 함께 반환되어 부모의 /metrics에 기록
+- preprocess 단계는 부모 기준 (제출 → 완료 수거, pool 대기 포함)
+
+비책임:
+- 전처리 로직 (KafkaJdPreprocessTextWorker)
+- 결과/실패 발행 정책 (BaseKafkaWorker)
+"""
+
+import logging
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from infra.config.kafka_config import WorkerConfig
+from infra.kafka.kafka_consumer import KafkaStreamConsumer
+from infra.kafka.kafka_producer import KafkaStreamProducer
+from infra.metrics import (
+    collect_stages,
+    metric_labels,
+    observe_stage,
+    observe_stages,
+    set_metric_source,
+    stage_timer,
+)
+from inputs.kafka_jd_preprocess_input import KafkaJdPreprocessInput
+from worker.base_kafka_worker import BaseKafkaWorker, ProcessContext
+from outputs.kafka_jd_preprocess_output import KafkaJdPreprocessOutput
+
+logger = logging.getLogger(__name__)
+
+# 부모 프로세스가 처리 완료를 확인하는 주기 (in-flight 작업이 있을 때의 poll timeout)
+_COMPLETION_CHECK_SEC = 0.05
+# 자식 프로세스 비정상 종료로 실패한 작업 재제출 횟수 (초과 시 fail 토픽)
+_BROKEN_POOL_RETRIES = 1
+
+
+# ==================================================
+# Pool 자식 프로세스 전용 (spawn 시 모듈 재import)
+# ==================================================
+_pool_jd_worker = None
+
+# (결과, 예외, 단계별 소요 시간)
+_PoolOutcome = Tuple[Optional[KafkaJdPreprocessOutput], Optional[Exception], List[Tuple[str, float]]]
+
+
+def _init_pool_process() -> None:
+    """자식 프로세스 초기화: logging + TEXT 전처리 Worker 1회 생성"""
+    global _pool_jd_worker
+
+    from utils.logger import setup_logging
+    from preprocess.worker.kafka.kafka_jd_preprocess_text_worker import KafkaJdPreprocessTextWorker
+
+    setup_logging("DEBUG")
+    _pool_jd_worker = KafkaJdPreprocessTextWorker()
+
+
+def _execute_in_pool(jd_input: KafkaJdPreprocessInput) -> _PoolOutcome:
+    """
+    자식 프로세스에서 TEXT 전처리 실행
+
+    자식 프로세스는 /metrics를 노출하지 않으므로 text.* 단계 소요 시간은 수집만 해서 결과와 함께 반환
+    (실패도 예외 대신 반환값으로 전달해 측정값을 잃지 않음, 부모가 _unwrap_outcome으로 기록/재발생)
+    """
+    with collect_stages() as stages:
+        try:
+            return _pool_jd_worker.execute(jd_input), None, stages
+        except Exception as e:
+            return None, e, stages
+
+
+def _unwrap_outcome(outcome: _PoolOutcome) -> KafkaJdPreprocessOutput:
+    """자식 측정값을 현재 라벨로 기록 후 결과 반환 (자식 예외는 그대로 발생)"""
+    output, error, stages = outcome
+    observe_stages(stages)
+    if error is not None:
+        raise error
+    return output
+
+
+@dataclass
+class _PoolTask:
+    """pool에 제출할(또는 제출된) 메시지 단위 작업"""
+
+    kafka_msg: Any
+    lane_key: str
+    jd_input: KafkaJdPreprocessInput
+    context: ProcessContext
+    submitted_at: float = 0.0
+    # 제출 시점 executor 세대 (같은 pool 붕괴로 재생성이 중복되지 않도록)
+    generation: int = 0
+    broken_count: int = 0
+
+
+class TextKafkaPoolWorker(BaseKafkaWorker):
+    """
+    TEXT 소스 전용 Kafka Worker (ProcessPool 병렬 모드)
+
+    polling / 발행 / commit은 부모 프로세스(메인 스레드)에서만 수행한다.
+    """
+
+    def __init__(
+        self,
+        consumer: KafkaStreamConsumer,
+        producer: KafkaStreamProducer,
+        result_topic: str,
+        fail_topic: str,
+        config: WorkerConfig,
+        shutdown_event=None,
+        pool_size: int = 3,
+    ):
+        super().__init__(
+            consumer=consumer,
+            producer=producer,
+            result_topic=result_topic,
+            fail_topic=fail_topic,
+            config=config,
+            worker_name="TEXT_KAFKA_POOL_WORKER",
+            shutdown_event=shutdown_event,
+        )
+        self.pool_size = max(1, pool_size)
+        # lane 대기분 포함 최대 보유 메시지 수
+        self.max_pending = self.pool_size * 2
+
+        self._executor = self._create_executor()
+        self._generation = 0
+        self._lanes: Dict[str, Deque[_PoolTask]] = {}
+        self._futures: Dict[Future, _PoolTask] = {}
+        self._pending_count = 0
+        # pool 붕괴로 재제출 대기 중인 작업 (pool에 단독으로 1개씩 실행)
+        self._retry_queue: Deque[_PoolTask] = deque()
+        # 재시도 중 제출 보류된 lane head (재시도가 모두 끝나면 제출)
+        self._held: Deque[_PoolTask] = deque()
+        self._retry_task: Optional[_PoolTask] = None
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.pool_size,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_pool_process,
+        )
+
+    def process(self, jd_input: KafkaJdPreprocessInput) -> KafkaJdPreprocessOutput:
+        """단건 동기 실행 (pool 경유)"""
+        return _unwrap_outcome(self._executor.submit(_execute_in_pool, jd_input).result())
+
+    # ==================================================
+    # Main Loop
+    # ==================================================
+
+    def run(self):
+        """Worker 메인 루프 (dispatch → 완료 수거 → 발행/commit)"""
+        logger.info(
+            "Worker started",
+            extra={"worker_name": self.worker_name, "pool_size": self.pool_size},
+        )
+
+        idle_count = 0
+        resume_threshold = self.max_pending // 2
+
+        try:
+            with metric_labels(self.worker_name):
+                while not self._shutdown_requested.is_set():
+                    self._serve_deliveries()
+                    self._collect_completed(timeout_sec=0)
+
+                    # 보유 한도 도달: 파티션 pause (poll은 계속, 완료 확인 주기로 대기)
+                    if self._pending_count >= self.max_pending and not self.consumer.paused:
+                        logger.info(
+                            "Pool saturated, pausing consumption",
+                            extra={"worker_name": self.worker_name, "pending_count": self._pending_count},
+                        )
+                        self.consumer.pause_all()
+                    elif self._pending_count <= resume_threshold and self.consumer.paused:
+                        logger.info(
+                            "Pool drained, resuming consumption",
+                            extra={"worker_name": self.worker_name, "pending_count": self._pending_count},
+                        )
+                        self.consumer.resume_all()
+
+                    # pause 이전에 fetch된 메시지는 pause 중에도 반환될 수 있음 (그대로 lane 적재)
+                    kafka_msg = self.consumer.poll(
+                        timeout_sec=_COMPLETION_CHECK_SEC if self._futures else None,
+                    )
+
+                    if kafka_msg is None:
+                        if not self._futures:
+                            idle_count += 1
+                            self._log_idle(idle_count)
+                        continue
+
+                    idle_count = 0
+                    self._dispatch(kafka_msg)
+
+                self._drain()
+
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._cleanup()
+
+    def _dispatch(self, kafka_msg) -> None:
+        """메시지 파싱 후 lane에 적재 (lane head면 즉시 pool 제출)"""
+        context: Optional[ProcessContext] = None
+
+        try:
+            with stage_timer("parse"):
+                decoded = self._parse_kafka_message(kafka_msg)
+                set_metric_source(decoded.source if decoded else None)
+            if decoded is None:
+                self._safe_commit(kafka_msg)
+                return
+
+            context = self._create_context(decoded)
+            jd_input = self._require_input(decoded)
+
+        except Exception as e:
+            self._complete_failure(e, context)
+            self._safe_commit(kafka_msg)
+            return
+
+        context.pipeline_stage = "PREPROCESS"
+        task = _PoolTask(
+            kafka_msg=kafka_msg,
+            lane_key=jd_input.request_id,
+            jd_input=jd_input,
+            context=context,
+        )
+        self._pending_count += 1
+
+        lane = self._lanes.get(task.lane_key)
+        if lane:
+            # 같은 requestId 선행 작업 진행 중: 완료 후 제출
+            lane.append(task)
+            return
+
+        self._lanes[task.lane_key] = deque([task])
+        self._submit(task)
+
+    def _submit(self, task: _PoolTask) -> None:
+        if (self._retry_task is not None or self._retry_queue) and task is not self._retry_task:
+            # 재시도 작업 단독 실행을 위해 보류
+            self._held.append(task)
+            return
+
+        task.submitted_at = time.monotonic()
+        task.generation = self._generation
+        try:
+            future = self._executor.submit(_execute_in_pool, task.jd_input)
+        except BrokenProcessPool as e:
+            self._handle_broken([task], e)
+            return
+
+        self._futures[future] = task
+
+    def _collect_completed(self, timeout_sec: float) -> None:
+        """완료된 작업 수거: 발행 → commit → 같은 lane 다음 작업 제출"""
+        if not self._futures:
+            return
+
+        done, _ = wait(list(self._futures), timeout=timeout_sec, return_when=FIRST_COMPLETED)
+
+        # pool 붕괴 작업 먼저 처리 (재생성 전에 다음 작업을 깨진 pool에 제출하지 않도록)
+        broken = [future for future in done if _is_broken(future)]
+        if broken:
+            self._handle_broken([self._futures.pop(future) for future in broken], broken[0].exception())
+
+        for future in done:
+            task = self._futures.pop(future, None)
+            if task is None:
+                continue
+            set_metric_source(task.context.source)
+            observe_stage("preprocess", time.monotonic() - task.submitted_at)
+
+            try:
+                self._complete_success(_unwrap_outcome(future.result()), task.context)
+            except Exception as e:
+                self._complete_failure(e, task.context)
+            finally:
+                self._finish(task)
+
+    def _finish(self, task: _PoolTask) -> None:
+        """작업 종료 기록: commit → 같은 lane 다음 작업 제출 (재시도 작업이면 다음 재시도 제출)"""
+        self._safe_commit(task.kafka_msg)
+        self._pending_count -= 1
+        if task is self._retry_task:
+            self._retry_task = None
+        self._advance_lane(task.lane_key)
+        self._submit_retry()
+
+    def _handle_broken(self, tasks: list, error: BaseException) -> None:
+        """
+        자식 프로세스 비정상 종료로 실패한 작업 처리
+
+        - 현재 pool에서 깨졌으면 재생성 (이전 세대 작업은 이미 재생성됨)
+        - 재제출 한도 내 작업은 lane head 그대로 재시도 큐로
+        - 한도를 넘긴 작업(재시도 중에도 pool을 깨뜨린 작업)만 fail 토픽
+        """
+        if any(task.generation == self._generation for task in tasks):
+            logger.error(
+                "Process pool broken, recreating",
+                extra={
+                    "worker_name": self.worker_name,
+                    "pool_size": self.pool_size,
+                    "affected_count": len(tasks),
+                },
+            )
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._create_executor()
+            self._generation += 1
+
+        exhausted = []
+        for task in tasks:
+            if task is self._retry_task:
+                self._retry_task = None
+            task.broken_count += 1
+            if task.broken_count > _BROKEN_POOL_RETRIES:
+                exhausted.append(task)
+            else:
+                self._retry_queue.append(task)
+
+        # 재시도 큐를 먼저 채운 뒤 종료 처리 (같은 lane 다음 작업이 재시도와 함께 실행되지 않도록)
+        for task in exhausted:
+            self._complete_failure(error, task.context)
+            self._finish(task)
+
+        self._submit_retry()
+
+    def _submit_retry(self) -> None:
+        """
+        재시도 작업 제출 (pool에 다른 작업이 없을 때 1개, 다시 깨지면 그 작업이 원인)
+
+        재시도가 모두 끝나면 보류된 lane head 제출
+        """
+        if self._retry_task is not None:
+            return
+        if not self._retry_queue:
+            while self._held and self._retry_task is None and not self._retry_queue:
+                self._submit(self._held.popleft())
+            return
+        if self._futures:
+            # 진행 중 작업(이전 pool에서 깨질 작업 포함)이 끝난 뒤 단독 실행
+            return
+
+        self._retry_task = self._retry_queue.popleft()
+        logger.warning(
+            "Resubmitting task after process pool failure",
+            extra={
+                "worker_name": self.worker_name,
+                "request_id": self._retry_task.context.request_id,
+                "broken_count": self._retry_task.broken_count,
+            },
+        )
+        self._submit(self._retry_task)
+
+    def _advance_lane(self, lane_key: str) -> None:
+        lane = self._lanes[lane_key]
+        lane.popleft()
+        if lane:
+            self._submit(lane[0])
+        else:
+            del self._lanes[lane_key]
+
+    def _drain(self) -> None:
+        """
+        shutdown 시 in-flight 작업 완료 대기
+
+        shutdown_timeout_sec 초과분은 commit하지 않는다. (재기동 후 재처리)
+        """
+        deadline = time.monotonic() + self.config.shutdown_timeout_sec
+
+        while self._futures:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    "Shutdown timeout, abandoning in-flight tasks",
+                    extra={"worker_name": self.worker_name, "pending_count": self._pending_count},
+                )
+                return
+            self._collect_completed(timeout_sec=remaining)
+
+
+def _is_broken(future: Future) -> bool:
+    return not future.cancelled() and isinstance(future.exception(), BrokenProcessPool)
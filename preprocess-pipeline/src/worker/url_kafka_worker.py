@@ -5,7 +5,6 @@ URL 소스 전용 Kafka Worker
 
 책임:
 - hirelog.outbox.JdPreprocessUrl 토픽 소비
-- 메시지 파싱
 - KafkaJdPreprocessUrlWorker.execute() 호출
 - 결과 DTO 반환
 
@@ -15,19 +14,14 @@ URL 소스 전용 Kafka Worker
 """
 
 import logging
-from typing import Any, Dict
 
 from infra.config.kafka_config import WorkerConfig
 from infra.kafka.kafka_consumer import KafkaStreamConsumer
 from infra.kafka.kafka_producer import KafkaStreamProducer
-from inputs.parse_kafka_jd_preprocess import (
-    parse_kafka_jd_preprocess_message,
-    MessageParseError,
-)
+from inputs.kafka_jd_preprocess_input import KafkaJdPreprocessInput
 from worker.base_kafka_worker import BaseKafkaWorker
 from preprocess.worker.kafka.kafka_jd_preprocess_url_worker import KafkaJdPreprocessUrlWorker
 from outputs.kafka_jd_preprocess_output import KafkaJdPreprocessOutput
-from common.exceptions import ProcessingError, ErrorCode
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +54,7 @@ class UrlKafkaWorker(BaseKafkaWorker):
         )
         self.jd_worker = KafkaJdPreprocessUrlWorker()
 
-    def process(self, message: Dict[str, Any]) -> KafkaJdPreprocessOutput:
+    def process(self, jd_input: KafkaJdPreprocessInput) -> KafkaJdPreprocessOutput:
         """
         메시지 처리
 
@@ -70,26 +64,10 @@ class UrlKafkaWorker(BaseKafkaWorker):
         Raises:
             ProcessingError: 처리 실패 시
         """
-        kafka_meta = message.get("_kafka_meta", {})
-        offset = kafka_meta.get("offset", "unknown")
-
-        # ==================================================
-        # 1. 메시지 파싱
-        # ==================================================
-        try:
-            jd_input = parse_kafka_jd_preprocess_message(message)
-        except MessageParseError as e:
-            raise ProcessingError(
-                error_code=ErrorCode.MSG_PARSE_002,
-                message=f"메시지 파싱 실패: {str(e)}",
-                cause=e,
-            )
-
         logger.debug(
             "Processing",
             extra={
                 "worker_name": self.worker_name,
-                "offset": offset,
                 "request_id": jd_input.request_id,
                 "brand_name": jd_input.brand_name,
                 "url": jd_input.url,
@@ -98,6 +76,6 @@ class UrlKafkaWorker(BaseKafkaWorker):
         )
 
         # ==================================================
-        # 2. 전처리 실행 (결과 DTO 반환)
+        # 전처리 실행 (결과 DTO 반환)
         # ==================================================
         return self.jd_worker.execute(jd_input)